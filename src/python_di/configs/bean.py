@@ -6,12 +6,14 @@ from typing import Optional
 import injector
 
 from python_di.configs.base_config import DiConfiguration
+from python_di.configs.constants import DiUtilConstants
 from python_di.configs.di_util import get_wrapped_fn
 from python_di.env.main_profile import DEFAULT_PROFILE
 from python_di.inject.context_factory.base_context_factory import CallableFactory
 from python_di.inject.context_factory.type_metadata.base_ty_metadata import HasFnArgs
 from python_di.inject.context_factory.context_factory_executor.metadata_factory import MetadataFactory
 from python_di.inject.context_factory.context_factory_executor.register_factory import retrieve_factory
+from python_di.inject.lazy_proxy import LazyProxy
 from python_di.inject.profile_composite_injector.inject_context_di import autowire_fn
 from python_util.logger.logger import LoggerFacade
 
@@ -114,12 +116,14 @@ def retrieve_callable_provider(v, wrapped, bean_arg: BeanArg) -> BeanFactoryProv
 
 def _create_bean_factory_factory(v, wrapped, bean_arg: BeanArg):
     return lambda config, profile_created: create_callable_provider_curry(
-        v, bean_arg.profile, wrapped, config
+        v, bean_arg.profile, wrapped, config, hasattr(v, DiUtilConstants.is_lazy.name)
     )
 
 
-def create_callable_provider_curry(v, profile, wrapped, config):
+def create_callable_provider_curry(v, profile, wrapped, config, is_lazy: bool = False):
     try:
+        if is_lazy:
+            return injector.CallableProvider(lambda: LazyProxy(lambda: get_value(v, profile, wrapped, config)))
         return injector.CallableProvider(lambda: get_value(v, profile, wrapped, config))
     except Exception as t:
         LoggerFacade.error(f"Received type error for {v.__class__.__name__}: {t}.")
@@ -1,3 +1,4 @@
+import fnmatch
 import importlib
 import os
 import typing
@@ -6,23 +7,30 @@ from python_util.logger.logger import LoggerFacade
 
 
 def component_scan(base_packages: list[str] = None,
-                   base_classes: typing.List[typing.Type] = None):
+                   base_classes: typing.List[typing.Type] = None,
+                   include: list[str] = None,
+                   exclude: list[str] = None):
     """
     :param base_packages:
     :param base_classes: To interpret and add to context - as component scan can be based on components interpreted.
+    :param include: globs of the files scanned in the sources, replacing the include globs of the ScannerProperties.
+    :param exclude: globs of the files and directories not scanned, added to the exclude globs of the ScannerProperties.
     :return:
     """
 
     def component_scan_decorator(cls):
         cls.component_scan = True
-        cls.sources = [i for i in create_sources(base_packages, base_classes)]
+        cls.source_include = include
+        cls.source_exclude = exclude
+        cls.sources = [i for i in create_sources(base_packages, base_classes, exclude)]
         return cls
 
     return component_scan_decorator
 
 
 def create_sources(base_packages: list[str] = None,
-                   base_classes: typing.List[typing.Type] = None) -> set[str]:
+                   base_classes: typing.List[typing.Type] = None,
+                   exclude: list[str] = None) -> set[str]:
     sources = set([])
     visited = set([])
     visited_cls = set([])
@@ -38,7 +46,7 @@ def create_sources(base_packages: list[str] = None,
             imported_mod = importlib.import_module(b)
             if hasattr(imported_mod, '__file__'):
                 directory_found = os.path.dirname(imported_mod.__file__)
-                add_source_recursive(directory_found, sources, visited)
+                add_source_recursive(directory_found, sources, visited, exclude)
             else:
                 LoggerFacade.error(f"{imported_mod} did not have file attribute")
         except Exception:
@@ -47,15 +55,16 @@ def create_sources(base_packages: list[str] = None,
     return sources
 
 
-def is_valid_dir(directory_found):
-    return '__pycache__' not in directory_found
+def is_valid_dir(directory_found, exclude: list[str] = None):
+    return ('__pycache__' not in directory_found
+            and not any([fnmatch.fnmatch(os.path.basename(directory_found), e) for e in exclude or []]))
 
 
-def add_source_recursive(directory_found, to_add, visited):
+def add_source_recursive(directory_found, to_add, visited, exclude: list[str] = None):
     if os.path.isdir(directory_found):
-        if is_valid_dir(directory_found):
+        if is_valid_dir(directory_found, exclude):
             to_add.add(directory_found)
             visited.add(directory_found)
             for sub_dir in os.listdir(directory_found):
                 LoggerFacade.debug_deferred(lambda: f"Adding {sub_dir} to component scan")
-                add_source_recursive(os.path.join(directory_found, sub_dir), to_add, visited)
+                add_source_recursive(os.path.join(directory_found, sub_dir), to_add, visited, exclude)
@@ -11,6 +11,8 @@ class DiUtilConstants(enum.Enum):
     wrapped = enum.auto()
     is_bean = enum.auto()
     is_lazy = enum.auto()
+    is_pre_reuse = enum.auto()
+    is_after_fork = enum.auto()
     class_configs = enum.auto()
     post_construct = enum.auto()
     type_id = enum.auto()
@@ -0,0 +1,21 @@
+import functools
+
+from python_di.configs.di_util import get_wrapped_fn
+
+
+def after_fork(fn):
+    """
+    Marks the function as a per-process hook, called with the bean in each worker process forked from a pre-warmed
+    context, so that the bean can re-create its sockets, thread pools, or other state that can't be shared.
+    :param fn:
+    :return:
+    """
+    fn, wrapped = get_wrapped_fn(fn)
+
+    @functools.wraps(fn)
+    def do_after_fork(*args, **kwargs):
+        return fn(*args, **kwargs)
+
+    do_after_fork.wrapped_fn = fn
+    fn.is_after_fork = True
+    return do_after_fork
@@ -1,4 +1,5 @@
 import dataclasses
+import functools
 import typing
 from typing import Optional
 
@@ -71,6 +72,23 @@ def prototype_factory(profile: typing.Optional[str] = None,
     return factory_wrapper
 
 
+def pre_reuse(fn):
+    """
+    Marks the function as a reset hook, called with the bean when a pooled prototype bean is returned to its pool.
+    :param fn:
+    :return:
+    """
+    fn, wrapped = get_wrapped_fn(fn)
+
+    @functools.wraps(fn)
+    def do_pre_reuse(*args, **kwargs):
+        return fn(*args, **kwargs)
+
+    do_pre_reuse.wrapped_fn = fn
+    fn.is_pre_reuse = True
+    return do_pre_reuse
+
+
 def retrieve_bean_scope_from_prototype(
         bean,
         profile: typing.Optional[str] = None
@@ -96,29 +114,57 @@ def prototype_scope_bean(profile: typing.Optional[str] = None,
 
             @classmethod
             def create(cls, bean_profile: typing.Optional[str] = None, **kwargs):
+                return next(cls.create_many(bean_profile, [kwargs]))
+
+            @classmethod
+            def create_many(cls, bean_profile: typing.Optional[str] = None,
+                            kwargs_iter: typing.Iterable[dict] = None):
+                """
+                Create a prototype bean for each of the kwargs provided. Dependencies that are not provided and are not
+                themselves prototype scoped are resolved once and shared across the created beans.
+                :param bean_profile: the profile to create the beans for.
+                :param kwargs_iter: the kwargs for each bean to create.
+                :return: generator of the created beans.
+                """
+                from python_di.inject.context_factory.context_factory_executor.register_factory import get_bean_dependency
                 wrapped_values = retrieve_wrapped_factory_fn(underlying)
                 assert wrapped_values is not None
                 wrapped_fn, wrapped_values = wrapped_values
-                cls.clean_kwargs(kwargs, wrapped_values)
-                bean_scopes, construct_values, prototype_decorator \
-                    = cls.get_bean_factory_data(kwargs, wrapped_fn, wrapped_values)
-
-                for to_get_key, to_get_value in wrapped_values.items():
-                    if to_get_key in construct_values.keys():
-                        continue
-
-                    bean_descr = cls.get_bean_descr(bean_scopes, to_get_key)
-                    bean_profile = cls.get_bean_profile(bean_descr, prototype_decorator, bean_profile)
-
-                    from python_di.inject.context_factory.context_factory_executor.register_factory import get_bean_dependency
-
-                    construct_values[to_get_key] = get_bean_dependency(
-                        to_get_value,
-                        bean_scope=cls.retrieve_bean_scope_item(bean_descr, prototype_decorator, bean_profile,
-                                                                to_get_value),
-                        profile=bean_profile,
-                    )
+                resolved_deps = {}
+
+                for kwargs in kwargs_iter if kwargs_iter is not None else [{}]:
+                    kwargs = dict(kwargs)
+                    to_resolve = dict(wrapped_values)
+                    cls.clean_kwargs(kwargs, to_resolve)
+                    bean_scopes, construct_values, prototype_decorator \
+                        = cls.get_bean_factory_data(kwargs, wrapped_fn, to_resolve)
+
+                    for to_get_key, to_get_value in to_resolve.items():
+                        if to_get_key in construct_values.keys():
+                            continue
+                        if to_get_key in resolved_deps.keys():
+                            construct_values[to_get_key] = resolved_deps[to_get_key]
+                            continue
+
+                        bean_descr = cls.get_bean_descr(bean_scopes, to_get_key)
+                        dep_profile = cls.get_bean_profile(bean_descr, prototype_decorator, bean_profile)
+                        dep_scope = cls.retrieve_bean_scope_item(bean_descr, prototype_decorator, dep_profile,
+                                                                 to_get_value)
+
+                        construct_values[to_get_key] = get_bean_dependency(
+                            to_get_value,
+                            bean_scope=dep_scope,
+                            profile=dep_profile,
+                        )
+
+                        # prototype dependencies are created for each bean.
+                        if not isinstance(dep_scope, PrototypeScopeDecorator):
+                            resolved_deps[to_get_key] = construct_values[to_get_key]
+
+                    yield cls.construct(wrapped_fn, construct_values)
 
+            @classmethod
+            def construct(cls, wrapped_fn, construct_values):
                 if prototype_self.__init__ == wrapped_fn:
                     return prototype_self(**construct_values)
                 else:
@@ -4,7 +4,6 @@ import os
 from typing import Optional
 
 import injector
-from dotenv import load_dotenv
 
 from python_util.logger.logger import LoggerFacade
 
@@ -34,6 +33,7 @@ def get_env_module(name: Optional[str] = None):
     property of the resources loaded from the environment module.
     :return:
     """
+    from dotenv import load_dotenv
     LoggerFacade.info(f"Loading env: {name}")
     if name is not None:
         if not load_dotenv(name):
@@ -0,0 +1,162 @@
+import dataclasses
+import importlib
+import json
+import os
+import typing
+
+from python_util.logger.logger import LoggerFacade
+
+MANIFEST_VERSION = 2
+MANIFEST_FILE_NAME = '.python_di_manifest.json'
+MANIFEST_PATH_ENV = 'PYTHON_DI_MANIFEST'
+
+
+@dataclasses.dataclass(init=True)
+class ManifestEntry:
+    module: str
+    source_file: str
+    symbol: str
+    decorator_id: str
+
+
+@dataclasses.dataclass(init=True)
+class ComponentManifest:
+    """
+    The modules and decorated symbols found by the ComponentScanner, written at build time so that the scan can be
+    skipped at boot. The manifest is fresh if the files discovered under the scanned sources, with the discovery
+    filter of the scan, are unchanged. The paths are held absolute, and written relative to the starting directory.
+    """
+    sources: list[str]
+    entries: list[ManifestEntry]
+    files: dict[str, int]
+    version: int = MANIFEST_VERSION
+    discovery: typing.Optional[dict] = None
+    starting: typing.Optional[str] = None
+
+    def covers(self, sources: typing.Iterable[str]) -> bool:
+        return all([any([s == m or s.startswith(m + os.sep) for m in self.sources]) for s in sources])
+
+    def is_fresh(self) -> bool:
+        if self.version != MANIFEST_VERSION:
+            return False
+        return retrieve_source_files(self.sources, discovery_filter(self.discovery)) == self.files
+
+    def retrieve_entries(self, sources: typing.Iterable[str], decorator_id: str) -> list[ManifestEntry]:
+        sources = [s for s in sources]
+        return [e for e in self.entries
+                if e.decorator_id == decorator_id
+                and any([e.source_file == s or e.source_file.startswith(s + os.sep) for s in sources])]
+
+    def retrieve_decorated(self, sources: typing.Iterable[str], decorator_id: str) -> list[typing.Type]:
+        decorated = []
+        for e in self.retrieve_entries(sources, decorator_id):
+            module_imported = importlib.import_module(e.module)
+            if e.symbol in module_imported.__dict__.keys():
+                decorated.append(module_imported.__dict__[e.symbol])
+            else:
+                LoggerFacade.error(f"Manifest entry {e.symbol} did not exist in {e.module}.")
+        return decorated
+
+    def write(self, path: str):
+        """
+        :param path: the manifest file. The paths are written relative to the starting directory, defaulting to the
+        directory of the manifest file.
+        """
+        starting_dir = self.starting if self.starting is not None else os.path.dirname(os.path.abspath(path))
+        with open(path, 'w') as manifest_file:
+            json.dump({
+                'sources': [os.path.relpath(s, starting_dir) for s in self.sources],
+                'entries': [dataclasses.asdict(dataclasses.replace(e, source_file=os.path.relpath(e.source_file,
+                                                                                                  starting_dir)))
+                            for e in self.entries],
+                'files': {os.path.relpath(f, starting_dir): m for f, m in self.files.items()},
+                'version': self.version,
+                'discovery': self.discovery
+            }, manifest_file, indent=2, sort_keys=True)
+
+    @classmethod
+    def read(cls, path: str, starting: typing.Optional[str] = None) -> typing.Optional['ComponentManifest']:
+        """
+        :param starting: the directory the paths were written relative to, defaulting to the directory of the manifest
+        file.
+        """
+        starting_dir = starting if starting is not None else os.path.dirname(os.path.abspath(path))
+        try:
+            with open(path, 'r') as manifest_file:
+                loaded = json.load(manifest_file)
+            if loaded['version'] != MANIFEST_VERSION:
+                LoggerFacade.warn(f"Component manifest {path} had version {loaded['version']}, expected "
+                                  f"{MANIFEST_VERSION}.")
+                return None
+            return ComponentManifest([_absolute(s, starting_dir) for s in loaded['sources']],
+                                     [dataclasses.replace(ManifestEntry(**e),
+                                                          source_file=_absolute(e['source_file'], starting_dir))
+                                      for e in loaded['entries']],
+                                     {_absolute(f, starting_dir): m for f, m in loaded['files'].items()},
+                                     loaded['version'], loaded['discovery'], starting_dir)
+        except Exception as e:
+            LoggerFacade.error(f"Failed to read component manifest {path}: {e}.")
+
+
+def _absolute(path: str, starting_dir: str) -> str:
+    return os.path.normpath(os.path.join(starting_dir, path))
+
+
+def discovery_properties(source_discovery_filter) -> dict:
+    """
+    :return: the SourceDiscoveryFilter as written to the manifest, so that freshness is checked against the files the
+    scan discovered.
+    """
+    return {'include': source_discovery_filter.include, 'exclude': source_discovery_filter.exclude,
+            'gitignore': source_discovery_filter.gitignore,
+            'follow_symlinks': source_discovery_filter.follow_symlinks}
+
+
+def discovery_filter(properties: typing.Optional[dict] = None):
+    """
+    :return: the SourceDiscoveryFilter of the properties, or the default filter.
+    """
+    from python_di.reflect_scanner.source_discovery import SourceDiscoveryFilter
+    if properties is None:
+        return SourceDiscoveryFilter()
+    return SourceDiscoveryFilter(properties['include'], properties['exclude'], properties['gitignore'],
+                                 properties['follow_symlinks'])
+
+
+def retrieve_source_files(sources: typing.Iterable[str], source_discovery_filter=None) -> dict[str, int]:
+    """
+    :param sources: directories or files.
+    :param source_discovery_filter: the SourceDiscoveryFilter of the files, defaulting to the python files not
+    excluded by default.
+    :return: the files discovered under the sources with their modification times.
+    """
+    from python_di.reflect_scanner.source_discovery import discover_files
+    source_discovery_filter = source_discovery_filter if source_discovery_filter is not None \
+        else discovery_filter()
+    return {f: os.stat(f).st_mtime_ns for f in discover_files(sources, source_discovery_filter)}
+
+
+def starting_directory(starting: str) -> str:
+    return starting if os.path.isdir(starting) else os.path.dirname(starting)
+
+
+def manifest_path(starting: typing.Optional[str]) -> typing.Optional[str]:
+    if MANIFEST_PATH_ENV in os.environ.keys():
+        return os.environ[MANIFEST_PATH_ENV]
+    if starting is None:
+        return None
+    return os.path.join(starting_directory(starting), MANIFEST_FILE_NAME)
+
+
+def load_fresh_manifest(starting: typing.Optional[str]) -> typing.Optional[ComponentManifest]:
+    path = manifest_path(starting)
+    if path is None or not os.path.exists(path):
+        return None
+    manifest = ComponentManifest.read(path, starting_directory(starting))
+    if manifest is None:
+        return None
+    if not manifest.is_fresh():
+        LoggerFacade.warn(f"Component manifest {path} was stale. Scanning sources.")
+        return None
+    LoggerFacade.info(f"Loaded component manifest {path}.")
+    return manifest
@@ -7,24 +7,149 @@ import injector
 
 import python_util.io_utils.file_dirs
 from python_di.configs.constants import ContextDecorators
+from python_di.inject.context_builder.component_manifest import ComponentManifest, ManifestEntry, \
+    load_fresh_manifest, retrieve_source_files, discovery_properties, starting_directory
 from python_di.inject.context_factory.base_context_factory import ContextFactory
 from python_di.inject.context_factory.context_factory_executor.context_factories_executor import InjectionContextArgs
 from python_di.inject.context_factory.context_factory_extractor.context_factory_extract import ContextFactoryExtract
-from python_di.reflect_scanner.graph_scanner import ModulesOfGraphScanner, DecoratorOfGraphScanner, \
-    DecoratorOfGraphScannerArgs, ModulesOfNodesArgs, ModulesOfGraphScannerResult
-from python_di.reflect_scanner.module_graph_models import GraphType, ProgramNode
+from python_di.reflection.module_name_index import ModuleNameIndex
 from python_util.logger.logger import LoggerFacade
 
+RELEASE_SCAN_STATE_ENV = 'PYTHON_DI_RELEASE_SCAN_STATE'
 
-class ComponentScanner:
 
-    @injector.inject
-    def __init__(self, context_factory_extract: typing.List[ContextFactoryExtract],
-                 module_scanner: ModulesOfGraphScanner,
-                 decorator_scanner: DecoratorOfGraphScanner):
+def release_scan_state_enabled() -> bool:
+    """
+    :return: whether the scan state is released after the context is built, unless PYTHON_DI_RELEASE_SCAN_STATE is
+    set to false, such as in tests that inspect the program graph afterwards.
+    """
+    return os.environ.get(RELEASE_SCAN_STATE_ENV, 'true').lower() not in ['false', '0', 'no']
+
+
+def decorator_ids() -> list[str]:
+    return ['component_scan', *ContextDecorators.context_ids()]
+
+
+def _in_sources(source_file: str, sources: typing.Collection[str]) -> bool:
+    return any([source_file == s or source_file.startswith(s.rstrip(os.sep) + os.sep) for s in sources])
+
+
+class ProgramGraphSession:
+    """
+    The program graph of the sources scanned while building a context. The sources are parsed once, the files of
+    sources added by component scans are parsed and connected incrementally, and the nodes decorated by each of the
+    decorator ids are retrieved in one pass over the graph after each change. The sources are parsed with the
+    component-scan profile unless PYTHON_DI_SCAN_PROFILE overrides it.
+    """
+
+    def __init__(self, env, decorator_scanner, module_scanner,
+                 source_filters: typing.Optional[dict[str, typing.Tuple[typing.Optional[list[str]],
+                                                                         typing.Optional[list[str]]]]] = None):
+        """
+        :param source_filters: the include and exclude globs of the sources added by component scans.
+        """
+        from python_di.reflect_scanner.program_parser import ProgramParser, ListBasedSourceFileProvider
+        from python_di.reflect_scanner.scan_profile import component_scan_profile
+        from python_di.reflect_scanner.source_discovery import SourceDiscoveryFilter
+        self.env = env
         self.decorator_scanner = decorator_scanner
         self.module_scanner = module_scanner
+        self.source_filters = source_filters if source_filters is not None else {}
+        self.parser: ProgramParser = env.get_interface(ProgramParser, scope=injector.noscope)
+        self.discovery_filter = SourceDiscoveryFilter.from_properties(self.parser.scanner_properties)
+        self.source_file_provider = ListBasedSourceFileProvider([], self.discovery_filter)
+        self.parser.set_source_file_provider(self.source_file_provider)
+        self.parser.set_scan_profile(component_scan_profile())
+        self.sources: set[str] = set([])
+        self._decorated: typing.Optional[dict[str, list[typing.Tuple]]] = None
+
+    @property
+    def program_graph(self):
+        return self.parser.program_graph
+
+    def extend(self, sources: typing.Iterable[str]):
+        new_sources = sorted([s for s in sources if s not in self.sources])
+        if len(new_sources) != 0:
+            self.sources.update(new_sources)
+            for s in new_sources:
+                include, exclude = self.source_filters.get(s, (None, None))
+                self.source_file_provider.add_sources(
+                    [s], self.discovery_filter.extend(include, exclude) if s in self.source_filters.keys() else None)
+            self.parser.do_parse()
+            self._decorated = None
+
+    def retrieve_decorated(self, decorator_id: str, sources: typing.Collection[str]) -> list[typing.Tuple]:
+        """
+        :return: the (module, node) pairs of the nodes decorated by decorator_id in the sources.
+        """
+        self.extend(sources)
+        if self._decorated is None or decorator_id not in self._decorated.keys():
+            self._decorated = self._scan_decorated({*decorator_ids(), decorator_id})
+        return [(module_node, node) for module_node, node in self._decorated[decorator_id]
+                if module_node is not None and _in_sources(module_node.source_file, sources)]
+
+    def _scan_decorated(self, ids: set[str]) -> dict[str, list[typing.Tuple]]:
+        from python_di.reflect_scanner.graph_scanner import DecoratorsOfGraphScannerArgs, ModulesOfNodesArgs
+        from python_di.reflect_scanner.module_graph_models import GraphType
+        decorated = self.decorator_scanner.do_scan(DecoratorsOfGraphScannerArgs(ids, self.program_graph,
+                                                                                GraphType.Program))
+        return {
+            decorator_id: list(self.module_scanner.do_scan(ModulesOfNodesArgs(self.program_graph, GraphType.Program,
+                                                                              nodes)).nodes)
+            for decorator_id, nodes in decorated.nodes.items()
+        }
+
+
+class ComponentScanner:
+    """
+    The reflect_scanner (and networkx) is imported and bound only when a scan is performed, so that contexts that do
+    not scan do not pay for it. The program graph is parsed once per scan session, started by begin_scan_session.
+    """
+
+    @injector.inject
+    def __init__(self, context_factory_extract: typing.List[ContextFactoryExtract]):
+        self.decorator_scanner = None
+        self.module_scanner = None
         self.context_factory_extract = context_factory_extract
+        self._manifests: dict[typing.Optional[str], typing.Optional[ComponentManifest]] = {}
+        self._session: typing.Optional[ProgramGraphSession] = None
+        self._module_name_indexes: dict[typing.Tuple, ModuleNameIndex] = {}
+        self._source_filters: dict[str, typing.Tuple[typing.Optional[list[str]], typing.Optional[list[str]]]] = {}
+
+    def _retrieve_scanners(self, env):
+        if self.decorator_scanner is None or self.module_scanner is None:
+            from python_di.reflect_scanner.graph_scanner import ModulesOfGraphScanner, DecoratorsOfGraphScanner
+            # the scanner context is a lazy env factory, bound on the first scan.
+            env.initialize_injector_factories()
+            self.decorator_scanner = env.get_interface(DecoratorsOfGraphScanner, scope=injector.singleton)
+            self.module_scanner = env.get_interface(ModulesOfGraphScanner, scope=injector.singleton)
+        return self.decorator_scanner, self.module_scanner
+
+    def begin_scan_session(self):
+        """
+        Start a new program graph session, so that sources are parsed again on the next scan.
+        """
+        self._session = None
+
+    def end_scan_session(self):
+        self._session = None
+
+    def release_scan_state(self):
+        """
+        Release the program graphs and the indexes built while scanning, keeping only the factories scanned. They are
+        parsed again if a later component scan or rebuild needs them.
+        """
+        self._session = None
+        self._module_name_indexes.clear()
+        if 'python_di.reflect_scanner.program_parser' in sys.modules.keys():
+            from python_di.reflect_scanner.program_parser import release_scan_state
+            release_scan_state()
+
+    def _retrieve_session(self, env) -> ProgramGraphSession:
+        if self._session is None or self._session.env is not env:
+            decorator_scanner, module_scanner = self._retrieve_scanners(env)
+            self._session = ProgramGraphSession(env, decorator_scanner, module_scanner, self._source_filters)
+        return self._session
 
     def produce_sources(self, inject_context_args: InjectionContextArgs) -> set[str]:
         from python_di.inject.context_builder.injection_context import InjectionContextInjectorContextArgs
@@ -49,6 +174,8 @@ class ComponentScanner:
             for source_to_add in s.sources:
                 if source_to_add not in out_sources:
                     out_sources.add(source_to_add)
+                    if getattr(s, 'source_include', None) is not None or getattr(s, 'source_exclude', None) is not None:
+                        self._source_filters[source_to_add] = (s.source_include, s.source_exclude)
                     for n_s in self._retrieve_decorated(InjectionContextInjectorContextArgs(
                             inject_context_args.injection_context_injector,
                             {source_to_add},
@@ -81,19 +208,52 @@ class ComponentScanner:
         assert isinstance(args, InjectionContextInjectorContextArgs)
         return args.sources
 
+    def build_manifest(self, inject_context_args: InjectionContextArgs) -> ComponentManifest:
+        """
+        Scan the sources, and the sources added by component scans, for all decorated symbols.
+        :param inject_context_args:
+        :return: the manifest to be read at boot instead of scanning.
+        """
+        from python_di.inject.context_builder.injection_context import InjectionContextInjectorContextArgs
+        assert isinstance(inject_context_args, InjectionContextInjectorContextArgs)
+        self._manifests[inject_context_args.starting] = None
+        self.begin_scan_session()
+        try:
+            sources = set(inject_context_args.sources)
+            sources.update(self.produce_sources(inject_context_args))
+            args = InjectionContextInjectorContextArgs(inject_context_args.injection_context_injector, sources,
+                                                       inject_context_args.starting)
+            entries = []
+            for decorator_id in decorator_ids():
+                for module_name, source_file, symbol, _ in self._scan_decorated(args, decorator_id):
+                    entries.append(ManifestEntry(module_name, source_file, symbol, decorator_id))
+            source_discovery_filter = self._retrieve_session(args.injection_context_injector).discovery_filter
+        finally:
+            self.end_scan_session()
+        return ComponentManifest(sorted(sources), entries, retrieve_source_files(sources, source_discovery_filter),
+                                 discovery=discovery_properties(source_discovery_filter),
+                                 starting=starting_directory(inject_context_args.starting))
+
+    def _retrieve_manifest(self, args) -> typing.Optional[ComponentManifest]:
+        if args.starting not in self._manifests.keys():
+            self._manifests[args.starting] = load_fresh_manifest(args.starting)
+        return self._manifests[args.starting]
+
     def _retrieve_decorated(self, args: InjectionContextArgs, decorator_id: str) -> list[typing.Type]:
         from python_di.inject.context_builder.injection_context import InjectionContextInjectorContextArgs
         assert isinstance(args, InjectionContextInjectorContextArgs)
-        env = args.injection_context_injector
-        source = args.sources
-        configs = []
+        manifest = self._retrieve_manifest(args)
+        if manifest is not None and manifest.covers(args.sources):
+            return manifest.retrieve_decorated(args.sources, decorator_id)
 
-        program_graph = self._parse_program(env, source)
+        return [value for _, _, _, value in self._scan_decorated(args, decorator_id)]
 
-        decorated = self.decorator_scanner.do_scan(DecoratorOfGraphScannerArgs(decorator_id, program_graph,
-                                                                               GraphType.Program))
-        with_module = self.module_scanner.do_scan(ModulesOfNodesArgs(program_graph, GraphType.Program,
-                                                                     decorated.nodes))
+    def _scan_decorated(self, args: InjectionContextArgs, decorator_id: str) \
+            -> typing.Iterator[typing.Tuple[str, str, str, typing.Type]]:
+        from python_di.reflect_scanner.graph_scanner import ModulesOfGraphScannerResult
+        from python_di.reflect_scanner.module_graph_models import ProgramNode
+        session = self._retrieve_session(args.injection_context_injector)
+        with_module = ModulesOfGraphScannerResult(session.retrieve_decorated(decorator_id, args.sources))
 
         nodes_grouped = self.group_by_module(with_module)
         for module_scanned, node_scanned in nodes_grouped.items():
@@ -101,25 +261,16 @@ class ComponentScanner:
             id_value = module_scanned.id_value
             if id_value is not None:
                 node_scanned: list[ProgramNode] = node_scanned
-                next_config = self._import_module(args, decorator_id, id_value, module_scanned, node_scanned)
+                module_name, next_config = self._import_module(args, decorator_id, id_value, module_scanned,
+                                                               node_scanned)
                 LoggerFacade.debug(f"Imported {next_config}")
-                configs.extend(next_config)
+                for symbol, value in next_config:
+                    yield module_name, module_scanned.source_file, symbol, value
             else:
                 LoggerFacade.error(f"Could not parse module: {id_value} from {module_scanned} and {node_scanned}.")
 
-        return configs
-
-    @staticmethod
-    def _parse_program(env, source):
-        from python_di.reflect_scanner.program_parser import ProgramParser, ListBasedSourceFileProvider
-        next_file_parser: ProgramParser = env.get_interface(ProgramParser, scope=injector.noscope)
-        source_file_provider = ListBasedSourceFileProvider([i for i in source])
-        next_file_parser.set_source_file_provider(source_file_provider)
-        next_file_parser.do_parse()
-        return next_file_parser.program_graph
-
     @classmethod
-    def group_by_module(cls, module_nodes: ModulesOfGraphScannerResult):
+    def group_by_module(cls, module_nodes):
         out_nodes = {}
         for (module_scanned, node_scanned) in module_nodes.nodes:
             if module_scanned in out_nodes:
@@ -129,22 +280,39 @@ class ComponentScanner:
 
         return out_nodes
 
-    @classmethod
-    def _import_module(cls, args, decorator_id, id_value, module_scanned, node_scanned: list[ProgramNode]):
+    def _import_module(self, args, decorator_id, id_value, module_scanned, node_scanned: list):
         try:
-            module_imported, next_id_value = cls._try_introspect_import(args, id_value, module_scanned)
+            module_imported, next_id_value = self._try_introspect_import(args, id_value, module_scanned)
         except Exception as exc:
             LoggerFacade.raise_exc(f"{id_value} failed from {args.sources} for {decorator_id}", exc)
 
-        return [module_imported.__dict__[n.id_value] for n in node_scanned
-                if n.id_value in module_imported.__dict__.keys()]
+        return next_id_value, [(n.id_value, module_imported.__dict__[n.id_value]) for n in node_scanned
+                               if n.id_value in module_imported.__dict__.keys()]
 
-    @classmethod
-    def _try_introspect_import(cls, args, id_value, module_scanned):
+    def _retrieve_module_name_index(self, args) -> ModuleNameIndex:
+        """
+        The index of the source roots, starting and sys.path, built once for each set of roots.
+        """
+        key = (tuple(sorted(args.sources)), args.starting, tuple(sys.path))
+        if key not in self._module_name_indexes.keys():
+            self._module_name_indexes[key] = ModuleNameIndex([*args.sources, args.starting, *sys.path])
+        return self._module_name_indexes[key]
+
+    def _try_introspect_import(self, args, id_value, module_scanned):
         assert args.starting is not None, \
             f"Could not import {id_value} - module does not exist with that name."
+        module_name = self._retrieve_module_name_index(args).module_name(module_scanned.source_file)
+        if module_name is not None:
+            try:
+                return importlib.import_module(module_name), module_name
+            except Exception as e:
+                LoggerFacade.warn(f"Failed to import {module_scanned.source_file} as {module_name}: {e}. "
+                                  f"Trying the module names relative to each source.")
+
         last_exc = None
-        for n in cls._parse_module_id(args, module_scanned):
+        for n in self._parse_module_id(args, module_scanned):
+            if n == module_name:
+                continue
             if n is not None:
                 try:
                     module_imported = importlib.import_module(n)
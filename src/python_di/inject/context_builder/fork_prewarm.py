@@ -0,0 +1,227 @@
+import asyncio
+import gc
+import os
+import sys
+import threading
+import typing
+
+import injector
+
+from python_di.configs.constants import DiUtilConstants
+from python_di.env.main_profile import DEFAULT_PROFILE
+from python_util.logger.logger import LoggerFacade
+
+fork_lock = threading.RLock()
+
+_fork_locks: list[typing.Tuple[str, str]] = [
+    ('injector', 'lock'),
+    ('python_di.env.profile_config_props', 'injector_lock'),
+    ('python_di.configs.autowire', 'registration_lock'),
+    ('python_di.inject.injector_provider', 'injector_lock'),
+    ('python_di.inject.injector_provider', 'profile_locks'),
+    ('python_di.inject.prioritized_injectors', 'config_ty_locks'),
+    ('python_di.inject.prioritized_injectors', 'profile_locks'),
+    ('python_di.inject.prioritized_injectors', 'synchronized_lock'),
+    ('python_di.inject.context_builder.inject_ctx', 'set_injection_ctx_lock'),
+    ('python_di.inject.context_builder.injection_context', 'injector_lock'),
+    ('python_di.inject.profile_composite_injector.scopes.prototype_scope', 'prototype_scope_lock'),
+    ('python_di.inject.profile_composite_injector.scopes.composite_scope', 'lock'),
+    ('python_di.inject.profile_composite_injector.scopes.pooled_scope', 'pooled_scope_lock'),
+    (__name__, 'fork_lock'),
+]
+
+_per_process_beans: list = []
+_after_fork_callbacks: list[typing.Callable[[], None]] = []
+_prewarmed: list = []
+_did_register_at_fork = False
+
+
+def retrieve_after_fork_hooks(ty: type) -> list[typing.Callable]:
+    """
+    :param ty: the bean type.
+    :return: the functions decorated with @after_fork for the type, in mro order.
+    """
+    hooks = []
+    for base in reversed(ty.__mro__):
+        for k, v in base.__dict__.items():
+            fn = getattr(v, DiUtilConstants.wrapped_fn.name, v)
+            if getattr(fn, DiUtilConstants.is_after_fork.name, False) and v not in hooks:
+                hooks.append(v)
+    return hooks
+
+
+@injector.synchronized(fork_lock)
+def register_per_process(bean):
+    """
+    Register a bean created outside of prewarm, so that its @after_fork hooks are called in forked workers.
+    :param bean:
+    :return:
+    """
+    if len(retrieve_after_fork_hooks(type(bean))) == 0:
+        raise ValueError(f"{type(bean)} did not have any @after_fork hooks.")
+    if all([b is not bean for b in _per_process_beans]):
+        _per_process_beans.append(bean)
+
+
+@injector.synchronized(fork_lock)
+def register_after_fork(callback: typing.Callable[[], None]):
+    """
+    :param callback: called in each forked worker after the context state has been reset.
+    :return:
+    """
+    _after_fork_callbacks.append(callback)
+    _register_at_fork()
+
+
+def warm(inject_ctx) -> list:
+    """
+    Instantiate the eager singletons, and the profile scoped beans of the default profile, of a built context.
+    :param inject_ctx: the InjectionContext after build_context.
+    :return: the instances created.
+    """
+    from python_di.inject.context_factory.type_metadata.inject_ty_metadata import BeanComponentFactory, \
+        ComponentFactory, ComponentSelfFactory
+    from python_di.inject.profile_composite_injector.composite_injector import profile_scope
+    if inject_ctx.factories is None:
+        raise ValueError("Context must be built before it is pre-warmed.")
+    instances = []
+    for f in inject_ctx.factories:
+        for m in f.inject_types:
+            if (not isinstance(m, BeanComponentFactory | ComponentFactory | ComponentSelfFactory)
+                    or (m.scope not in [None, injector.singleton]
+                        and not (m.scope == profile_scope and m.profile in [None, DEFAULT_PROFILE]))
+                    or getattr(m, DiUtilConstants.is_lazy.name, False)):
+                continue
+            try:
+                instance = inject_ctx.ctx.get_interface(m.ty_to_inject,
+                                                        profile=m.profile if isinstance(m.profile, str) else None)
+            except Exception as e:
+                LoggerFacade.error(f"Failed to pre-warm {m.ty_to_inject}: {e}.")
+                continue
+            if instance is not None and all([i is not instance for i in instances]):
+                instances.append(instance)
+    return instances
+
+
+@injector.synchronized(fork_lock)
+def prewarm(inject_ctx, freeze: bool = True) -> list:
+    """
+    Pre-warm a built context in the parent of a pre-fork server, so that workers inherit the container copy-on-write
+    instead of booting their own. The context locks and events are reset in each forked worker, and the @after_fork
+    hooks of the created beans are called there.
+    :param inject_ctx: the InjectionContext after build_context.
+    :param freeze: move the objects created so far to the permanent generation, so that the garbage collector does not
+    write to their pages in the workers.
+    :return: the instances created.
+    """
+    instances = warm(inject_ctx)
+    for i in instances:
+        if len(retrieve_after_fork_hooks(type(i))) != 0 and all([b is not i for b in _per_process_beans]):
+            _per_process_beans.append(i)
+    if all([c is not inject_ctx for c in _prewarmed]):
+        _prewarmed.append(inject_ctx)
+    _register_at_fork()
+    if freeze:
+        gc.collect()
+        gc.freeze()
+    LoggerFacade.info(f"Pre-warmed {len(instances)} singletons, {len(_per_process_beans)} with after fork hooks.")
+    return instances
+
+
+def reset_after_fork():
+    """
+    Called in the forked worker. Locks held by other threads of the parent at fork are never released in the
+    worker, so they are re-initialized, and the asyncio events are detached from the parent's loop.
+    """
+    for module_name, attr in _fork_locks:
+        module = sys.modules.get(module_name)
+        if module is not None and hasattr(module, attr):
+            _reinit_lock(getattr(module, attr))
+
+    for inject_ctx in _prewarmed:
+        _reset_context(inject_ctx.ctx)
+
+    _reset_scopes()
+
+    for bean in _per_process_beans:
+        for hook in retrieve_after_fork_hooks(type(bean)):
+            try:
+                hook(bean)
+            except Exception as e:
+                LoggerFacade.error(f"After fork hook {hook} failed for {type(bean)}: {e}.")
+
+    for callback in _after_fork_callbacks:
+        try:
+            callback()
+        except Exception as e:
+            LoggerFacade.error(f"After fork callback {callback} failed: {e}.")
+
+
+def _register_at_fork():
+    global _did_register_at_fork
+    if not _did_register_at_fork and hasattr(os, 'register_at_fork'):
+        os.register_at_fork(after_in_child=reset_after_fork)
+        _did_register_at_fork = True
+
+
+def _reset_context(ctx):
+    if ctx is None:
+        return
+    _reset_events(ctx)
+    if ctx.environment is not None:
+        _reset_events(ctx.environment)
+    if ctx.injectors_dictionary is not None:
+        for field in ctx.injectors_dictionary.injectors.values():
+            _reset_events(field)
+            for i in [*field.injectors, field.collapsed, field.profile_injector]:
+                if i is not None:
+                    _reset_events(i)
+
+
+def _reset_scopes():
+    request_scope_module = sys.modules.get('python_di.inject.profile_composite_injector.scopes.request_scope')
+    if request_scope_module is not None:
+        request_scope_module._task_contexts.clear()
+    pooled_scope_module = sys.modules.get('python_di.inject.profile_composite_injector.scopes.pooled_scope')
+    if pooled_scope_module is not None:
+        for decorator in [pooled_scope_module.pooled_scope, *pooled_scope_module.pooled_scope_decorators.values()]:
+            for pool in decorator._pools.values():
+                _reinit_lock(pool._lock)
+                pool.clear()
+
+
+def _reset_events(value):
+    for v in vars(value).values():
+        if isinstance(v, asyncio.Event):
+            _reset_event(v)
+        elif isinstance(v, dict):
+            for e in v.values():
+                if isinstance(e, asyncio.Event):
+                    _reset_event(e)
+
+
+def _reset_event(event: asyncio.Event):
+    """
+    Keeps whether the event is set, but drops the waiters and loop of the parent process.
+    """
+    if hasattr(event, '_waiters'):
+        event._waiters.clear()
+    if hasattr(event, '_loop'):
+        event._loop = None
+
+
+def _reinit_lock(value, depth: int = 0):
+    if hasattr(value, '_at_fork_reinit'):
+        value._at_fork_reinit()
+    elif depth > 2:
+        return
+    elif isinstance(value, dict):
+        for v in value.values():
+            _reinit_lock(v, depth + 1)
+    elif isinstance(value, list | tuple | set):
+        for v in value:
+            _reinit_lock(v, depth + 1)
+    elif hasattr(value, '__dict__'):
+        # lock striping holds its locks in its attributes.
+        for v in vars(value).values():
+            _reinit_lock(v, depth + 1)
@@ -1,4 +1,5 @@
 import dataclasses
+import os
 import threading
 import typing
 from typing import Optional
@@ -29,6 +30,8 @@ class InjectionContextInjectorContextArgs(InjectionContextArgs):
 
 class InjectionContext:
     ctx: typing.Optional[InjectionContextInjector] = None
+    factories: typing.Optional[list] = None
+    ctx_args: typing.Optional[InjectionContextInjectorContextArgs] = None
 
     @classmethod
     @injector.synchronized(injector_lock)
@@ -77,7 +80,64 @@ class InjectionContext:
 
         ctx_args = InjectionContextInjectorContextArgs(self.ctx, parent_sources, source_directory)
         factories = context_builder.build_context(ctx_args)
+        self.factories = factories
+        self.ctx_args = ctx_args
 
+        self.organize_composite_scope(self._collapse_injectors())
+
+        context_builder.do_lifecycle_hooks(factories, ctx_args)
+
+    @injector.synchronized(injector_lock)
+    def generate_wiring(self, path: Optional[str] = None) -> str:
+        """
+        Write a module that registers the components of the built context without scanning, to be booted using
+        boot_from_wiring.
+        :param path: defaults to codegen/python_di_wiring.py in the source directory.
+        :return: the path written.
+        """
+        from python_di.inject.context_builder.static_wiring import StaticWiringGenerator, wiring_path
+        if self.factories is None:
+            raise ValueError("Context must be built before generating the wiring.")
+        if path is None:
+            path = wiring_path(self.ctx_args.starting)
+        context_builder: InjectionContextBuilder \
+            = self.ctx.get_interface(InjectionContextBuilder, scope=injector.singleton)
+        StaticWiringGenerator(self.ctx, self.ctx_args.sources, context_builder.scanned_factories) \
+            .write(self.factories, self.ctx_args, path)
+        return path
+
+    @injector.synchronized(injector_lock)
+    def boot_from_wiring(self, wiring: typing.Union[str, typing.Any]) -> bool:
+        """
+        Build the context from a module written by generate_wiring.
+        :param wiring: the path of the generated module or the module.
+        :return: False if the module did not exist or was stale, in which case build_context should be used.
+        """
+        from python_di.inject.context_builder.static_wiring import load_wiring_module, is_fresh
+        from python_util.logger.logger import LoggerFacade
+        if isinstance(wiring, str):
+            if not os.path.exists(wiring):
+                return False
+            wiring = load_wiring_module(wiring)
+        if not is_fresh(wiring):
+            LoggerFacade.warn(f"Static wiring {wiring.__name__} was stale. Context must be built by scanning.")
+            return False
+
+        wiring.wire(self.ctx)
+        self.organize_composite_scope(self._collapse_injectors())
+        wiring.lifecycle(self.ctx)
+        return True
+
+    def prewarm(self, freeze: bool = True) -> list:
+        """
+        Instantiate the singletons of the built context before forking workers.
+        :param freeze: call gc.freeze after the singletons are created.
+        :return: the singletons created.
+        """
+        from python_di.inject.context_builder.fork_prewarm import prewarm
+        return prewarm(self, freeze)
+
+    def _collapse_injectors(self) -> CompositeScope:
         composite_scope = None
         for b in self.ctx.injectors_dictionary.injectors.values():
             b.collapse_injectors()
@@ -85,10 +145,7 @@ class InjectionContext:
                 assert composite_scope == b.composite_scope
             else:
                 composite_scope = b.composite_scope
-
-        self.organize_composite_scope(composite_scope)
-
-        context_builder.do_lifecycle_hooks(factories, ctx_args)
+        return composite_scope
 
     @staticmethod
     def organize_composite_scope(composite_scope: CompositeScope):
@@ -2,7 +2,7 @@ import typing
 
 import injector
 
-from python_di.inject.context_builder.component_scanner import ComponentScanner
+from python_di.inject.context_builder.component_scanner import ComponentScanner, release_scan_state_enabled
 from python_di.inject.context_factory.context_factory_editor.base_merge_context_factory import \
     MergedContextFactoriesEditor
 from python_di.inject.context_factory.context_factory_executor.context_factories_executor import InjectionContextArgs, \
@@ -28,13 +28,21 @@ class InjectionContextBuilder:
         self.context_factories_executor = context_factories_executor
         self.context_factory_extract = context_factory_extract
         self.context_factories = list(sorted(context_factories, key=lambda c: c.ordering()))
+        self.scanned_factories = []
 
     def build_context(self, inject_context_args: InjectionContextArgs):
         from python_di.inject.context_builder.injection_context import InjectionContextInjectorContextArgs
         assert isinstance(inject_context_args, InjectionContextInjectorContextArgs)
-        self.build_sources(inject_context_args)
-
-        factories_found = self.component_scanner.scan_context_factories(inject_context_args)
+        self.component_scanner.begin_scan_session()
+        try:
+            self.build_sources(inject_context_args)
+            factories_found = self.component_scanner.scan_context_factories(inject_context_args)
+        finally:
+            self.component_scanner.end_scan_session()
+            if release_scan_state_enabled():
+                self.component_scanner.release_scan_state()
+
+        self.scanned_factories = [f for f in factories_found]
         factories_found = self._organize_factories(factories_found)
 
         self._register_context(factories_found, inject_context_args)
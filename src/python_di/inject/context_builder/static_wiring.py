@@ -0,0 +1,317 @@
+import importlib.util
+import os
+import typing
+
+import injector
+
+from python_di.env.profile import Profile
+from python_di.inject.context_builder.component_manifest import retrieve_source_files
+from python_di.inject.context_factory.base_context_factory import ContextFactory
+from python_di.inject.context_factory.context_factory import ConfigurationFactory, PrototypeComponentFactory
+from python_di.inject.context_factory.context_factory_executor.context_factories_executor import register_factory
+from python_di.inject.context_factory.context_factory_executor.register_factory import do_call, \
+    _do_multibind_curry
+from python_di.inject.context_factory.type_metadata.base_ty_metadata import InjectTypeMetadata
+from python_di.inject.context_factory.type_metadata.inject_ty_metadata import BeanComponentFactory, \
+    ComponentSelfFactory, MultibindTypeMetadata, ConfigurationPropertiesInjectTypeMetadata, \
+    LifecycleInjectTypeMetadata
+from python_di.inject.profile_composite_injector.scopes.pooled_scope import PooledScopeDecorator
+from python_di.inject.profile_composite_injector.scopes.prototype_scope import PrototypeScopeDecorator
+from python_util.logger.logger import LoggerFacade
+
+WIRING_MODULE_NAME = 'python_di_wiring'
+
+_lifecycle_factory_attrs = ['pre_construct_factory', 'autowire_factory', 'post_construct_factory']
+
+
+class StaticWiringException(Exception):
+    pass
+
+
+def _split_for_profile(inject_type: InjectTypeMetadata, profile: typing.Optional[str]) -> InjectTypeMetadata:
+    if profile is None or isinstance(inject_type.profile, str | None):
+        return inject_type
+    for split in inject_type.split_for_profiles():
+        if split.profile == profile:
+            return split
+    raise StaticWiringException(f"{inject_type} did not contain profile {profile}.")
+
+
+def bean_provider(configuration: typing.Type, factory_idx: int, inject_ty_idx: int):
+    """
+    :return: the provider of the bean at the index of the configuration's factory.
+    """
+    return configuration.context_factory[factory_idx].inject_types[inject_ty_idx].to_call
+
+
+def self_factory_provider(component: typing.Type, factory_idx: int, inject_ty_idx: int,
+                          profile: typing.Optional[str]):
+    f = _split_for_profile(component.context_factory[factory_idx].inject_types[inject_ty_idx], profile)
+    return lambda: do_call(f, component)
+
+
+def multibind_provider(scope, profile, bindings: list[typing.Type]) -> typing.Callable:
+    """
+    :return: the provider of the list of the bindings, retrieved in the scope and profile.
+    """
+    return _do_multibind_curry(scope, profile, bindings)
+
+
+def lifecycle_hook(injectable: typing.Type, hook: str, factory_idx: int,
+                   profile: typing.Optional[str]) -> LifecycleInjectTypeMetadata:
+    lifecycle_factory = getattr(injectable.context_factory_provider, hook)[factory_idx]
+    return _split_for_profile(lifecycle_factory.inject_types[0], profile)
+
+
+def is_fresh(wiring_module) -> bool:
+    return retrieve_source_files(wiring_module.SOURCES) == wiring_module.FILES
+
+
+def load_wiring_module(path: str):
+    spec = importlib.util.spec_from_file_location(WIRING_MODULE_NAME, path)
+    wiring_module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(wiring_module)
+    return wiring_module
+
+
+def wiring_path(starting: str) -> str:
+    starting_dir = starting if os.path.isdir(starting) else os.path.dirname(starting)
+    return os.path.join(starting_dir, 'codegen', f'{WIRING_MODULE_NAME}.py')
+
+
+class _RecordingCtx:
+    """
+    Records the registrations made by register_factory, delegating the retrievals to the context.
+    """
+
+    def __init__(self, ctx):
+        self.ctx = ctx
+        self.calls: list[typing.Tuple[str, tuple, dict]] = []
+
+    def register_component(self, *args, **kwargs):
+        self.calls.append(('register_component', args, kwargs))
+
+    def register_component_binding(self, *args, **kwargs):
+        self.calls.append(('register_component_binding', args, kwargs))
+
+    def register_component_multibinding(self, *args, **kwargs):
+        self.calls.append(('register_component_multibinding', args, kwargs))
+
+    def register_config_properties(self, *args, **kwargs):
+        self.calls.append(('register_config_properties', args, kwargs))
+
+    def __getattr__(self, item):
+        return getattr(self.ctx, item)
+
+
+class StaticWiringGenerator:
+    """
+    Generates a module that registers the components and beans of a built context directly with the context, in
+    the order they were resolved, so that booting from it does not scan or organize factories.
+    """
+
+    def __init__(self, ctx, sources: typing.Iterable[str], scanned_factories: list[ContextFactory]):
+        self.ctx = ctx
+        self.sources = sorted(sources)
+        self.scanned_factories = scanned_factories
+        self._modules: dict[str, str] = {}
+        self._scopes = self._known_scopes()
+
+    def generate(self, factories: list[ContextFactory], args) -> str:
+        wire_lines = []
+        lifecycle_lines = []
+        for f in factories:
+            for m in f.inject_types:
+                if isinstance(m, LifecycleInjectTypeMetadata):
+                    continue
+                wire_lines.extend(self._wire(m, args))
+        from python_di.configs.constants import LifeCycleHook
+        for hook in [LifeCycleHook.pre_construct, LifeCycleHook.autowire, LifeCycleHook.post_construct]:
+            for f in factories:
+                for m in f.inject_types:
+                    if isinstance(m, LifecycleInjectTypeMetadata) and m.lifecycle == hook:
+                        lifecycle_lines.append(f'do_lifecycle_hook({self._render_lifecycle(m)}, ctx)')
+
+        lines = [
+            '"""',
+            'Generated by python_di StaticWiringGenerator. Do not edit.',
+            '"""',
+            'import typing',
+            '',
+            'import injector',
+            '',
+            'from python_di.env.profile import Profile',
+            'from python_di.inject.context_builder.static_wiring import bean_provider, self_factory_provider, '
+            'multibind_provider, lifecycle_hook',
+            'from python_di.inject.context_factory.context_factory_executor.register_factory import do_lifecycle_hook',
+            'from python_di.inject.profile_composite_injector.composite_injector import profile_scope, '
+            'request_scope, task_scope, composite_scope',
+            'from python_di.inject.profile_composite_injector.scopes.pooled_scope import pooled_scope_decorator',
+            'from python_di.inject.profile_composite_injector.scopes.prototype_scope import '
+            'prototype_scope_decorator',
+        ]
+        lines.extend([f'import {module} as {alias}' for module, alias in self._modules.items()])
+        lines.extend(['', f'SOURCES = {self.sources!r}', '',
+                      f'FILES = {retrieve_source_files(self.sources)!r}', '', '',
+                      'def wire(ctx):'])
+        lines.extend([f'    {l}' for l in wire_lines] if len(wire_lines) != 0 else ['    pass'])
+        lines.extend(['', '', 'def lifecycle(ctx):'])
+        lines.extend([f'    {l}' for l in lifecycle_lines] if len(lifecycle_lines) != 0 else ['    pass'])
+        return '\n'.join(lines) + '\n'
+
+    def write(self, factories: list[ContextFactory], args, path: str):
+        generated = self.generate(factories, args)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as wiring_file:
+            wiring_file.write(generated)
+        LoggerFacade.info(f"Wrote static wiring to {path}.")
+
+    def _wire(self, m: InjectTypeMetadata, args) -> list[str]:
+        from python_di.inject.context_builder.injection_context import InjectionContextInjectorContextArgs
+        if isinstance(m, ConfigurationPropertiesInjectTypeMetadata):
+            return self._render_config_properties(m)
+        recording = _RecordingCtx(self.ctx)
+        register_factory(m, InjectionContextInjectorContextArgs(recording, args.sources, args.starting))
+        return [self._render_call(m, name, call_args, call_kwargs)
+                for name, call_args, call_kwargs in recording.calls]
+
+    def _render_config_properties(self, m: ConfigurationPropertiesInjectTypeMetadata) -> list[str]:
+        from python_di.configs.di_util import get_underlying
+        from python_di.configs.constants import DiUtilConstants
+        underlying = get_underlying(m.ty_to_inject)
+        fallback = getattr(underlying, DiUtilConstants.fallback.name, None)
+        ty = self._render_ty(m.ty_to_inject, m)
+        return [
+            f'if not ctx.contains_binding({ty}):',
+            f'    ctx.register_config_properties({ty}, {fallback!r}, '
+            f'bindings=[{self._render_ty(underlying, m)}])'
+        ]
+
+    def _render_call(self, m: InjectTypeMetadata, name: str, call_args: tuple, call_kwargs: dict) -> str:
+        call_kwargs = dict(call_kwargs)
+        call_args = list(call_args)
+        if name == 'register_component':
+            names = ['concrete', 'bindings', 'scope', 'profile']
+        elif name == 'register_component_binding':
+            names = ['binding', 'concrete_ty', 'bindings', 'scope', 'profile']
+        elif name == 'register_component_multibinding':
+            names = ['binding', 'concrete_ty', 'scope', 'profile']
+        else:
+            raise StaticWiringException(f"Could not render {name} for {m}.")
+
+        rendered = []
+        for i, arg_name in enumerate(names):
+            if i < len(call_args):
+                value = call_args[i]
+            elif arg_name in call_kwargs.keys():
+                value = call_kwargs[arg_name]
+            else:
+                continue
+            rendered.append(f'{arg_name}={self._render_arg(m, arg_name, value)}')
+        return f'ctx.{name}({", ".join(rendered)})'
+
+    def _render_arg(self, m: InjectTypeMetadata, arg_name: str, value) -> str:
+        if arg_name == 'binding':
+            return self._render_binding(m)
+        elif arg_name == 'bindings':
+            return f'[{", ".join([self._render_ty(b, m) for b in value])}]' if value is not None else 'None'
+        elif arg_name == 'scope':
+            return self._render_scope(value)
+        elif arg_name == 'profile':
+            return self._render_profile(value)
+        else:
+            return self._render_ty(value, m)
+
+    def _render_binding(self, m: InjectTypeMetadata) -> str:
+        if isinstance(m, BeanComponentFactory):
+            configuration, factory_idx, inject_ty_idx = self._locate_bean(m)
+            return f'bean_provider({self._render_ty(configuration, m)}, {factory_idx}, {inject_ty_idx})'
+        elif isinstance(m, ComponentSelfFactory):
+            factory_idx, inject_ty_idx = self._locate_inject_ty(m.ty_to_inject, m)
+            return (f'self_factory_provider({self._render_ty(m.ty_to_inject, m)}, {factory_idx}, {inject_ty_idx}, '
+                    f'{self._render_profile(m.profile)})')
+        elif isinstance(m, MultibindTypeMetadata):
+            return (f'multibind_provider({self._render_scope(m.scope)}, {self._render_profile(m.profile)}, '
+                    f'[{", ".join([self._render_ty(b, m) for b in m.bindings])}])')
+        raise StaticWiringException(f"Could not render binding for {m}.")
+
+    def _render_lifecycle(self, m: LifecycleInjectTypeMetadata) -> str:
+        provider = m.ty_to_inject.context_factory_provider
+        for hook in _lifecycle_factory_attrs:
+            for i, lifecycle_factory in enumerate(getattr(provider, hook)):
+                if lifecycle_factory._to_call is m.to_call:
+                    return (f'lifecycle_hook({self._render_ty(m.ty_to_inject, m)}, {hook!r}, {i}, '
+                            f'{self._render_profile(m.profile)})')
+        raise StaticWiringException(f"Could not locate lifecycle hook {m.to_call} for {m.ty_to_inject}.")
+
+    def _locate_bean(self, m: BeanComponentFactory) -> typing.Tuple[typing.Type, int, int]:
+        for f in self.scanned_factories:
+            if isinstance(f, ConfigurationFactory):
+                for inject_ty in f.inject_types:
+                    if inject_ty.to_call is m.to_call:
+                        factory_idx, inject_ty_idx = self._locate_inject_ty(f.cls, m)
+                        return f.cls, factory_idx, inject_ty_idx
+        raise StaticWiringException(f"Could not locate configuration for bean {m.ty_to_inject}.")
+
+    @staticmethod
+    def _locate_inject_ty(owner: typing.Type, m: InjectTypeMetadata) -> typing.Tuple[int, int]:
+        for i, f in enumerate(getattr(owner, 'context_factory', [])):
+            if isinstance(f, PrototypeComponentFactory):
+                continue
+            for j, inject_ty in enumerate(f.inject_types):
+                if getattr(inject_ty, '_to_call', None) is m.to_call:
+                    return i, j
+        raise StaticWiringException(f"Could not locate {m} in {owner}.")
+
+    def _render_ty(self, ty, m: InjectTypeMetadata) -> str:
+        if ty is None:
+            return 'None'
+        origin = typing.get_origin(ty)
+        if origin is list:
+            return f'typing.List[{", ".join([self._render_ty(a, m) for a in typing.get_args(ty)])}]'
+        if isinstance(m, PrototypeComponentFactory) and ty is m.factory:
+            return f'{self._render_ty(m.underlying, m)}.prototype_bean_factory_ty'
+        if not isinstance(ty, type) or '<locals>' in ty.__qualname__:
+            raise StaticWiringException(f"Could not render {ty} as it was not importable.")
+        if ty.__module__ not in self._modules.keys():
+            self._modules[ty.__module__] = f'_m{len(self._modules)}'
+        return f'{self._modules[ty.__module__]}.{ty.__qualname__}'
+
+    @staticmethod
+    def _render_profile(profile) -> str:
+        if isinstance(profile, Profile):
+            return f'Profile.new_profile({profile.profile_name!r}, {profile.priority!r})'
+        elif profile is None or isinstance(profile, str):
+            return repr(profile)
+        raise StaticWiringException(f"Could not render profile {profile}.")
+
+    def _render_scope(self, scope) -> str:
+        if scope is None:
+            return 'None'
+        for known, rendered in self._scopes:
+            if scope is known:
+                return rendered
+        if isinstance(scope, PooledScopeDecorator):
+            return f'pooled_scope_decorator({scope.profile!r}, {scope.max_size!r})'
+        if isinstance(scope, PrototypeScopeDecorator):
+            return f'prototype_scope_decorator({scope.profile!r})'
+        raise StaticWiringException(f"Could not render scope {scope}.")
+
+    @staticmethod
+    def _known_scopes() -> list[typing.Tuple[object, str]]:
+        from python_di.inject.profile_composite_injector.composite_injector import profile_scope, request_scope, \
+            task_scope, composite_scope
+        return [
+            (injector.singleton, 'injector.singleton'),
+            (injector.noscope, 'injector.noscope'),
+            (injector.threadlocal, 'injector.threadlocal'),
+            (injector.SingletonScope, 'injector.SingletonScope'),
+            (injector.NoScope, 'injector.NoScope'),
+            (profile_scope, 'profile_scope'),
+            (profile_scope.scope, 'profile_scope.scope'),
+            (request_scope, 'request_scope'),
+            (request_scope.scope, 'request_scope.scope'),
+            (task_scope, 'task_scope'),
+            (task_scope.scope, 'task_scope.scope'),
+            (composite_scope, 'composite_scope'),
+        ]
@@ -16,7 +16,7 @@ from python_di.inject.context_factory.type_metadata.inject_ty_metadata import Co
 from python_di.inject.context_factory.type_metadata.base_ty_metadata import InjectTypeMetadata, HasFnArgs
 from python_di.inject.context_builder.inject_ctx import inject_context_di
 from python_di.inject.injector_provider import InjectionContextInjector, T
-from python_di.inject.profile_composite_injector.composite_injector import profile_scope
+from python_di.inject.profile_composite_injector.composite_injector import profile_scope, request_scope, task_scope
 from python_di.inject.profile_composite_injector.inject_context_di import autowire_fn
 from python_util.logger.logger import LoggerFacade
 
@@ -157,6 +157,8 @@ def register_component_factory(component_factory_data: ComponentFactory,
     elif scope == profile_scope and profile is None:
         ctx.register_component(cls, bindings=binding, scope=scope,
                                profile=profile_props.default_profile.profile_name)
+    elif (scope == request_scope or scope == task_scope) and profile is None:
+        ctx.register_component(cls, bindings=binding, scope=scope)
     else:
         LoggerFacade.error(f"Error registering {component_factory_data.ty_to_inject}. Did not match eligibility "
                            f"criteria for registration.")
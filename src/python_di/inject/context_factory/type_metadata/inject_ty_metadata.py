@@ -163,6 +163,11 @@ class PrototypeFactory(abc.ABC):
     def create(self, profile: typing.Optional[str] = None, **kwargs):
         pass
 
+    def create_many(self, profile: typing.Optional[str] = None,
+                    kwargs_iter: typing.Iterable[dict] = None) -> typing.Iterator:
+        for kwargs in kwargs_iter if kwargs_iter is not None else [{}]:
+            yield self.create(profile, **kwargs)
+
 
 class MultibindTypeMetadata(InjectTypeMetadata):
 
@@ -1,4 +1,5 @@
 import asyncio
+import contextlib
 import threading
 import typing
 from typing import Optional
@@ -11,9 +12,12 @@ from python_di.env.init_env import EnvironmentProvider, retrieve_env_profile
 from python_di.env.profile import Profile
 from python_di.env.property_source import PropertySource
 from python_di.inject.context_builder.profile_util import add_profile, create_add_profile_curry
+from python_di.inject.lazy_proxy import LazyProxy, is_lazy_type, retrieve_lazy_type
 from python_di.inject.prioritized_injectors import InjectorsPrioritized
 from python_di.inject.profile_composite_injector.scopes.profile_scope import ProfileScope, _iter_profile_scope
+from python_di.inject.profile_composite_injector.scopes.pooled_scope import PooledScopeDecorator, pooled_scope
 from python_di.inject.profile_composite_injector.scopes.prototype_scope import PrototypeScopeDecorator
+from python_di.inject.profile_composite_injector.scopes.request_scope import RequestScope, TaskScope
 from python_util.concurrent.synchronized_lock_stripe import LockStripingLocks
 from python_util.logger.logger import LoggerFacade
 
@@ -140,6 +144,9 @@ class InjectionContextInjector:
 
     def get_interface(self, type_value: typing.Type[T], profile: Optional[str] = None,
                       scope: injector.ScopeDecorator = None, **kwargs) -> Optional[T]:
+        if is_lazy_type(type_value):
+            lazy_type = retrieve_lazy_type(type_value)
+            return LazyProxy(lambda: self.get_interface(lazy_type, profile, scope, **kwargs))
         created_profile = self._retrieve_create_profile(profile) if profile is not None else None
         found_obj = self._perform_injector(
             lambda i, exc, kwargs_found: self.get_binding(i, type_value, created_profile,
@@ -150,6 +157,47 @@ class InjectionContextInjector:
         else:
             LoggerFacade.debug(f"Could not find {type_value}.")
 
+    def create_many(self, type_value: typing.Type[T],
+                    n_or_kwargs: typing.Union[int, typing.Iterable[dict]],
+                    profile: Optional[str] = None,
+                    stream: bool = False) -> typing.Union[list[T], typing.Iterator[T]]:
+        """
+        Create many prototype beans, retrieving the prototype factory and resolving the shared dependencies once.
+        :param type_value: the prototype bean type.
+        :param n_or_kwargs: the number of beans to create, or the kwargs to create each bean with.
+        :param profile: the profile to create the beans for.
+        :param stream: if True, return a generator of the beans instead of a list.
+        :return:
+        """
+        if not self.is_prototype(None, type_value):
+            raise ValueError(f"Attempted to create many of {type_value}, which was not a prototype bean.")
+        created_profile = self._retrieve_create_profile(profile) if profile is not None else None
+        factory = self._perform_injector(
+            lambda i, exc, kwargs_found: self.get_prototype_factory(i, type_value),
+            profile, type_value, None, False)
+        if factory is None:
+            raise ValueError(f"Could not find prototype bean factory for {type_value}.")
+        kwargs_iter = ({} for _ in range(n_or_kwargs)) if isinstance(n_or_kwargs, int) else n_or_kwargs
+        created = factory.create_many(self.retrieve_profile_name(created_profile), kwargs_iter)
+        return created if stream else list(created)
+
+    @contextlib.contextmanager
+    def borrow(self, type_value: typing.Type[T], scope: PooledScopeDecorator = pooled_scope,
+               profile: Optional[str] = None, **kwargs) -> typing.Iterator[T]:
+        """
+        Retrieve a pooled prototype bean, returning it to the pool on exit.
+        :param type_value: the prototype bean type.
+        :param scope: the pooled scope holding the pool.
+        :param profile:
+        :param kwargs: passed to the prototype factory if there is no idle bean created with the same kwargs.
+        :return:
+        """
+        bean = self.get_interface(type_value, profile, scope, **kwargs)
+        try:
+            yield bean
+        finally:
+            scope.release(bean, type_value)
+
     def get_property_with_default(self, key, default, profile_name=None):
         if self.environment is not None:
             from python_di.env.env_properties import YamlPropertiesFilesBasedEnvironment
@@ -278,14 +326,12 @@ class InjectionContextInjector:
                     **kwargs) -> Optional[T]:
         type_not_contained = type_value not in injector_value.binder._bindings.keys()
         if InjectionContextInjector.is_prototype(scope_decorator, type_value):
-            if not hasattr(type_value, 'prototype_bean_factory_ty'):
-                LoggerFacade.error(f"Attempted to retrieve {type_value} with prototype scope but the reference to the"
-                                   f"bean's factory did not exist.")
-            else:
-                if type_value.prototype_bean_factory_ty in injector_value.binder._bindings.keys():
-                    # prototype bean factory is singleton.
-                    type_value = injector_value.get(type_value.prototype_bean_factory_ty, scope=injector.singleton)
-                    return type_value.create(cls.retrieve_profile_name(profile), **kwargs)
+            factory = cls.get_prototype_factory(injector_value, type_value)
+            if factory is not None and isinstance(scope_decorator, PooledScopeDecorator):
+                return scope_decorator.pool(type_value).acquire(
+                    lambda **k: factory.create(cls.retrieve_profile_name(profile), **k), **kwargs)
+            elif factory is not None:
+                return factory.create(cls.retrieve_profile_name(profile), **kwargs)
         else:
             if isinstance(scope_decorator, injector.ScopeDecorator):
                 scope_decorator = scope_decorator.scope
@@ -297,11 +343,23 @@ class InjectionContextInjector:
                 if scope_decorator is not None and binding.scope != scope_decorator:
                     LoggerFacade.debug(f"Scope requested was {scope_decorator}, but scope contained in {profile} was "
                                        f"{binding.scope} for {binding}.")
+                elif scope_decorator is None and binding.scope in [RequestScope, TaskScope]:
+                    # a request or task bean is cached in the request or task, not the injector.
+                    scope_decorator = binding.scope
                 elif scope_decorator is None:
                     scope_decorator = injector.singleton.scope
 
                 return injector_value.get(type_value, scope_decorator)
 
+    @classmethod
+    def get_prototype_factory(cls, injector_value: injector.Injector, type_value: typing.Type[T]):
+        if not hasattr(type_value, 'prototype_bean_factory_ty'):
+            LoggerFacade.error(f"Attempted to retrieve {type_value} with prototype scope but the reference to the"
+                               f"bean's factory did not exist.")
+        elif type_value.prototype_bean_factory_ty in injector_value.binder._bindings.keys():
+            # prototype bean factory is singleton.
+            return injector_value.get(type_value.prototype_bean_factory_ty, scope=injector.singleton)
+
     @classmethod
     def is_prototype(cls, scope_decorator, type_value):
         from python_di.inject.context_factory.context_factory import PrototypeComponentFactory
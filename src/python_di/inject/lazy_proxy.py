@@ -0,0 +1,150 @@
+import threading
+import typing
+
+import injector
+
+T = typing.TypeVar("T")
+
+_unset = object()
+
+
+class Lazy(typing.Generic[T]):
+    """
+    Opt-in injection type. A dependency annotated with Lazy[T] is injected as a LazyProxy that retrieves T on first
+    attribute access.
+    """
+    pass
+
+
+def is_lazy_type(ty) -> bool:
+    return typing.get_origin(ty) is Lazy
+
+
+def retrieve_lazy_type(ty):
+    """
+    :param ty: Lazy[T]
+    :return: T
+    """
+    args = typing.get_args(ty)
+    assert len(args) == 1, f"{ty} did not have a single type argument."
+    return args[0]
+
+
+def bind_lazy_dependencies(injector_value: injector.Injector, fn: typing.Callable):
+    """
+    Bind the Lazy[T] parameters the injector injects into the function, so that a component constructor taking Lazy[T]
+    is injected a LazyProxy that retrieves T, from the injector creating the component, on first access.
+    :param injector_value: the injector the component is bound in.
+    :param fn: the constructor of the component.
+    """
+    for ty in injector.get_bindings(fn).values():
+        if is_lazy_type(ty) and ty not in injector_value.binder._bindings.keys():
+            injector_value.binder.bind(ty, _lazy_provider(retrieve_lazy_type(ty)), scope=injector.noscope)
+
+
+def _lazy_provider(lazy_type) -> injector.Provider:
+    @injector.inject
+    def provide_lazy(injector_value: injector.Injector):
+        return LazyProxy(lambda: injector_value.get(lazy_type))
+
+    return injector.CallableProvider(provide_lazy)
+
+
+class LazyProxy:
+    """
+    Proxies the value created by the factory, which is called on first access in a thread-safe way.
+    """
+
+    __slots__ = ('_lazy_factory', '_lazy_target', '_lazy_lock', '__weakref__')
+
+    def __init__(self, factory: typing.Callable[[], T]):
+        object.__setattr__(self, '_lazy_factory', factory)
+        object.__setattr__(self, '_lazy_target', _unset)
+        object.__setattr__(self, '_lazy_lock', threading.Lock())
+
+    def _lazy_get(self):
+        target = object.__getattribute__(self, '_lazy_target')
+        if target is _unset:
+            with object.__getattribute__(self, '_lazy_lock'):
+                target = object.__getattribute__(self, '_lazy_target')
+                if target is _unset:
+                    target = object.__getattribute__(self, '_lazy_factory')()
+                    # a lazy bean is provided as a proxy itself, so a Lazy[T] of it proxies the bean, not the proxy.
+                    while type(target) is LazyProxy:
+                        target = object.__getattribute__(target, '_lazy_get')()
+                    object.__setattr__(self, '_lazy_target', target)
+                    object.__setattr__(self, '_lazy_factory', None)
+        return target
+
+    @property
+    def __class__(self):
+        return type(self._lazy_get())
+
+    def __getattr__(self, item):
+        return getattr(self._lazy_get(), item)
+
+    def __setattr__(self, key, value):
+        setattr(self._lazy_get(), key, value)
+
+    def __delattr__(self, item):
+        delattr(self._lazy_get(), item)
+
+    def __dir__(self):
+        return dir(self._lazy_get())
+
+    def __repr__(self):
+        if object.__getattribute__(self, '_lazy_target') is _unset:
+            return 'LazyProxy(<uninitialized>)'
+        return repr(self._lazy_get())
+
+    def __str__(self):
+        return str(self._lazy_get())
+
+    def __bool__(self):
+        return bool(self._lazy_get())
+
+    def __eq__(self, other):
+        return self._lazy_get() == other
+
+    def __ne__(self, other):
+        return self._lazy_get() != other
+
+    def __hash__(self):
+        return hash(self._lazy_get())
+
+    def __call__(self, *args, **kwargs):
+        return self._lazy_get()(*args, **kwargs)
+
+    def __len__(self):
+        return len(self._lazy_get())
+
+    def __iter__(self):
+        return iter(self._lazy_get())
+
+    def __contains__(self, item):
+        return item in self._lazy_get()
+
+    def __getitem__(self, item):
+        return self._lazy_get()[item]
+
+    def __setitem__(self, key, value):
+        self._lazy_get()[key] = value
+
+    def __delitem__(self, key):
+        del self._lazy_get()[key]
+
+    def __enter__(self):
+        return self._lazy_get().__enter__()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return self._lazy_get().__exit__(exc_type, exc_val, exc_tb)
+
+
+def is_initialized(proxy) -> bool:
+    """
+    :param proxy:
+    :return: False if the value is a LazyProxy that has not yet created its target.
+    """
+    if type(proxy) is not LazyProxy:
+        return True
+    return object.__getattribute__(proxy, '_lazy_target') is not _unset
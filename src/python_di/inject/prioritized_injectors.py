@@ -12,6 +12,7 @@ from python_di.inject.profile_composite_injector.scopes.composite_scope import C
 from python_di.inject.profile_composite_injector.scopes.profile_scope import ProfileScope
 from python_di.inject.profile_composite_injector.inject_utils import is_scope_singleton_scope
 from python_di.inject.injection_field import InjectionObservationField
+from python_di.inject.lazy_proxy import bind_lazy_dependencies
 from python_di.inject.profile_composite_injector.multibind_util import is_multibindable
 from python_util.concurrent.synchronized_lock_stripe import synchronized_lock_striping, LockStripingLocks
 from python_util.logger.logger import LoggerFacade
@@ -356,6 +357,9 @@ class InjectorsPrioritized:
                     if b != concrete:
                         injector_found.binder.bind(b, concrete_value if concrete_value is not None else concrete,
                                                    scope=scope)
+            if concrete_value is None:
+                bind_lazy_dependencies(injector_found, concrete.__init__)
+                bind_lazy_dependencies(self.composite_scope.injector, concrete.__init__)
 
     def _retrieve_injectors_having(self, ty: typing.Type[T]) -> dict[Profile, CompositeInjector]:
         return dict(filter(lambda k_v: ty in k_v[1], self.injectors.items()))
@@ -9,11 +9,14 @@ from injector import T, Provider, InstanceProvider, ScopeDecorator
 from python_di.env.profile import Profile
 from python_di.inject.profile_composite_injector.scopes.composite_scope import CompositeScope
 from python_di.inject.profile_composite_injector.scopes.profile_scope import ProfileScope
+from python_di.inject.profile_composite_injector.scopes.request_scope import RequestScope, TaskScope
 from python_util.logger.logger import LoggerFacade
 
 
 
 profile_scope = injector.ScopeDecorator(ProfileScope)
+request_scope = injector.ScopeDecorator(RequestScope)
+task_scope = injector.ScopeDecorator(TaskScope)
 composite_scope = CompositeScope
 
 CompositeInjectorT = typing.ForwardRef("CompositeInjectorT")
@@ -0,0 +1,228 @@
+import collections
+import contextlib
+import dataclasses
+import threading
+import typing
+from typing import Type
+
+import injector
+from injector import T, Provider, synchronized
+
+from python_di.configs.constants import DiUtilConstants
+from python_di.inject.profile_composite_injector.scopes.prototype_scope import PrototypeScopeDecorator
+from python_util.logger.logger import LoggerFacade
+
+pooled_scope_lock = threading.RLock()
+
+DEFAULT_POOL_SIZE = 8
+
+
+@dataclasses.dataclass(init=True)
+class PoolStats:
+    hits: int = 0
+    misses: int = 0
+    returned: int = 0
+    discarded: int = 0
+    max_occupancy: int = 0
+    max_in_use: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        acquired = self.hits + self.misses
+        return self.hits / acquired if acquired != 0 else 0.0
+
+
+def retrieve_pre_reuse_hooks(ty: type) -> list[typing.Callable]:
+    """
+    :param ty: the pooled bean type.
+    :return: the functions decorated with @pre_reuse for the type, in mro order. A hook overridden in a subclass is
+    retrieved by name, so only the most derived function runs.
+    """
+    names = []
+    for base in reversed(ty.__mro__):
+        for k, v in base.__dict__.items():
+            fn = getattr(v, DiUtilConstants.wrapped_fn.name, v)
+            if getattr(fn, DiUtilConstants.is_pre_reuse.name, False) and k not in names:
+                names.append(k)
+    return [getattr(ty, name) for name in names]
+
+
+def pool_key(kwargs: dict) -> typing.Optional[typing.Tuple]:
+    """
+    :return: the key of the beans created with the kwargs, so that a bean is reused only for the same kwargs, or None
+    if the kwargs are not hashable and the bean cannot be reused.
+    """
+    key = tuple(sorted(kwargs.items()))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+class BeanPool:
+    """
+    Bounded pool of prototype beans. When the pool is exhausted a new bean is created, and when the pool is full a
+    returned bean is discarded. Idle beans are kept by the kwargs they were created with, so that a bean is only
+    reused for the same kwargs.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_POOL_SIZE):
+        self.max_size = max_size
+        self.stats = PoolStats()
+        self._idle: dict[typing.Tuple, typing.Deque] = {}
+        self._num_idle = 0
+        self._checked_out: dict[int, typing.Tuple[typing.Any, typing.Optional[typing.Tuple]]] = {}
+        self._hooks: dict[type, list[typing.Callable]] = {}
+        self._lock = threading.RLock()
+
+    @property
+    def in_use(self) -> int:
+        return len(self._checked_out)
+
+    def acquire(self, create: typing.Callable[..., T], **kwargs) -> T:
+        """
+        :param create: creates the bean with the kwargs if there is no idle bean created with the same kwargs.
+        """
+        key = pool_key(kwargs)
+        with self._lock:
+            idle = self._idle.get(key) if key is not None else None
+            if idle is not None and len(idle) != 0:
+                bean = idle.pop()
+                self._num_idle -= 1
+                self.stats.hits += 1
+                self._check_out(bean, key)
+                return bean
+            self.stats.misses += 1
+        bean = create(**kwargs)
+        with self._lock:
+            self._check_out(bean, key)
+        return bean
+
+    def release(self, bean: T):
+        """
+        :raises ValueError: if the bean was not acquired from this pool, or was already released.
+        """
+        if bean is None:
+            return
+        with self._lock:
+            checked_out = self._checked_out.pop(id(bean), None)
+            if checked_out is None or checked_out[0] is not bean:
+                if checked_out is not None:
+                    self._checked_out[id(bean)] = checked_out
+                raise ValueError(f"Released {type(bean)} that was not acquired from the pool, or was already "
+                                 f"released.")
+        key = checked_out[1]
+        try:
+            for hook in self._retrieve_hooks(type(bean)):
+                hook(bean)
+        except Exception as e:
+            LoggerFacade.error(f"Pre reuse hook failed for {type(bean)}: {e}. Discarding bean.")
+            with self._lock:
+                self.stats.discarded += 1
+            return
+        with self._lock:
+            if key is not None and self._num_idle < self.max_size:
+                self._idle.setdefault(key, collections.deque()).append(bean)
+                self._num_idle += 1
+                self.stats.returned += 1
+                self.stats.max_occupancy = max(self.stats.max_occupancy, self._num_idle)
+            else:
+                self.stats.discarded += 1
+
+    @contextlib.contextmanager
+    def borrow(self, create: typing.Callable[..., T], **kwargs) -> typing.Iterator[T]:
+        bean = self.acquire(create, **kwargs)
+        try:
+            yield bean
+        finally:
+            self.release(bean)
+
+    def clear(self):
+        with self._lock:
+            self._idle.clear()
+            self._num_idle = 0
+
+    def __len__(self):
+        return self._num_idle
+
+    def _check_out(self, bean, key: typing.Optional[typing.Tuple]):
+        self._checked_out[id(bean)] = (bean, key)
+        self.stats.max_in_use = max(self.stats.max_in_use, len(self._checked_out))
+
+    def _retrieve_hooks(self, ty: type) -> list[typing.Callable]:
+        if ty not in self._hooks.keys():
+            self._hooks[ty] = retrieve_pre_reuse_hooks(ty)
+        return self._hooks[ty]
+
+
+class PooledScope(injector.Scope):
+
+    def __init__(self, parent: injector.Scope, injector_value: injector.Injector):
+        super().__init__(injector_value)
+        self.parent = parent
+
+    def get(self, key: Type[T], provider: Provider[T]) -> Provider[T]:
+        raise NotImplementedError("Pooled scope beans are created using the prototype factory.")
+
+
+class PooledScopeDecorator(PrototypeScopeDecorator):
+    """
+    Prototype scope that hands out prototype beans from a bounded pool for each bean type. Beans are returned using
+    release or borrow, and the @pre_reuse hooks of the bean are called on return.
+    """
+
+    def __init__(self, profile: typing.Optional[str] = None, max_size: int = DEFAULT_POOL_SIZE):
+        super().__init__(profile)
+        self.scope = PooledScope
+        self.max_size = max_size
+        self._pools: dict[type, BeanPool] = {}
+
+    @synchronized(pooled_scope_lock)
+    def pool(self, ty: type) -> BeanPool:
+        if ty not in self._pools.keys():
+            self._pools[ty] = BeanPool(self.max_size)
+        return self._pools[ty]
+
+    def release(self, bean: T, ty: typing.Optional[type] = None):
+        self.pool(ty if ty is not None else type(bean)).release(bean)
+
+    def stats(self, ty: type) -> PoolStats:
+        return self.pool(ty).stats
+
+    def __eq__(self, other):
+        return other is self
+
+    def __hash__(self):
+        return hash((self.profile, self.max_size, PooledScopeDecorator.__name__))
+
+
+pooled_scope = PooledScopeDecorator()
+
+
+def pooled_scope_decorator(
+        profile: typing.Optional[str] = None,
+        max_size: int = DEFAULT_POOL_SIZE
+) -> PooledScopeDecorator:
+    return pooled_scope_decorator_factory(profile, max_size)()
+
+
+pooled_scope_decorators: dict[tuple[typing.Optional[str], int], PooledScopeDecorator] = {}
+
+
+def pooled_scope_decorator_factory(
+        profile: typing.Optional[str] = None,
+        max_size: int = DEFAULT_POOL_SIZE
+) -> typing.Callable[[], PooledScopeDecorator]:
+    if profile is not None:
+        profile = profile.lower()
+
+    @synchronized(pooled_scope_lock)
+    def retrieve_pooled_scope_fn():
+        if profile is None and max_size == DEFAULT_POOL_SIZE:
+            return pooled_scope
+        if (profile, max_size) not in pooled_scope_decorators.keys():
+            pooled_scope_decorators[(profile, max_size)] = PooledScopeDecorator(profile, max_size)
+        return pooled_scope_decorators[(profile, max_size)]
+
+    return retrieve_pooled_scope_fn
@@ -0,0 +1,91 @@
+import asyncio
+import contextlib
+import contextvars
+import typing
+import weakref
+from typing import Type
+
+import injector
+from injector import Provider, T
+
+_request_context: contextvars.ContextVar[typing.Optional[dict[type, Provider]]] \
+    = contextvars.ContextVar('python_di_request_context', default=None)
+
+_task_contexts: weakref.WeakKeyDictionary[asyncio.Task, dict[type, Provider]] = weakref.WeakKeyDictionary()
+
+
+class ScopeNotActiveException(Exception):
+    pass
+
+
+@contextlib.contextmanager
+def request_context() -> typing.Iterator[dict[type, Provider]]:
+    """
+    Beans with request scope retrieved within the block are created once and released when the block exits.
+    :return:
+    """
+    context = {}
+    token = _request_context.set(context)
+    try:
+        yield context
+    finally:
+        _request_context.reset(token)
+        context.clear()
+
+
+def is_request_active() -> bool:
+    return _request_context.get() is not None
+
+
+class RequestScope(injector.Scope):
+    """
+    Provides an instance per request_context block. The context is held in a context variable, so asyncio tasks
+    started within the block see the same request. Context variables are not propagated to new threads, so a thread
+    started within the block must be run in a copy of the context, e.g. with contextvars.copy_context().run.
+    """
+
+    def get(self, key: Type[T], provider: Provider[T]) -> Provider[T]:
+        context = _request_context.get()
+        if context is None:
+            raise ScopeNotActiveException(f"Attempted to retrieve {key} with request scope outside of a request "
+                                          f"context.")
+        try:
+            return context[key]
+        except KeyError:
+            instance_provider = injector.InstanceProvider(provider.get(self.injector))
+            return context.setdefault(key, instance_provider)
+
+
+class TaskScope(injector.Scope):
+    """
+    Provides an instance per asyncio task, released when the task is done.
+    """
+
+    def get(self, key: Type[T], provider: Provider[T]) -> Provider[T]:
+        context = self._task_context(key)
+        try:
+            return context[key]
+        except KeyError:
+            instance_provider = injector.InstanceProvider(provider.get(self.injector))
+            return context.setdefault(key, instance_provider)
+
+    @staticmethod
+    def _task_context(key: Type[T]) -> dict[type, Provider]:
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        if task is None:
+            raise ScopeNotActiveException(f"Attempted to retrieve {key} with task scope outside of an asyncio task.")
+        try:
+            return _task_contexts[task]
+        except KeyError:
+            context = _task_contexts.setdefault(task, {})
+            task.add_done_callback(_release_task_context)
+            return context
+
+
+def _release_task_context(task: asyncio.Task):
+    context = _task_contexts.pop(task, None)
+    if context is not None:
+        context.clear()
@@ -8,22 +8,6 @@ from python_di.inject.binder_utils import bind_multi_bind
 from python_di.inject.context_builder.inject_ctx import inject_context_di
 from python_di.inject.context_builder.injection_context import InjectionContext
 from python_di.inject.injector_provider import InjectionContextInjector
-from python_di.reflect_scanner.class_parser import ClassFnParser, ClassDefParser, ClassDefInnerParser
-from python_di.reflect_scanner.file_parser import ASTNodeParser, FileParser
-from python_di.reflect_scanner.function_parser import FunctionDefParser, FnStatementParser, FnArgsParser
-from python_di.reflect_scanner.graph_scanner import DecoratorOfGraphScanner, SubclassesOfGraphScanner, \
-    FunctionsOfGraphScanner, ModulesOfGraphScanner, ImportGraphScanner
-from python_di.reflect_scanner.import_parser import ImportParser
-from python_di.reflect_scanner.program_parser import ProgramParser, PropertyBasedSourceFileProvider, \
-    InclusionCriteria, SourceFileProvider, PythonSourceFileInclusionCriteria
-from python_di.reflect_scanner.program_parser_connector import ClassParserConnector, FunctionArgsParserConnector, \
-    ClassFunctionParserConnector, FunctionParserConnector, ProgramParserConnector, DecoratorParserConnector
-from python_di.reflect_scanner.scanner_properties import ScannerProperties
-from python_di.reflect_scanner.statements_parser import StatementParser, AggregateStatementParser
-from python_di.reflect_scanner.type_introspector import TypeIntrospector, AttributeAstIntrospecter, TupleIntrospecter, \
-    NameIntrospecter, DictClassDefParser, ListClassDefParser, OptionalClassDefParser, GenericClassDefParser, \
-    SubscriptIntrospecter, ClassDefIntrospectParser, AggregateTypeIntrospecter, ListAstIntrospecter, \
-    ConstantIntrospecter
 
 T = typing.TypeVar("T")
 
@@ -49,6 +33,10 @@ class ReflectableCtx(injector.Module):
         self.bind_program_parser(binder)
 
     def bind_program_parser(self, binder: Binder):
+        from python_di.reflect_scanner.file_parser import FileParser
+        from python_di.reflect_scanner.program_parser import ProgramParser, PropertyBasedSourceFileProvider, \
+            InclusionCriteria, SourceFileProvider, PythonSourceFileInclusionCriteria
+        from python_di.reflect_scanner.scanner_properties import ScannerProperties
         bind_multi_bind([PythonSourceFileInclusionCriteria], binder, typing.List[InclusionCriteria])
         binder.bind(PythonSourceFileInclusionCriteria, PythonSourceFileInclusionCriteria, scope=injector.singleton)
         binder.bind(SourceFileProvider, PropertyBasedSourceFileProvider, scope=injector.singleton)
@@ -62,12 +50,17 @@ class ReflectableCtx(injector.Module):
 
     @staticmethod
     def _graph_scanner_tys():
+        from python_di.reflect_scanner.graph_scanner import DecoratorOfGraphScanner, SubclassesOfGraphScanner, \
+            FunctionsOfGraphScanner, ModulesOfGraphScanner, ImportGraphScanner, DecoratorsOfGraphScanner, \
+            ImportingModulesGraphScanner
         return [
             DecoratorOfGraphScanner,
+            DecoratorsOfGraphScanner,
             SubclassesOfGraphScanner,
             FunctionsOfGraphScanner,
             ModulesOfGraphScanner,
-            ImportGraphScanner
+            ImportGraphScanner,
+            ImportingModulesGraphScanner
         ]
 
     @inject_context_di()
@@ -76,6 +69,10 @@ class ReflectableCtx(injector.Module):
             ctx.register_config_properties(to_register, to_register.fallback)
 
     def bind_ast_node_parser(self, binder: Binder):
+        from python_di.reflect_scanner.class_parser import ClassFnParser, ClassDefParser, ClassDefInnerParser
+        from python_di.reflect_scanner.file_parser import ASTNodeParser
+        from python_di.reflect_scanner.function_parser import FunctionDefParser, FnStatementParser, FnArgsParser
+        from python_di.reflect_scanner.import_parser import ImportParser
         binder.bind(FnArgsParser, FnArgsParser, scope=injector.singleton)
         binder.bind(FnStatementParser, FnStatementParser, scope=injector.singleton)
         bind_multi_bind([ClassFnParser], binder, typing.List[ClassDefInnerParser])
@@ -86,6 +83,9 @@ class ReflectableCtx(injector.Module):
         ], binder, typing.List[ASTNodeParser])
 
     def bind_parser_connector(self, binder: Binder):
+        from python_di.reflect_scanner.program_parser_connector import ClassParserConnector, \
+            FunctionArgsParserConnector, ClassFunctionParserConnector, FunctionParserConnector, \
+            ProgramParserConnector, DecoratorParserConnector
         bind_multi_bind([
             ClassParserConnector,
             FunctionArgsParserConnector,
@@ -95,6 +95,10 @@ class ReflectableCtx(injector.Module):
         ], binder, typing.List[ProgramParserConnector])
 
     def bind_introspecter(self, binder):
+        from python_di.reflect_scanner.type_introspector import TypeIntrospector, AttributeAstIntrospecter, \
+            TupleIntrospecter, NameIntrospecter, DictClassDefParser, ListClassDefParser, OptionalClassDefParser, \
+            GenericClassDefParser, SubscriptIntrospecter, ClassDefIntrospectParser, AggregateTypeIntrospecter, \
+            ListAstIntrospecter, ConstantIntrospecter
         bind_multi_bind([
             AttributeAstIntrospecter,
             NameIntrospecter,
@@ -112,6 +116,9 @@ class ReflectableCtx(injector.Module):
         binder.bind(AggregateTypeIntrospecter, AggregateTypeIntrospecter, scope=injector.singleton)
 
     def bind_statement_parsers(self, binder):
+        from python_di.reflect_scanner.statements_parser import StatementParser, AggregateStatementParser
+        from python_di.reflect_scanner.type_introspector import AttributeAstIntrospecter, TupleIntrospecter, \
+            NameIntrospecter, SubscriptIntrospecter
         binder.bind(AttributeAstIntrospecter, AttributeAstIntrospecter, scope=injector.singleton)
         binder.bind(NameIntrospecter, NameIntrospecter, scope=injector.singleton)
         binder.bind(TupleIntrospecter, TupleIntrospecter, scope=injector.singleton)
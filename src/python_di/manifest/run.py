@@ -0,0 +1,40 @@
+import argparse
+import os
+
+from python_util.logger.logger import LoggerFacade
+
+
+def main():
+    """
+    Scan the sources once and write the component manifest read by the ComponentScanner at boot.
+    """
+    parser = argparse.ArgumentParser(description='Write the python_di component manifest.')
+    parser.add_argument('--source', action='append', required=True,
+                        help='Source directory to scan. Can be provided multiple times.')
+    parser.add_argument('--starting', default=None,
+                        help='The package root directory. Defaults to the first source.')
+    parser.add_argument('--env', default=None, help='The .env file used to initialize the environment.')
+    parser.add_argument('--out', default=None,
+                        help='The manifest file. Defaults to .python_di_manifest.json in the starting directory.')
+    args = parser.parse_args()
+
+    import injector
+    from python_di.inject.context_builder.component_manifest import manifest_path
+    from python_di.inject.context_builder.component_scanner import ComponentScanner
+    from python_di.inject.context_builder.injection_context import InjectionContext, \
+        InjectionContextInjectorContextArgs
+
+    sources = {os.path.abspath(s) for s in args.source}
+    starting = os.path.abspath(args.starting) if args.starting is not None else next(iter(sorted(sources)))
+    out = args.out if args.out is not None else manifest_path(starting)
+
+    inject_ctx = InjectionContext()
+    ctx = inject_ctx.initialize_env(env_source=args.env)
+    component_scanner: ComponentScanner = ctx.get_interface(ComponentScanner, scope=injector.singleton)
+    manifest = component_scanner.build_manifest(InjectionContextInjectorContextArgs(ctx, sources, starting))
+    manifest.write(out)
+    LoggerFacade.info(f'Wrote component manifest with {len(manifest.entries)} entries to {out}.')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,12 +1,19 @@
 import ast
 import os
+import threading
+import time
 import typing
 from enum import Enum, auto
 from antlr4 import InputStream, CommonTokenStream, ParseTreeWalker
+from antlr4.atn.PredictionMode import PredictionMode
+from antlr4.error.ErrorListener import ConsoleErrorListener
+from antlr4.error.ErrorStrategy import BailErrorStrategy, DefaultErrorStrategy
+from antlr4.error.Errors import ParseCancellationException
 
 from python_di.reflect_scanner.antlr_adapter.ast.antlr.java_lexer import JavaLexer
 from python_di.reflect_scanner.antlr_adapter.ast.antlr.java_parser import JavaParser
 from python_di.reflect_scanner.antlr_adapter.ast.antlr.java_parser_listener import JavaParserListener
+from python_di.reflect_scanner.antlr_adapter.java_ast_cache import JavaAstCache, JavaFileSummary, java_ast_cache
 from python_util.logger.logger import LoggerFacade
 
 
@@ -31,6 +38,36 @@ class LanguageDetector:
         return LanguageDetector.EXTENSION_MAP.get(ext.lower(), Language.UNKNOWN)
 
 
+class AntlrParseMetrics:
+    """
+    The number of files parsed by each stage of the two-stage parse, and the time spent in each, in seconds.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.sll_parses = 0
+        self.sll_seconds = 0.0
+        self.ll_parses = 0
+        self.ll_seconds = 0.0
+
+    def record_sll(self, seconds: float):
+        with self._lock:
+            self.sll_parses += 1
+            self.sll_seconds += seconds
+
+    def record_ll(self, seconds: float):
+        with self._lock:
+            self.ll_parses += 1
+            self.ll_seconds += seconds
+
+    def __str__(self):
+        return (f"SLL: {self.sll_parses} parses in {self.sll_seconds:.3f}s, "
+                f"LL fallback: {self.ll_parses} parses in {self.ll_seconds:.3f}s")
+
+
+java_parse_metrics = AntlrParseMetrics()
+
+
 class AntlrToAstConverter:
     """Base class for converting ANTLR parse trees to Python AST."""
     
@@ -92,8 +129,9 @@ class JavaAntlrToAstListener(JavaParserListener):
         
         # Handle interfaces
         if ctx.IMPLEMENTS():
-            if ctx.typeList():
-                for type_ctx in ctx.typeList().typeType():
+            # the implemented types are the first type list, the permitted subclasses follow it.
+            if len(ctx.typeList()) != 0:
+                for type_ctx in ctx.typeList(0).typeType():
                     base_type = type_ctx.getText()
                     bases.append(ast.Name(id=base_type, ctx=ast.Load()))
         
@@ -103,7 +141,7 @@ class JavaAntlrToAstListener(JavaParserListener):
             bases=bases,
             keywords=[],
             body=[],  # Will be filled by method declarations
-            decorator_list=[]
+            decorator_list=_annotation_decorators(ctx)
         )
         
         self.current_class = class_node
@@ -145,42 +183,121 @@ class JavaAntlrToAstListener(JavaParserListener):
                 kwarg=None
             ),
             body=[ast.Pass()],  # Placeholder
-            decorator_list=[],
+            decorator_list=_annotation_decorators(ctx),
             returns=ast.Name(id=return_type, ctx=ast.Load()) if return_type else None
         )
         
         # Add to current class
         self.current_class.body.append(func_node)
 
+    def summarize(self) -> JavaFileSummary:
+        return JavaFileSummary.from_ast(self.package, self.imports, self.ast_nodes)
+
+
+def _annotation_decorators(ctx) -> list[ast.expr]:
+    """
+    :return: the annotations of the class or method declaration as decorator calls, as they would be in python.
+    """
+    declaration = ctx.parentCtx
+    if isinstance(declaration, JavaParser.MemberDeclarationContext):
+        declaration = declaration.parentCtx
+    if isinstance(declaration, JavaParser.TypeDeclarationContext):
+        modifiers = declaration.classOrInterfaceModifier()
+    elif isinstance(declaration, JavaParser.ClassBodyDeclarationContext):
+        modifiers = [m.classOrInterfaceModifier() for m in declaration.modifier()
+                     if m.classOrInterfaceModifier() is not None]
+    else:
+        return []
+
+    decorators = []
+    for modifier in modifiers:
+        annotation = modifier.annotation()
+        if annotation is not None:
+            name = annotation.qualifiedName() if annotation.qualifiedName() is not None \
+                else annotation.altAnnotationQualifiedName()
+            decorators.append(ast.Call(func=ast.Name(id=name.getText().lstrip('@'), ctx=ast.Load()),
+                                       args=[], keywords=[]))
+    return decorators
+
 
 class JavaAntlrToAstConverter(AntlrToAstConverter):
-    """Converts Java files to Python AST using ANTLR."""
-    
+    """
+    Converts Java files to Python AST using ANTLR.
+
+    Each file is first parsed with SLL prediction and an error strategy that bails out on the first syntax error,
+    which succeeds for almost all valid files, and is parsed again with full LL prediction only if that fails. The
+    lexer and parser are reused for each file parsed by a thread, and the DFA and prediction context caches are
+    shared by all parsers of the process. Files whose contents are in the JavaAstCache are not parsed.
+    """
+
+    _parsers = threading.local()
+
+    def __init__(self, metrics: AntlrParseMetrics = java_parse_metrics,
+                 cache: typing.Optional[JavaAstCache] = java_ast_cache):
+        self.metrics = metrics
+        self.cache = cache
+
     def convert(self, file_path: str) -> list[ast.AST]:
         try:
-            # Read the file
-            with open(file_path, 'r') as file:
-                input_stream = InputStream(file.read())
-            
-            # Create lexer and parser
-            lexer = JavaLexer(input_stream)
-            token_stream = CommonTokenStream(lexer)
-            parser = JavaParser(token_stream)
-            
-            # Parse the compilation unit (root of Java file)
-            tree = parser.compilationUnit()
-            
-            # Create listener and walk the parse tree
-            listener = JavaAntlrToAstListener()
-            walker = ParseTreeWalker()
-            walker.walk(listener, tree)
-            
-            return listener.ast_nodes
-            
+            if self.cache is not None:
+                summary = self.cache.retrieve(file_path, self.parse_summary)
+            else:
+                # Read the file
+                with open(file_path, 'r') as file:
+                    summary = self.parse_summary(file.read(), file_path)
+
+            return summary.to_ast() if summary is not None else []
+
         except Exception as e:
             LoggerFacade.error(f"Failed to parse Java file {file_path}: {e}")
             return []
 
+    def parse_summary(self, source: str, file_path: str) -> JavaFileSummary:
+        # Parse the compilation unit (root of Java file)
+        tree = self.parse(InputStream(source), file_path)
+
+        # Create listener and walk the parse tree
+        listener = JavaAntlrToAstListener()
+        walker = ParseTreeWalker()
+        walker.walk(listener, tree)
+
+        return listener.summarize()
+
+    def parse(self, input_stream: InputStream, file_path: str):
+        lexer, parser = self._retrieve_parser()
+        lexer.inputStream = input_stream
+        token_stream = CommonTokenStream(lexer)
+
+        start = time.perf_counter()
+        parser.setTokenStream(token_stream)
+        parser.removeErrorListeners()
+        parser._errHandler = BailErrorStrategy()
+        parser._interp.predictionMode = PredictionMode.SLL
+        try:
+            tree = parser.compilationUnit()
+            self.metrics.record_sll(time.perf_counter() - start)
+            return tree
+        except ParseCancellationException:
+            self.metrics.record_sll(time.perf_counter() - start)
+            LoggerFacade.debug(f"SLL parse of {file_path} failed, parsing with LL.")
+
+        start = time.perf_counter()
+        token_stream.seek(0)
+        parser.setTokenStream(token_stream)
+        parser.addErrorListener(ConsoleErrorListener.INSTANCE)
+        parser._errHandler = DefaultErrorStrategy()
+        parser._interp.predictionMode = PredictionMode.LL
+        tree = parser.compilationUnit()
+        self.metrics.record_ll(time.perf_counter() - start)
+        return tree
+
+    @classmethod
+    def _retrieve_parser(cls) -> typing.Tuple[JavaLexer, JavaParser]:
+        if not hasattr(cls._parsers, 'parser'):
+            cls._parsers.lexer = JavaLexer(InputStream(''))
+            cls._parsers.parser = JavaParser(CommonTokenStream(cls._parsers.lexer))
+        return cls._parsers.lexer, cls._parsers.parser
+
 
 def from_antlr(file_path: str) -> list[ast.AST]:
     """
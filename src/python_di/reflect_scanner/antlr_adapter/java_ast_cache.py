@@ -0,0 +1,183 @@
+import ast
+import hashlib
+import json
+import os
+import threading
+import typing
+
+from python_util.logger.logger import LoggerFacade
+
+JAVA_AST_CACHE_VERSION = 1
+JAVA_AST_CACHE_ENV = 'PYTHON_DI_JAVA_AST_CACHE'
+
+MethodSummary = typing.Tuple[str, list[str], typing.Optional[str], list[str]]
+ClassSummary = typing.Tuple[str, list[str], list[str], list[MethodSummary]]
+
+
+class JavaFileSummary:
+    """
+    What the JavaAntlrToAstListener extracts from a Java file: the package, the imports as (module, name) pairs, and
+    the classes as (name, bases, annotations, methods), with the methods as (name, parameters, return type,
+    annotations). It is serialized as nested lists.
+    """
+
+    __slots__ = ('package', 'imports', 'classes')
+
+    def __init__(self, package: typing.Optional[str], imports: list[typing.Tuple[str, str]],
+                 classes: list[ClassSummary]):
+        self.package = package
+        self.imports = imports
+        self.classes = classes
+
+    @classmethod
+    def from_ast(cls, package: typing.Optional[str], imports: list[ast.ImportFrom],
+                 class_nodes: list[ast.ClassDef]) -> 'JavaFileSummary':
+        return JavaFileSummary(
+            package,
+            [(i.module, i.names[0].name) for i in imports],
+            [(c.name, [b.id for b in c.bases], _decorator_names(c.decorator_list),
+              [(f.name, [a.arg for a in f.args.args], f.returns.id if f.returns is not None else None,
+                _decorator_names(f.decorator_list))
+               for f in c.body if isinstance(f, ast.FunctionDef)])
+             for c in class_nodes]
+        )
+
+    def to_ast(self) -> list[ast.AST]:
+        """
+        :return: the ClassDef nodes, as created by the JavaAntlrToAstListener.
+        """
+        return [
+            ast.ClassDef(name=name, bases=[ast.Name(id=b, ctx=ast.Load()) for b in bases], keywords=[],
+                         body=[_to_function_def(m) for m in methods], decorator_list=_to_decorators(annotations))
+            for name, bases, annotations, methods in self.classes
+        ]
+
+    def import_nodes(self) -> list[ast.ImportFrom]:
+        return [ast.ImportFrom(module=module, names=[ast.alias(name=name, asname=None)], level=0)
+                for module, name in self.imports]
+
+    def to_serializable(self) -> list:
+        return [self.package, [list(i) for i in self.imports], [list(c) for c in self.classes]]
+
+    @classmethod
+    def from_serializable(cls, value: list) -> 'JavaFileSummary':
+        package, imports, classes = value
+        return JavaFileSummary(package, [(m, n) for m, n in imports],
+                               [(name, bases, annotations, [tuple(m) for m in methods])
+                                for name, bases, annotations, methods in classes])
+
+
+def _decorator_names(decorators: list[ast.expr]) -> list[str]:
+    return [d.func.id for d in decorators if isinstance(d, ast.Call) and isinstance(d.func, ast.Name)]
+
+
+def _to_decorators(annotations: list[str]) -> list[ast.expr]:
+    return [ast.Call(func=ast.Name(id=a, ctx=ast.Load()), args=[], keywords=[]) for a in annotations]
+
+
+def _to_function_def(method: MethodSummary) -> ast.FunctionDef:
+    name, params, returns, annotations = method
+    return ast.FunctionDef(
+        name=name,
+        args=ast.arguments(posonlyargs=[], args=[ast.arg(arg=p, annotation=None) for p in params], kwonlyargs=[],
+                           kw_defaults=[], defaults=[], vararg=None, kwarg=None),
+        body=[ast.Pass()],
+        decorator_list=_to_decorators(annotations),
+        returns=ast.Name(id=returns, ctx=ast.Load()) if returns else None
+    )
+
+
+class JavaAstCache:
+    """
+    Java file summaries keyed by the hash of the file contents, held in memory and written to one file per hash in
+    the cache directory, so that unchanged files are not parsed by ANTLR again. It is shared by the JavaImportResolver
+    and the JavaAntlrToAstConverter.
+    """
+
+    def __init__(self, cache_dir: typing.Optional[str]):
+        self.cache_dir = cache_dir
+        self._summaries: dict[str, JavaFileSummary] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def retrieve(self, file_path: str,
+                 parse: typing.Optional[typing.Callable[[str, str], typing.Optional[JavaFileSummary]]] = None) \
+            -> typing.Optional[JavaFileSummary]:
+        """
+        :param file_path: the Java file.
+        :param parse: parses the contents of the file on a miss, defaulting to the JavaAntlrToAstConverter.
+        :return: the summary of the file, or None if it could not be read or parsed.
+        """
+        try:
+            with open(file_path, 'rb') as java_file:
+                contents = java_file.read()
+        except OSError as e:
+            LoggerFacade.error(f"Failed to read Java file {file_path}: {e}")
+            return None
+
+        key = hashlib.sha256(contents).hexdigest()
+        with self._lock:
+            summary = self._summaries.get(key)
+        if summary is None:
+            summary = self._read(key)
+        if summary is not None:
+            self.hits += 1
+            return summary
+
+        self.misses += 1
+        if parse is None:
+            from python_di.reflect_scanner.antlr_adapter.ast_to_antlr import JavaAntlrToAstConverter
+            parse = JavaAntlrToAstConverter(cache=None).parse_summary
+        summary = parse(contents.decode('utf-8', errors='replace'), file_path)
+        if summary is not None:
+            with self._lock:
+                self._summaries[key] = summary
+            self._write(key, summary)
+        return summary
+
+    def clear(self):
+        with self._lock:
+            self._summaries.clear()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f'v{JAVA_AST_CACHE_VERSION}', key[:2], f'{key}.json')
+
+    def _read(self, key: str) -> typing.Optional[JavaFileSummary]:
+        if self.cache_dir is None or not os.path.exists(self._path(key)):
+            return None
+        try:
+            with open(self._path(key), 'r') as cache_file:
+                summary = JavaFileSummary.from_serializable(json.load(cache_file))
+            with self._lock:
+                self._summaries[key] = summary
+            return summary
+        except Exception as e:
+            LoggerFacade.error(f"Failed to read Java AST cache entry {self._path(key)}: {e}.")
+            return None
+
+    def _write(self, key: str, summary: JavaFileSummary):
+        if self.cache_dir is None:
+            return
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+            with open(tmp_path, 'w') as cache_file:
+                json.dump(summary.to_serializable(), cache_file, separators=(',', ':'))
+            os.replace(tmp_path, path)
+        except Exception as e:
+            LoggerFacade.error(f"Failed to write Java AST cache entry {path}: {e}.")
+
+
+def java_ast_cache_dir() -> typing.Optional[str]:
+    """
+    :return: the PYTHON_DI_JAVA_AST_CACHE environment variable, or ~/.cache/python_di/java_ast. Setting the variable
+    to an empty value keeps the cache in memory only.
+    """
+    if JAVA_AST_CACHE_ENV in os.environ.keys():
+        return os.environ[JAVA_AST_CACHE_ENV] if len(os.environ[JAVA_AST_CACHE_ENV]) != 0 else None
+    return os.path.join(os.path.expanduser('~'), '.cache', 'python_di', 'java_ast')
+
+
+java_ast_cache = JavaAstCache(java_ast_cache_dir())
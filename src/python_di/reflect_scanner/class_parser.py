@@ -7,6 +7,7 @@ import injector
 from python_di.reflect_scanner.file_parser import ASTNodeParser
 from python_di.reflect_scanner.function_parser import FnArgsParser, FnStatementParser
 from python_di.reflect_scanner.module_graph_models import FileNode, NodeType, ClassFunctionFileNode, DecoratorFileNode
+from python_di.reflect_scanner.scan_profile import ScanProfile, retrieve_scan_profile
 
 
 class ClassDefInnerParser(ASTNodeParser, abc.ABC):
@@ -27,8 +28,11 @@ class ClassFnParser(ClassDefInnerParser):
         fn_node = ClassFunctionFileNode(parent.id_value, node.name)
         graph.add_node(fn_node)
         graph.add_edge(parent, fn_node)
-        self.fn_args_parser.parse_args(fn_node, graph, node)
-        self.fn_statement_parser.parse_stmts(fn_node, graph, node)
+        scan_profile = retrieve_scan_profile(parser)
+        if scan_profile.includes(ScanProfile.SIGNATURES):
+            self.fn_args_parser.parse_args(fn_node, graph, node)
+        if scan_profile.includes(ScanProfile.FULL):
+            self.fn_statement_parser.parse_stmts(fn_node, graph, node, source_file=source)
 
 
     def matches(self, node) -> bool:
@@ -0,0 +1,187 @@
+import functools
+import hashlib
+import importlib.metadata
+import json
+import os
+import pickle
+import sys
+import threading
+import typing
+
+from python_util.logger.logger import LoggerFacade
+
+EXTERNAL_GRAPH_CACHE_VERSION = 3
+EXTERNAL_GRAPH_CACHE_ENV = 'PYTHON_DI_EXTERNAL_GRAPH_CACHE'
+
+
+class ExternalDependencyPolicy:
+    """
+    Which external dependencies are parsed into file graphs, and how deeply.
+        max_depth: 0 parses no external dependencies, 1 the dependencies imported by the sources, 2 also their
+                   dependencies, and so on.
+        allow: the packages parsed, all if empty.
+        deny: the packages not parsed, taking precedence over allow.
+        stubs_only: parse only the top-level definitions of external files, without function args or statements.
+    """
+
+    def __init__(self, max_depth: int = 1, allow: typing.Optional[list[str]] = None,
+                 deny: typing.Optional[list[str]] = None, stubs_only: bool = False, cache: bool = True):
+        self.max_depth = max_depth
+        self.allow = allow if allow is not None else []
+        self.deny = deny if deny is not None else []
+        self.stubs_only = stubs_only
+        self.cache = cache
+
+    @classmethod
+    def from_properties(cls, scanner_properties) -> 'ExternalDependencyPolicy':
+        return ExternalDependencyPolicy(scanner_properties.external_max_depth, scanner_properties.external_allow,
+                                        scanner_properties.external_deny, scanner_properties.external_stubs_only,
+                                        scanner_properties.external_cache)
+
+    def allows_depth(self, depth: int) -> bool:
+        return depth <= self.max_depth
+
+    def allows_module(self, module_name: typing.Optional[str]) -> bool:
+        if module_name is None:
+            return True
+        if any([_in_package(module_name, p) for p in self.deny]):
+            return False
+        return len(self.allow) == 0 or any([_in_package(module_name, p) for p in self.allow])
+
+
+def _in_package(module_name: str, package: str) -> bool:
+    return module_name == package or module_name.startswith(package + '.')
+
+
+class ExternalGraphCache:
+    """
+    File graphs of external dependencies, pickled to the cache directory. An entry is keyed by the file and the version
+    of the distribution that installed it, so that installed packages are parsed once per version. The modification
+    time and size of the file are added to the key if it was not installed by a distribution, or was installed in
+    editable mode, where the file changes without the version changing.
+    """
+
+    def __init__(self, cache_dir: typing.Optional[str]):
+        self.cache_dir = cache_dir
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def retrieve(self, file_path: str, variant: str, parse: typing.Callable[[], typing.Any]):
+        """
+        :param file_path: the external file.
+        :param variant: distinguishes the graphs parsed differently from the same file, such as by scan profile.
+        :param parse: parses the file graph on a miss.
+        :return: the file graph.
+        """
+        path = self._path(file_path, variant)
+        if path is not None and os.path.exists(path):
+            try:
+                with open(path, 'rb') as cache_file:
+                    graph = pickle.load(cache_file)
+                with self._lock:
+                    self.hits += 1
+                return graph
+            except Exception as e:
+                LoggerFacade.error(f"Failed to read external graph cache entry {path}: {e}.")
+
+        with self._lock:
+            self.misses += 1
+        graph = parse()
+        if path is not None:
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+                with open(tmp_path, 'wb') as cache_file:
+                    pickle.dump(graph, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, path)
+            except Exception as e:
+                LoggerFacade.error(f"Failed to write external graph cache entry {path}: {e}.")
+        return graph
+
+    def _path(self, file_path: str, variant: str) -> typing.Optional[str]:
+        if self.cache_dir is None:
+            return None
+        version = distribution_version(file_path)
+        if version is None or distribution_is_editable(file_path):
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                return None
+            version = f'{version}:{stat.st_mtime_ns}:{stat.st_size}'
+        key = hashlib.sha256('\x00'.join([os.path.abspath(file_path), version, variant]).encode()).hexdigest()
+        return os.path.join(self.cache_dir, f'v{EXTERNAL_GRAPH_CACHE_VERSION}', key[:2], f'{key}.pickle')
+
+
+@functools.lru_cache(maxsize=1)
+def _packages_distributions() -> typing.Mapping[str, list[str]]:
+    try:
+        return importlib.metadata.packages_distributions()
+    except Exception as e:
+        LoggerFacade.debug(f"Could not read installed distributions: {e}")
+        return {}
+
+
+@functools.lru_cache(maxsize=None)
+def _distribution(top_level: str) -> typing.Optional[importlib.metadata.Distribution]:
+    for distribution in _packages_distributions().get(top_level, []):
+        try:
+            return importlib.metadata.distribution(distribution)
+        except importlib.metadata.PackageNotFoundError:
+            continue
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _is_editable(top_level: str) -> bool:
+    distribution = _distribution(top_level)
+    if distribution is None:
+        return False
+    try:
+        direct_url = distribution.read_text('direct_url.json')
+        return direct_url is not None and json.loads(direct_url).get('dir_info', {}).get('editable', False)
+    except Exception as e:
+        LoggerFacade.debug(f"Could not read direct_url.json of {distribution.metadata['Name']}: {e}")
+        return False
+
+
+def _top_level(file_path: str) -> typing.Optional[str]:
+    file_path = os.path.abspath(file_path)
+    roots = [os.path.abspath(p) for p in sys.path if len(p) != 0 and file_path.startswith(os.path.abspath(p) + os.sep)]
+    if len(roots) == 0:
+        return None
+    top_level = os.path.relpath(file_path, max(roots, key=len)).split(os.sep)[0]
+    return os.path.splitext(top_level)[0]
+
+
+def distribution_version(file_path: str) -> typing.Optional[str]:
+    """
+    :return: the name and version of the distribution that installed the file, if any.
+    """
+    top_level = _top_level(file_path)
+    distribution = _distribution(top_level) if top_level is not None else None
+    if distribution is None:
+        return None
+    return f"{distribution.metadata['Name']}=={distribution.version}"
+
+
+def distribution_is_editable(file_path: str) -> bool:
+    """
+    :return: whether the distribution that installed the file was installed in editable mode, such as python_util or
+    drools_py in a workspace.
+    """
+    top_level = _top_level(file_path)
+    return top_level is not None and _is_editable(top_level)
+
+
+def external_graph_cache_dir() -> typing.Optional[str]:
+    """
+    :return: the PYTHON_DI_EXTERNAL_GRAPH_CACHE environment variable, or ~/.cache/python_di/external_graphs. Setting the
+    variable to an empty value disables the cache.
+    """
+    if EXTERNAL_GRAPH_CACHE_ENV in os.environ.keys():
+        return os.environ[EXTERNAL_GRAPH_CACHE_ENV] if len(os.environ[EXTERNAL_GRAPH_CACHE_ENV]) != 0 else None
+    return os.path.join(os.path.expanduser('~'), '.cache', 'python_di', 'external_graphs')
+
+
+external_graph_cache = ExternalGraphCache(external_graph_cache_dir())
@@ -9,7 +9,9 @@ import networkx as nx
 from abc import ABC, abstractmethod
 
 import python_util.graph_util.graph_utils
+from python_di.reflect_scanner.graph_store import create_graph
 from python_di.reflect_scanner.module_graph_models import NodeType, FileNode, Import
+from python_di.reflect_scanner.scan_profile import ScanProfile
 from python_util.logger.logger import LoggerFacade
 
 
@@ -29,6 +31,12 @@ class ASTNodeParser(ABC):
     def matches(self, node) -> bool:
         pass
 
+    def scan_profile(self) -> ScanProfile:
+        """
+        :return: the least profile for which this parser runs.
+        """
+        return ScanProfile.COMPONENT_SCAN
+
 
 class ContinueParseLibraryChecker(abc.ABC):
     @abc.abstractmethod
@@ -46,7 +54,11 @@ class FileParser:
     @injector.inject
     def __init__(self, parsers: typing.List[ASTNodeParser]):
         self.parsers = parsers
-        self.graph = nx.DiGraph()
+        self.graph = create_graph()
+        self.scan_profile = ScanProfile.FULL
+
+    def set_scan_profile(self, scan_profile: ScanProfile):
+        self.scan_profile = scan_profile
 
     def visit_node(self, node, source_path, parent=None):
         if any([parser.matches(node) for parser in self.parsers]):
@@ -7,6 +7,7 @@ from python_util.logger.logger import LoggerFacade
 from python_di.reflect_scanner.module_graph_models import FileNode, NodeType, ArgFileNode, IntrospectedPathNode, \
     DecoratorFileNode
 from python_di.reflect_scanner.file_parser import ASTNodeParser
+from python_di.reflect_scanner.scan_profile import ScanProfile, retrieve_scan_profile
 import injector
 
 from python_di.reflect_scanner.statements_parser import AggregateStatementParser
@@ -73,8 +74,13 @@ class FnStatementParser:
     def __init__(self, stmt_parser: AggregateStatementParser):
         self.stmt_parser = stmt_parser
 
-    def parse_stmts(self, fn_node: FileNode, graph: nx.DiGraph, node: ast.FunctionDef):
-        statement_node = self.stmt_parser.parse_statement_node(node.body, fn_node.id_value, graph)
+    def parse_stmts(self, fn_node: FileNode, graph: nx.DiGraph, node: ast.FunctionDef,
+                    source_file: typing.Optional[str] = None):
+        """
+        :param source_file: the file the function was parsed from. If provided, only the span of the statements is
+        added to the graph, and the statements are parsed when retrieved from the statement node.
+        """
+        statement_node = self.stmt_parser.span_statement_node(node.body, fn_node.id_value, source_file)
         graph.add_node(statement_node)
         graph.add_edge(fn_node, statement_node)
 
@@ -94,8 +100,11 @@ class FunctionDefParser(ASTNodeParser):
         graph.add_node(fn_node)
         if parent is not None:
             graph.add_edge(parent, fn_node)
-        self.fn_args_parser.parse_args(fn_node, graph, node)
-        self.statement_parser.parse_stmts(fn_node, graph, node)
+        scan_profile = retrieve_scan_profile(parser)
+        if scan_profile.includes(ScanProfile.SIGNATURES):
+            self.fn_args_parser.parse_args(fn_node, graph, node)
+        if scan_profile.includes(ScanProfile.FULL):
+            self.statement_parser.parse_stmts(fn_node, graph, node, source_file=source)
 
         for decorator in node.decorator_list:
             if isinstance(decorator, ast.Call) and isinstance(decorator.func, ast.Name):
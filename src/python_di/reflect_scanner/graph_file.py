@@ -0,0 +1,333 @@
+import mmap
+import os
+import shutil
+import struct
+import threading
+import typing
+
+import numpy as np
+
+from python_di.reflect_scanner.module_graph_models import Node, NodeType, ProgramNode, FileNode, \
+    ClassFunctionProgramNode, DecoratorProgramNode, TypeConnectionProgramNode, ProgramStatementNode, intern_id
+
+GRAPH_FILE_MAGIC = b'PYDIGRPH'
+GRAPH_FILE_VERSION = 1
+
+# magic, version, number of strings, nodes and edges, and the offsets of the string offsets, the string data, the node
+# records, and the out and in CSR arrays.
+_HEADER = struct.Struct('<8sIQQQQQQQQQQ')
+_NODE_RECORD = struct.Struct('<hhIIiii')
+NODE_RECORD_DTYPE = np.dtype([('kind', '<i2'), ('node_type', '<i2'), ('id_value', '<u4'), ('source_file', '<u4'),
+                              ('first', '<i4'), ('second', '<i4'), ('line_no', '<i4')])
+NO_STRING = 0xFFFFFFFF
+
+_PROGRAM_NODE = 0
+_CLASS_FUNCTION_NODE = 1
+_DECORATOR_NODE = 2
+_TYPE_CONNECTION_NODE = 3
+_STATEMENT_NODE = 4
+_FILE_NODE = 5
+
+
+class ProgramGraphWriter:
+    """
+    Writes a program graph to the graph file format: a string table, a fixed size record for each node, and the out
+    and in adjacency of the nodes as CSR arrays. The node records and edges are appended to temporary files as they
+    are added, so that graphs can be written incrementally, and the file is written on close. Attributes of the nodes
+    that are not strings or node types, such as the introspected definition of a type connection, are not written.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._strings: dict[str, int] = {}
+        self._node_ids: dict[typing.Tuple, int] = {}
+        self._edge_keys: set[int] = set([])
+        self._tmp_prefix = f'{path}.{os.getpid()}.{threading.get_ident()}'
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._nodes_file = open(f'{self._tmp_prefix}.nodes.tmp', 'wb')
+        self._edges_file = open(f'{self._tmp_prefix}.edges.tmp', 'wb')
+
+    def __enter__(self) -> 'ProgramGraphWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._remove_tmp()
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self._node_ids)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self._edge_keys)
+
+    def add_graph(self, graph):
+        """
+        :param graph: a networkx DiGraph, CompactDiGraph or MappedDiGraph, with nodes and edges added to the nodes and
+        edges already written.
+        """
+        for node in graph.nodes:
+            self.add_node(node)
+        for u, v in graph.edges():
+            self.add_edge(u, v)
+
+    def add_node(self, node: Node) -> int:
+        record = self._to_record(node)
+        node_id = self._node_ids.get(record)
+        if node_id is None:
+            node_id = len(self._node_ids)
+            self._node_ids[record] = node_id
+            self._nodes_file.write(_NODE_RECORD.pack(*record))
+        return node_id
+
+    def add_edge(self, u: Node, v: Node):
+        u_id = self.add_node(u)
+        v_id = self.add_node(v)
+        key = (u_id << 32) | v_id
+        if key not in self._edge_keys:
+            self._edge_keys.add(key)
+            self._edges_file.write(struct.pack('<II', u_id, v_id))
+
+    def close(self):
+        self._nodes_file.close()
+        self._edges_file.close()
+        try:
+            edges = np.fromfile(self._edges_file.name, dtype='<u4').reshape(-1, 2)
+            out_indptr, out_indices = _to_csr(edges[:, 0], edges[:, 1], self.num_nodes)
+            in_indptr, in_indices = _to_csr(edges[:, 1], edges[:, 0], self.num_nodes)
+            encoded = [s.encode('utf-8', errors='surrogatepass') for s in self._strings.keys()]
+            string_offsets = np.zeros(len(encoded) + 1, dtype='<u8')
+            np.cumsum([len(e) for e in encoded], out=string_offsets[1:])
+
+            tmp_path = f'{self._tmp_prefix}.tmp'
+            with open(tmp_path, 'wb') as graph_file:
+                graph_file.write(b'\x00' * _HEADER.size)
+                offsets = [_write_aligned(graph_file, string_offsets.tobytes()),
+                           _write_aligned(graph_file, b''.join(encoded))]
+                offsets.append(_write_aligned(graph_file, b''))
+                with open(self._nodes_file.name, 'rb') as nodes_file:
+                    shutil.copyfileobj(nodes_file, graph_file)
+                offsets.extend([_write_aligned(graph_file, a.tobytes())
+                                for a in [out_indptr, out_indices, in_indptr, in_indices]])
+                graph_file.seek(0)
+                graph_file.write(_HEADER.pack(GRAPH_FILE_MAGIC, GRAPH_FILE_VERSION, len(encoded), self.num_nodes,
+                                              self.num_edges, *offsets))
+            os.replace(tmp_path, self.path)
+        finally:
+            self._remove_tmp()
+
+    def _remove_tmp(self):
+        for f in [self._nodes_file, self._edges_file]:
+            f.close()
+            if os.path.exists(f.name):
+                os.remove(f.name)
+
+    def _string(self, value: typing.Optional[str]) -> int:
+        if value is None:
+            return NO_STRING
+        value = str(value)
+        string_id = self._strings.get(value)
+        if string_id is None:
+            string_id = len(self._strings)
+            self._strings[value] = string_id
+        return string_id
+
+    def _to_record(self, node: Node) -> typing.Tuple[int, int, int, int, int, int, int]:
+        node_type = node.node_type.value
+        if isinstance(node, ProgramNode):
+            line_no = node.line_no if isinstance(node.line_no, int) else -1
+            source_file = self._string(node.source_file)
+            if isinstance(node, ClassFunctionProgramNode):
+                return (_CLASS_FUNCTION_NODE, node_type, self._string(node.id_value), source_file,
+                        self._string(node.class_id), -1, line_no)
+            elif isinstance(node, DecoratorProgramNode):
+                return (_DECORATOR_NODE, node_type, self._string(node.id_value), source_file,
+                        self._string(node.decorated_id), node.decorated_ty.value, line_no)
+            elif isinstance(node, TypeConnectionProgramNode):
+                return _TYPE_CONNECTION_NODE, node_type, self._string(node.id_value), source_file, -1, -1, line_no
+            elif isinstance(node, ProgramStatementNode):
+                return _STATEMENT_NODE, node_type, self._string(node.id_value), source_file, -1, -1, line_no
+            return _PROGRAM_NODE, node_type, self._string(node.id_value), source_file, -1, -1, line_no
+        elif isinstance(node, FileNode):
+            return _FILE_NODE, node_type, self._string(node.id_value), NO_STRING, -1, -1, -1
+        raise ValueError(f"Could not write node of type {type(node)} to a graph file.")
+
+
+def _write_aligned(graph_file, data: bytes) -> int:
+    padding = -graph_file.tell() % 8
+    graph_file.write(b'\x00' * padding)
+    offset = graph_file.tell()
+    graph_file.write(data)
+    return offset
+
+
+def _to_csr(src: np.ndarray, dst: np.ndarray, num_nodes: int) -> typing.Tuple[np.ndarray, np.ndarray]:
+    order = np.argsort(src, kind='stable')
+    indptr = np.zeros(num_nodes + 1, dtype='<u8')
+    np.cumsum(np.bincount(src, minlength=num_nodes), out=indptr[1:])
+    return indptr, dst[order].astype('<u4')
+
+
+class MappedDiGraph:
+    """
+    A program graph read from a graph file through mmap. The arrays of the file are viewed in place, and the nodes are
+    created only when they are retrieved, so queries over a large graph touch only the pages they read. It provides
+    the read-only subset of the networkx DiGraph interface used by the graph scanners. The graph is never modified, so
+    its version is always 0.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.version = 0
+        with open(path, 'rb') as graph_file:
+            self._mmap = mmap.mmap(graph_file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, num_strings, num_nodes, num_edges, string_offsets, string_data, nodes, out_indptr,
+         out_indices, in_indptr, in_indices) = _HEADER.unpack_from(self._mmap, 0)
+        if magic != GRAPH_FILE_MAGIC or version != GRAPH_FILE_VERSION:
+            raise ValueError(f"{path} is not a version {GRAPH_FILE_VERSION} graph file.")
+        self._string_offsets = np.frombuffer(self._mmap, dtype='<u8', count=num_strings + 1, offset=string_offsets)
+        self._string_data = string_data
+        self._records = np.frombuffer(self._mmap, dtype=NODE_RECORD_DTYPE, count=num_nodes, offset=nodes)
+        self._out = (np.frombuffer(self._mmap, dtype='<u8', count=num_nodes + 1, offset=out_indptr),
+                     np.frombuffer(self._mmap, dtype='<u4', count=num_edges, offset=out_indices))
+        self._in = (np.frombuffer(self._mmap, dtype='<u8', count=num_nodes + 1, offset=in_indptr),
+                    np.frombuffer(self._mmap, dtype='<u4', count=num_edges, offset=in_indices))
+        self._num_edges = num_edges
+        self._nodes: dict[int, Node] = {}
+        self._ids: dict[Node, int] = {}
+        self._string_ids: typing.Optional[dict[str, int]] = None
+
+    @property
+    def nodes(self) -> list[Node]:
+        return [self._node(i) for i in range(len(self._records))]
+
+    def has_node(self, node: Node) -> bool:
+        return self._node_id(node) is not None
+
+    def has_edge(self, u: Node, v: Node) -> bool:
+        v_id = self._node_id(v)
+        return v_id is not None and v_id in self._adjacent(u, self._out)
+
+    def number_of_nodes(self) -> int:
+        return len(self._records)
+
+    def number_of_edges(self) -> int:
+        return self._num_edges
+
+    def successors(self, node: Node) -> typing.Iterator[Node]:
+        return iter([self._node(int(i)) for i in self._adjacent(node, self._out)])
+
+    def predecessors(self, node: Node) -> typing.Iterator[Node]:
+        return iter([self._node(int(i)) for i in self._adjacent(node, self._in)])
+
+    def out_edges(self, node: typing.Optional[Node] = None) -> list[typing.Tuple[Node, Node]]:
+        if node is None:
+            indptr, indices = self._out
+            return [(self._node(u), self._node(int(v))) for u in range(len(self._records))
+                    for v in indices[indptr[u]:indptr[u + 1]]]
+        return [(node, self._node(int(i))) for i in self._adjacent(node, self._out)]
+
+    def in_edges(self, node: typing.Optional[Node] = None) -> list[typing.Tuple[Node, Node]]:
+        if node is None:
+            return self.out_edges()
+        return [(self._node(int(i)), node) for i in self._adjacent(node, self._in)]
+
+    def edges(self, node: typing.Optional[Node] = None) -> list[typing.Tuple[Node, Node]]:
+        return self.out_edges(node)
+
+    def nodes_of_type(self, node_type: NodeType) -> list[Node]:
+        return [self._node(int(i)) for i in np.flatnonzero(self._records['node_type'] == node_type.value)]
+
+    def to_networkx(self):
+        import networkx as nx
+        graph = nx.DiGraph()
+        graph.add_nodes_from(self.nodes)
+        graph.add_edges_from(self.out_edges())
+        return graph
+
+    def close(self):
+        self._records = None
+        self._string_offsets = None
+        self._out = None
+        self._in = None
+        self._mmap.close()
+
+    def __contains__(self, node) -> bool:
+        return self.has_node(node)
+
+    def __iter__(self) -> typing.Iterator[Node]:
+        return iter(self.nodes)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def _string(self, string_id: int) -> typing.Optional[str]:
+        if string_id == NO_STRING:
+            return None
+        start = self._string_data + int(self._string_offsets[string_id])
+        end = self._string_data + int(self._string_offsets[string_id + 1])
+        return intern_id(self._mmap[start:end].decode('utf-8', errors='surrogatepass'))
+
+    def _node(self, node_id: int) -> Node:
+        node = self._nodes.get(node_id)
+        if node is None:
+            node = self._create_node(self._records[node_id])
+            self._nodes[node_id] = node
+            self._ids.setdefault(node, node_id)
+        return node
+
+    def _create_node(self, record) -> Node:
+        kind = int(record['kind'])
+        node_type = NodeType(int(record['node_type']))
+        id_value = self._string(int(record['id_value']))
+        source_file = self._string(int(record['source_file']))
+        line_no = int(record['line_no'])
+        if kind == _CLASS_FUNCTION_NODE:
+            return ClassFunctionProgramNode(self._string(int(record['first'])), source_file, id_value, line_no)
+        elif kind == _DECORATOR_NODE:
+            return DecoratorProgramNode(id_value, self._string(int(record['first'])), source_file,
+                                        NodeType(int(record['second'])))
+        elif kind == _TYPE_CONNECTION_NODE:
+            return TypeConnectionProgramNode(source_file, id_value, None, line_no)
+        elif kind == _STATEMENT_NODE:
+            return ProgramStatementNode(line_no, id_value, None, source_file)
+        elif kind == _FILE_NODE:
+            return FileNode(node_type, id_value)
+        return ProgramNode(node_type, source_file, id_value, line_no)
+
+    def _node_id(self, node: Node) -> typing.Optional[int]:
+        """
+        Find the node by its node type, id and source file if it was not created by this graph.
+        """
+        node_id = self._ids.get(node)
+        if node_id is not None:
+            return node_id
+        if self._string_ids is None:
+            self._string_ids = {self._string(i): i for i in range(len(self._string_offsets) - 1)}
+        string_id = self._string_ids.get(node.id_value)
+        if string_id is None:
+            return None
+        for candidate in np.flatnonzero((self._records['id_value'] == string_id)
+                                        & (self._records['node_type'] == node.node_type.value)):
+            if hash(self._node(int(candidate))) == hash(node) and self._node(int(candidate)) == node:
+                return int(candidate)
+        return None
+
+    def _adjacent(self, node: Node, csr: typing.Tuple[np.ndarray, np.ndarray]) -> np.ndarray:
+        node_id = self._node_id(node)
+        if node_id is None:
+            return csr[1][:0]
+        indptr, indices = csr
+        return indices[indptr[node_id]:indptr[node_id + 1]]
+
+
+def write_program_graph(graph, path: str):
+    with ProgramGraphWriter(path) as writer:
+        writer.add_graph(graph)
+
+
+def load_program_graph(path: str) -> MappedDiGraph:
+    return MappedDiGraph(path)
@@ -0,0 +1,349 @@
+import typing
+import weakref
+
+import numpy as np
+
+from python_di.reflect_scanner.graph_store import nodes_of_type
+from python_di.reflect_scanner.module_graph_models import Node, NodeType
+
+KeyT = typing.TypeVar("KeyT", bound=typing.Hashable)
+
+_ONE = np.uint64(1)
+
+
+class ReachabilityIndex(typing.Generic[KeyT]):
+    """
+    Transitive closure of a relation between keys. The keys are given integer ids, and the keys reachable from each
+    key are held as a row of bits, so whether one key reaches another is a single bit test and the keys reachable from
+    a key are read from its row. The closure is built over the strongly connected components in topological order,
+    and edges added afterwards are applied to the rows incrementally. Removing an edge rebuilds the closure.
+    It takes a bit for each pair of keys, so it is meant for the classes and modules of a program, not every node.
+    """
+
+    def __init__(self):
+        self._ids: dict[KeyT, int] = {}
+        self._keys: list[KeyT] = []
+        self._edges: set[typing.Tuple[int, int]] = set([])
+        self._reach = np.zeros((0, 0), dtype='<u8')
+
+    def __contains__(self, key) -> bool:
+        return key in self._ids
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @property
+    def keys(self) -> list[KeyT]:
+        return self._keys
+
+    def add_key(self, key: KeyT) -> int:
+        key_id = self._ids.get(key)
+        if key_id is None:
+            key_id = len(self._keys)
+            self._ids[key] = key_id
+            self._keys.append(key)
+            self._grow(len(self._keys))
+        return key_id
+
+    def add_edge(self, u: KeyT, v: KeyT):
+        """
+        Add the edge u -> v, so that u and every key reaching u also reach v and every key v reaches.
+        """
+        u_id = self.add_key(u)
+        v_id = self.add_key(v)
+        if (u_id, v_id) in self._edges:
+            return
+        self._edges.add((u_id, v_id))
+        if self._bit(u_id, v_id):
+            return
+        row = self._reach[v_id].copy()
+        row[v_id >> 6] |= _ONE << np.uint64(v_id & 63)
+        sources = np.append(self._reaching_ids(u_id), u_id)
+        self._reach[sources] |= row
+
+    def set_edges(self, edges: typing.Iterable[typing.Tuple[KeyT, KeyT]]):
+        """
+        Update the index to the edges, adding the new edges incrementally, or rebuilding the closure if an edge was
+        removed or most of the edges are new.
+        """
+        edge_ids = set([(self.add_key(u), self.add_key(v)) for u, v in edges])
+        added = edge_ids - self._edges
+        if len(self._edges - edge_ids) != 0 or len(added) > len(self._edges):
+            self._edges = edge_ids
+            self._build()
+        else:
+            for u_id, v_id in added:
+                self.add_edge(self._keys[u_id], self._keys[v_id])
+
+    def reaches(self, u: KeyT, v: KeyT) -> bool:
+        u_id = self._ids.get(u)
+        v_id = self._ids.get(v)
+        return u_id is not None and v_id is not None and self._bit(u_id, v_id)
+
+    def reachable(self, u: KeyT) -> list[KeyT]:
+        """
+        :return: the keys reachable from u, through one or more edges.
+        """
+        u_id = self._ids.get(u)
+        if u_id is None:
+            return []
+        bits = np.unpackbits(self._reach[u_id].view(np.uint8), bitorder='little')
+        return [self._keys[i] for i in np.flatnonzero(bits[:len(self._keys)])]
+
+    def reaching(self, v: KeyT) -> list[KeyT]:
+        """
+        :return: the keys from which v is reachable, through one or more edges.
+        """
+        v_id = self._ids.get(v)
+        if v_id is None:
+            return []
+        return [self._keys[i] for i in self._reaching_ids(v_id)]
+
+    def _bit(self, u_id: int, v_id: int) -> bool:
+        return bool((self._reach[u_id, v_id >> 6] >> np.uint64(v_id & 63)) & _ONE)
+
+    def _reaching_ids(self, v_id: int) -> np.ndarray:
+        column = self._reach[:len(self._keys), v_id >> 6]
+        return np.flatnonzero((column >> np.uint64(v_id & 63)) & _ONE)
+
+    def _grow(self, num_keys: int):
+        capacity, words = self._reach.shape
+        if num_keys <= capacity:
+            return
+        next_capacity = max(64, capacity * 2)
+        reach = np.zeros((next_capacity, next_capacity // 64), dtype='<u8')
+        reach[:capacity, :words] = self._reach
+        self._reach = reach
+
+    def _build(self):
+        num_keys = len(self._keys)
+        adjacency: list[list[int]] = [[] for _ in range(num_keys)]
+        for u_id, v_id in self._edges:
+            adjacency[u_id].append(v_id)
+        self._reach[:] = 0
+        component_of = [-1] * num_keys
+        rows = []
+        # the components are found sinks first, so the rows of the components they reach are already built.
+        for component in _strongly_connected(adjacency):
+            component_id = len(rows)
+            row = np.zeros(self._reach.shape[1], dtype='<u8')
+            cyclic = len(component) > 1
+            for member in component:
+                component_of[member] = component_id
+            for member in component:
+                for v_id in adjacency[member]:
+                    if component_of[v_id] != component_id:
+                        row |= rows[component_of[v_id]]
+                    elif v_id == member:
+                        cyclic = True
+                    row[v_id >> 6] |= _ONE << np.uint64(v_id & 63)
+            if cyclic:
+                for member in component:
+                    row[member >> 6] |= _ONE << np.uint64(member & 63)
+            rows.append(row)
+            self._reach[component] = row
+
+
+def _strongly_connected(adjacency: list[list[int]]) -> list[list[int]]:
+    """
+    :return: the strongly connected components, by Tarjan's algorithm without recursion, each after the components
+    it reaches.
+    """
+    index = [-1] * len(adjacency)
+    low = [0] * len(adjacency)
+    on_stack = [False] * len(adjacency)
+    stack = []
+    components = []
+    counter = 0
+    for root in range(len(adjacency)):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, 0)]
+        while len(work) != 0:
+            node, i = work[-1]
+            if i < len(adjacency[node]):
+                work[-1] = (node, i + 1)
+                w = adjacency[node][i]
+                if index[w] == -1:
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = True
+                    work.append((w, 0))
+                elif on_stack[w]:
+                    low[node] = min(low[node], index[w])
+            else:
+                work.pop()
+                if len(work) != 0:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = False
+                        component.append(w)
+                        if w == node:
+                            break
+                    components.append(component)
+    return components
+
+
+ClassKey = typing.Tuple[typing.Optional[str], str]
+
+
+def _class_key(node: Node) -> ClassKey:
+    return getattr(node, 'source_file', None), node.id_value
+
+
+def _successors_of_type(graph, node: Node, node_type: NodeType) -> list[Node]:
+    return [to_ for _, to_ in graph.out_edges(node) if to_.node_type == node_type]
+
+
+class GraphReachability:
+    """
+    The class inheritance and module import reachability of a file or program graph. The classes are keyed by their
+    source file and name, with the base classes resolved through the imported dependency or same source dependency
+    nodes of the program graph, and otherwise by name. The modules are keyed by their source file. If the graph has a
+    version, incremented when it is modified as by CompactDiGraph, the index is updated when the version changes.
+    Otherwise, as for a networkx graph, it is updated when the number of nodes or edges changes, and an edge replaced
+    by another, leaving the counts the same, requires invalidate.
+    """
+
+    def __init__(self):
+        self.inheritance: ReachabilityIndex[ClassKey] = ReachabilityIndex()
+        self.imports: ReachabilityIndex[str] = ReachabilityIndex()
+        self._classes: dict[ClassKey, Node] = {}
+        self._class_names: dict[str, set[ClassKey]] = {}
+        self._modules: dict[str, Node] = {}
+        self._signature = None
+
+    def invalidate(self):
+        """
+        Read the graph again on the next update, after it was modified without changing its version or size.
+        """
+        self._signature = None
+
+    def update(self, graph):
+        signature = self._graph_signature(graph)
+        if signature == self._signature:
+            return
+        self._signature = signature
+        self._classes = {}
+        self._class_names = {}
+        self._modules = {}
+        for c in nodes_of_type(graph, NodeType.CLASS):
+            self._classes.setdefault(_class_key(c), c)
+            self._class_names.setdefault(c.id_value, set([])).add(_class_key(c))
+        inheritance_edges = set([])
+        for key, c in self._classes.items():
+            for base in _successors_of_type(graph, c, NodeType.BASE_CLASS):
+                for base_key in self._resolve_base(graph, base):
+                    if base_key != key:
+                        inheritance_edges.add((key, base_key))
+                        self._class_names.setdefault(base_key[1], set([])).add(base_key)
+        self.inheritance.set_edges(inheritance_edges)
+
+        import_edges = set([])
+        for m in nodes_of_type(graph, NodeType.MODULE):
+            source_file = getattr(m, 'source_file', m.id_value)
+            self._modules.setdefault(source_file, m)
+            for imported in _successors_of_type(graph, m, NodeType.MODULE):
+                imported_file = getattr(imported, 'source_file', imported.id_value)
+                if imported_file != source_file:
+                    import_edges.add((source_file, imported_file))
+        self.imports.set_edges(import_edges)
+
+    @classmethod
+    def _graph_signature(cls, graph):
+        version = getattr(graph, 'version', None)
+        if version is not None:
+            return version
+        return graph.number_of_nodes(), graph.number_of_edges()
+
+    def subclasses(self, base: typing.Union[typing.Type, str, Node]) -> list[Node]:
+        """
+        :param base: the base class, or its name, or its class node.
+        :return: the class nodes that inherit from the base directly or through other classes.
+        """
+        found = {}
+        for base_key in self._base_keys(base):
+            for key in self.inheritance.reaching(base_key):
+                if key in self._classes.keys():
+                    found[key] = self._classes[key]
+        return list(found.values())
+
+    def is_subclass(self, node: Node, base: typing.Union[typing.Type, str, Node]) -> bool:
+        return any([self.inheritance.reaches(_class_key(node), base_key) for base_key in self._base_keys(base)])
+
+    def base_classes(self, node: Node) -> list[ClassKey]:
+        """
+        :return: the source file and name of the classes the class inherits from, with no source file if the base class
+        could not be resolved to one.
+        """
+        return self.inheritance.reachable(_class_key(node))
+
+    def importing_modules(self, source_file: str) -> list[Node]:
+        """
+        :return: the module nodes that import the module directly or through other modules, the modules affected by
+        changing it.
+        """
+        return [self._modules[m] for m in self.imports.reaching(source_file) if m in self._modules.keys()]
+
+    def imported_modules(self, source_file: str) -> list[str]:
+        return self.imports.reachable(source_file)
+
+    def _base_keys(self, base: typing.Union[typing.Type, str, Node]) -> set[ClassKey]:
+        if isinstance(base, Node):
+            return {_class_key(base)}
+        name = base if isinstance(base, str) else base.__name__
+        return self._class_names.get(name, set([]))
+
+    def _resolve_base(self, graph, base: Node) -> list[ClassKey]:
+        source_file = getattr(base, 'source_file', None)
+        modules = set([])
+        same_src = False
+        for dependency in graph.out_edges(base):
+            dependency = dependency[1]
+            if dependency.node_type == NodeType.IMPORTED_DEPENDENCY:
+                modules.update([m.source_file for m in _successors_of_type(graph, dependency, NodeType.MODULE)])
+            elif dependency.node_type == NodeType.SAME_SRC_DEPENDENCY:
+                same_src = True
+        candidates = self._class_names.get(base.id_value, set([]))
+        resolved = [k for k in candidates if k[0] in modules or (same_src and k[0] == source_file)]
+        if len(resolved) != 0:
+            return resolved
+        if len(modules) != 0:
+            return [(m, base.id_value) for m in sorted(modules)]
+        same_file = [k for k in candidates if k[0] == source_file]
+        if len(same_file) != 0:
+            return same_file
+        return list(candidates) if len(candidates) != 0 else [(None, base.id_value)]
+
+
+_graph_reachability = weakref.WeakKeyDictionary()
+
+
+def graph_reachability(graph) -> GraphReachability:
+    """
+    :return: the reachability index of the graph, built on first use and updated if the graph changed since.
+    """
+    reachability = _graph_reachability.get(graph)
+    if reachability is None:
+        reachability = GraphReachability()
+        _graph_reachability[graph] = reachability
+    reachability.update(graph)
+    return reachability
+
+
+def invalidate_graph_reachability(graph):
+    """
+    Rebuild the reachability index of the graph when it is next retrieved, after edges of the graph were replaced.
+    """
+    reachability = _graph_reachability.get(graph)
+    if reachability is not None:
+        reachability.invalidate()
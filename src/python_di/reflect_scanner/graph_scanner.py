@@ -4,6 +4,8 @@ import typing
 import networkx as nx
 
 from python_util.logger.logger import LoggerFacade
+from python_di.reflect_scanner.graph_reachability import graph_reachability
+from python_di.reflect_scanner.graph_store import nodes_of_type
 from python_di.reflect_scanner.module_graph_models import Node, GraphType, FileNode, NodeType, ProgramNode
 
 
@@ -103,7 +105,13 @@ class GraphScanner(abc.ABC, typing.Generic[GraphScannerArgsT]):
 
 
 class SubclassesOfGraphScannerArgs(GraphScannerArgs):
-    def __init__(self, super_class: typing.Type, graph: nx.DiGraph, graph_type: GraphType):
+    def __init__(self, super_class: typing.Type, graph: nx.DiGraph, graph_type: GraphType,
+                 transitive: bool = False):
+        """
+        :param transitive: also retrieve the classes inheriting from the super class through other classes, matched by
+        name rather than by name and module.
+        """
+        self.transitive = transitive
         self.graph_type = graph_type
         self.graph = graph
         self.super_class = super_class
@@ -116,6 +124,18 @@ class DecoratorOfGraphScannerArgs(GraphScannerArgs):
         self.graph = graph
 
 
+class DecoratorsOfGraphScannerArgs(GraphScannerArgs):
+    def __init__(self, decorator_ids: typing.Collection[str], graph: nx.DiGraph, graph_type: GraphType):
+        self.decorator_ids = decorator_ids
+        self.graph_type = graph_type
+        self.graph = graph
+
+
+class DecoratorsOfGraphScannerResult:
+    def __init__(self, nodes: dict[str, list[Node]]):
+        self.nodes = nodes
+
+
 class FunctionsOfGraphScannerArgs(GraphScannerArgs):
     def __init__(self, graph: nx.DiGraph, graph_type: GraphType):
         self.graph_type = graph_type
@@ -130,6 +150,14 @@ class ModulesOfNodesArgs(GraphScannerArgs):
         self.graph = graph
 
 
+class ImportingModulesArgs(GraphScannerArgs):
+    def __init__(self, graph: nx.DiGraph, graph_type: GraphType,
+                 source_files: list[str]):
+        self.source_files = source_files
+        self.graph_type = graph_type
+        self.graph = graph
+
+
 class ImportFromNodesArgs(GraphScannerArgs):
     def __init__(self, graph: nx.DiGraph, graph_type: GraphType,
                  nodes: list[Node]):
@@ -157,17 +185,15 @@ def _is_import_node(node: Node):
 
 def retrieve_classes(file_parser: nx.DiGraph, graph_type: GraphType = GraphType.File) -> list[Node]:
     return_classes = []
-    for node in file_parser.nodes:
-        is_class_node = _is_class_node(node)
-        matches_node_type = matches(node, graph_type)
-        if is_class_node and matches_node_type:
+    for node in nodes_of_type(file_parser, NodeType.CLASS):
+        if matches(node, graph_type):
             return_classes.append(node)
     return return_classes
 
 
 def retrieve_functions(file_parser: nx.DiGraph, graph_type: GraphType = GraphType.File) -> list[Node]:
-    returned_functions = list(filter(lambda node: node._node_type == NodeType.FUNCTION and matches(node, graph_type),
-                                     file_parser.nodes))
+    returned_functions = list(filter(lambda node: matches(node, graph_type),
+                                     nodes_of_type(file_parser, NodeType.FUNCTION)))
     return returned_functions
 
 
@@ -222,6 +248,25 @@ def retrieve_subclasses(file_parser: nx.DiGraph, superclass_name: typing.Type,
     ]
 
 
+def retrieve_transitive_subclasses(file_parser: nx.DiGraph, superclass: typing.Type,
+                                   graph_type: GraphType = GraphType.File) -> list[Node]:
+    return [c for c in graph_reachability(file_parser).subclasses(superclass) if matches(c, graph_type)]
+
+
+def retrieve_importing_modules(file_parser: nx.DiGraph, source_files: typing.Iterable[str],
+                               graph_type: GraphType = GraphType.File) -> list[Node]:
+    """
+    :return: the modules importing any of the source files, directly or through other modules.
+    """
+    reachability = graph_reachability(file_parser)
+    found = {}
+    for source_file in source_files:
+        for m in reachability.importing_modules(source_file):
+            if matches(m, graph_type):
+                found[getattr(m, 'source_file', m.id_value)] = m
+    return list(found.values())
+
+
 def retrieve_classes_decorated_by(file_parser: nx.DiGraph, decorator_id: str,
                                   graph_type: GraphType = GraphType.File) -> list[Node]:
     return [
@@ -238,8 +283,30 @@ def retrieve_functions_decorated_by(file_parser: nx.DiGraph, decorator_id: str,
     ]
 
 
+def retrieve_decorated_by_ids(file_parser: nx.DiGraph, decorator_ids: typing.Collection[str],
+                              graph_type: GraphType = GraphType.File) -> dict[str, list[Node]]:
+    """
+    Retrieve the classes and functions decorated by each of the decorator ids in one pass over the graph.
+    :return: the classes and then the functions decorated by each decorator id, as retrieve_classes_decorated_by and
+    retrieve_functions_decorated_by would return for each.
+    """
+    decorated = {decorator_id: [] for decorator_id in decorator_ids}
+    for c in [*retrieve_classes(file_parser, graph_type), *retrieve_functions(file_parser, graph_type)]:
+        found = set([])
+        for from_, to_ in file_parser.edges(c):
+            if (to_._node_type == NodeType.DECORATOR and to_.id_value in decorated.keys()
+                    and to_.id_value not in found and matches(to_, graph_type)):
+                found.add(to_.id_value)
+                decorated[to_.id_value].append(c)
+    return decorated
+
+
 class SubclassesOfGraphScanner(GraphScanner[SubclassesOfGraphScannerArgs]):
     def do_scan(self, graph_scanner_args: SubclassesOfGraphScannerArgs) -> GraphScannerResult:
+        if graph_scanner_args.transitive:
+            return GraphScannerResult(retrieve_transitive_subclasses(graph_scanner_args.graph,
+                                                                     graph_scanner_args.super_class,
+                                                                     graph_scanner_args.graph_type))
         out = retrieve_subclasses(graph_scanner_args.graph, graph_scanner_args.super_class,
                                   graph_scanner_args.graph_type)
         return GraphScannerResult(out)
@@ -255,6 +322,13 @@ class DecoratorOfGraphScanner(GraphScanner[DecoratorOfGraphScannerArgs]):
         return GraphScannerResult(out)
 
 
+class DecoratorsOfGraphScanner(GraphScanner[DecoratorsOfGraphScannerArgs]):
+    def do_scan(self, graph_scanner_args: DecoratorsOfGraphScannerArgs) -> DecoratorsOfGraphScannerResult:
+        return DecoratorsOfGraphScannerResult(retrieve_decorated_by_ids(graph_scanner_args.graph,
+                                                                        graph_scanner_args.decorator_ids,
+                                                                        graph_scanner_args.graph_type))
+
+
 class FunctionsOfGraphScanner(GraphScanner[SubclassesOfGraphScannerArgs]):
     def do_scan(self, graph_scanner_args: FunctionsOfGraphScannerArgs) -> GraphScannerResult:
         out = retrieve_functions(graph_scanner_args.graph, graph_scanner_args.graph_type)
@@ -275,3 +349,9 @@ class ImportGraphScanner(GraphScanner[ImportFromNodesArgs]):
             (retrieve_import(graph_scanner_args.graph, n, graph_scanner_args.graph_type), n)
             for n in graph_scanner_args.nodes
         ])
+
+
+class ImportingModulesGraphScanner(GraphScanner[ImportingModulesArgs]):
+    def do_scan(self, graph_scanner_args: ImportingModulesArgs) -> GraphScannerResult:
+        return GraphScannerResult(retrieve_importing_modules(graph_scanner_args.graph, graph_scanner_args.source_files,
+                                                             graph_scanner_args.graph_type))
@@ -0,0 +1,179 @@
+import array
+import os
+import typing
+
+import numpy as np
+
+from python_di.reflect_scanner.module_graph_models import Node, NodeType
+
+GRAPH_BACKEND_ENV = 'PYTHON_DI_GRAPH_BACKEND'
+NETWORKX_BACKEND = 'networkx'
+COMPACT_BACKEND = 'compact'
+
+
+class CompactDiGraph:
+    """
+    Directed graph of reflect_scanner nodes with integer node ids, an array of node types, and CSR adjacency in both
+    directions. It provides the subset of the networkx DiGraph interface used by the parsers and graph scanners. Nodes
+    and edges are appended while parsing, and the adjacency arrays are rebuilt on the first query after a change.
+    Node and edge attributes are not stored. The version is incremented when a node or edge is added, so indexes
+    over the graph know when to update.
+    """
+
+    def __init__(self):
+        self.version = 0
+        self._ids: dict[Node, int] = {}
+        self._nodes: list[Node] = []
+        self._node_types = array.array('h')
+        self._src = array.array('q')
+        self._dst = array.array('q')
+        self._edge_keys: set[int] = set()
+        self._out: typing.Optional[typing.Tuple[np.ndarray, np.ndarray]] = None
+        self._in: typing.Optional[typing.Tuple[np.ndarray, np.ndarray]] = None
+        self._types: typing.Optional[np.ndarray] = None
+
+    @property
+    def nodes(self) -> typing.KeysView[Node]:
+        return self._ids.keys()
+
+    def add_node(self, node: Node, **attr) -> int:
+        node_id = self._ids.get(node)
+        if node_id is None:
+            node_id = len(self._nodes)
+            self._ids[node] = node_id
+            self._nodes.append(node)
+            self._node_types.append(_node_type_code(node))
+            self._types = None
+            self.version += 1
+        return node_id
+
+    def add_edge(self, u: Node, v: Node, **attr):
+        u_id = self.add_node(u)
+        v_id = self.add_node(v)
+        key = (u_id << 32) | v_id
+        if key not in self._edge_keys:
+            self._edge_keys.add(key)
+            self._src.append(u_id)
+            self._dst.append(v_id)
+            self._out = None
+            self._in = None
+            self.version += 1
+
+    def has_node(self, node: Node) -> bool:
+        return node in self._ids
+
+    def has_edge(self, u: Node, v: Node) -> bool:
+        u_id = self._ids.get(u)
+        v_id = self._ids.get(v)
+        return u_id is not None and v_id is not None and ((u_id << 32) | v_id) in self._edge_keys
+
+    def number_of_nodes(self) -> int:
+        return len(self._nodes)
+
+    def number_of_edges(self) -> int:
+        return len(self._src)
+
+    def successors(self, node: Node) -> typing.Iterator[Node]:
+        return iter([self._nodes[i] for i in self._adjacent(node, self._out_csr())])
+
+    def predecessors(self, node: Node) -> typing.Iterator[Node]:
+        return iter([self._nodes[i] for i in self._adjacent(node, self._in_csr())])
+
+    def out_edges(self, node: typing.Optional[Node] = None) -> list[typing.Tuple[Node, Node]]:
+        if node is None:
+            return [(self._nodes[u], self._nodes[v]) for u, v in zip(self._src, self._dst)]
+        return [(node, self._nodes[i]) for i in self._adjacent(node, self._out_csr())]
+
+    def in_edges(self, node: typing.Optional[Node] = None) -> list[typing.Tuple[Node, Node]]:
+        if node is None:
+            return self.out_edges()
+        return [(self._nodes[i], node) for i in self._adjacent(node, self._in_csr())]
+
+    def edges(self, node: typing.Optional[Node] = None) -> list[typing.Tuple[Node, Node]]:
+        return self.out_edges(node)
+
+    def nodes_of_type(self, node_type: NodeType) -> list[Node]:
+        if self._types is None:
+            self._types = np.frombuffer(self._node_types, dtype=np.int16).copy()
+        return [self._nodes[i] for i in np.flatnonzero(self._types == node_type.value)]
+
+    def to_networkx(self):
+        import networkx as nx
+        graph = nx.DiGraph()
+        graph.add_nodes_from(self._nodes)
+        graph.add_edges_from(self.out_edges())
+        return graph
+
+    def __contains__(self, node) -> bool:
+        return node in self._ids
+
+    def __iter__(self) -> typing.Iterator[Node]:
+        return iter(self._ids.keys())
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def _adjacent(self, node: Node, csr: typing.Tuple[np.ndarray, np.ndarray]) -> np.ndarray:
+        node_id = self._ids.get(node)
+        if node_id is None:
+            return csr[1][:0]
+        indptr, indices = csr
+        return indices[indptr[node_id]:indptr[node_id + 1]]
+
+    def _out_csr(self) -> typing.Tuple[np.ndarray, np.ndarray]:
+        if self._out is None:
+            self._out = _to_csr(self._src, self._dst, len(self._nodes))
+        return self._out
+
+    def _in_csr(self) -> typing.Tuple[np.ndarray, np.ndarray]:
+        if self._in is None:
+            self._in = _to_csr(self._dst, self._src, len(self._nodes))
+        return self._in
+
+
+def _to_csr(src: array.array, dst: array.array, num_nodes: int) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """
+    :return: indptr, where the neighbors of node i are indices[indptr[i]:indptr[i + 1]], in insertion order.
+    """
+    src_values = np.frombuffer(src, dtype=np.int64) if len(src) != 0 else np.zeros(0, dtype=np.int64)
+    dst_values = np.frombuffer(dst, dtype=np.int64) if len(dst) != 0 else np.zeros(0, dtype=np.int64)
+    order = np.argsort(src_values, kind='stable')
+    indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src_values, minlength=num_nodes), out=indptr[1:])
+    return indptr, dst_values[order].astype(np.int32)
+
+
+def _node_type_code(node) -> int:
+    node_type = getattr(node, '_node_type', None)
+    return node_type.value if isinstance(node_type, NodeType) else -1
+
+
+def nodes_of_type(graph, node_type: NodeType) -> list[Node]:
+    """
+    :param graph: a networkx DiGraph, CompactDiGraph or MappedDiGraph.
+    :return: the nodes with the node type, using the node type array of the compact and mapped graphs.
+    """
+    if hasattr(graph, 'nodes_of_type'):
+        return graph.nodes_of_type(node_type)
+    return [n for n in graph.nodes if getattr(n, '_node_type', None) == node_type]
+
+
+def to_networkx(graph):
+    if hasattr(graph, 'to_networkx'):
+        return graph.to_networkx()
+    return graph
+
+
+def create_graph(backend: typing.Optional[str] = None):
+    """
+    :param backend: networkx or compact, defaulting to the PYTHON_DI_GRAPH_BACKEND environment variable, or networkx.
+    :return: an empty graph for the file and program graphs.
+    """
+    if backend is None:
+        backend = os.environ.get(GRAPH_BACKEND_ENV, NETWORKX_BACKEND)
+    if backend == COMPACT_BACKEND:
+        return CompactDiGraph()
+    elif backend == NETWORKX_BACKEND:
+        import networkx as nx
+        return nx.DiGraph()
+    raise ValueError(f"Unknown graph backend {backend}. Must be one of {NETWORKX_BACKEND} or {COMPACT_BACKEND}.")
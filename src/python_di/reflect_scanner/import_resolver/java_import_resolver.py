@@ -1,8 +1,8 @@
-import os
+import threading
 import typing
 import re
-from pathlib import Path
 
+from python_di.reflect_scanner.import_resolver.java_package_index import JavaPackageIndex, read_package, project_root
 from python_di.reflect_scanner.import_resolver.language_import_resolver import (
     LanguageImportResolver, LanguageDetector, Language, ImportResolverFactory
 )
@@ -13,13 +13,37 @@ from python_util.logger.logger import LoggerFacade
 
 class JavaImportResolver(LanguageImportResolver):
     """
-    Resolves Java imports according to Java's import resolution rules.
+    Resolves Java imports according to Java's import resolution rules. The files of each project root are looked up
+    in a JavaPackageIndex, built the first time a file from that root is resolved.
     """
     
     # Java standard library packages that are implicitly available
     IMPLICIT_PACKAGES = [
         "java.lang"
     ]
+
+    def __init__(self):
+        self._indexes: dict[str, JavaPackageIndex] = {}
+        self._lock = threading.Lock()
+
+    def package_index(self, source_file: str) -> JavaPackageIndex:
+        """
+        :return: the index of the project root of the source file.
+        """
+        root = self._get_project_root(source_file)
+        with self._lock:
+            if root not in self._indexes.keys():
+                self._indexes[root] = JavaPackageIndex(root)
+            return self._indexes[root]
+
+    def refresh(self):
+        """
+        Update the indexes with the files added, removed or modified since they were built.
+        """
+        with self._lock:
+            indexes = list(self._indexes.values())
+        for index in indexes:
+            index.refresh()
     
     def supports_language(self, file_path: str) -> bool:
         """Determines if this resolver supports Java files."""
@@ -124,20 +148,16 @@ class JavaImportResolver(LanguageImportResolver):
                 # For selective imports, append the class name
                 import_name = f"{import_name}.{node.name[0]}"
         
-        # Convert package path to file path
-        source_dir = self._get_project_root(source_file)
-        package_path = import_name.replace('.', os.path.sep)
-        
-        # Look for .java file
-        java_file = f"{source_dir}/{package_path}.java"
-        if os.path.exists(java_file):
+        # Look up the .java file, then the package directory, in the index
+        index = self.package_index(source_file)
+        package_name, _, class_name = import_name.rpartition('.')
+        java_file = index.find_class(package_name, class_name)
+        if java_file is not None:
             return java_file
-        
-        # Look for package directory
-        package_dir = f"{source_dir}/{os.path.dirname(package_path)}"
-        if os.path.exists(package_dir):
-            return package_dir
-        
+
+        if index.has_package(package_name):
+            return index.package_dir(package_name)
+
         # If not found, return the import name for external resolution
         return import_name
     
@@ -145,25 +165,30 @@ class JavaImportResolver(LanguageImportResolver):
         """Resolve a wildcard import like 'import package.*'."""
         # Get the package name
         package_name = node.module
-        
-        # Convert package to directory path
-        source_dir = self._get_project_root(source_file)
-        package_path = package_name.replace('.', os.path.sep)
-        package_dir = f"{source_dir}/{package_path}"
-        
-        # If directory exists, find all Java files in it
-        if os.path.exists(package_dir):
-            java_files = []
-            for file in os.listdir(package_dir):
-                if file.endswith('.java'):
-                    java_files.append(f"{package_dir}/{file}")
+
+        # If the package is indexed, return all Java files in it
+        java_files = self.package_index(source_file).package_files(package_name)
+        if len(java_files) != 0:
             return java_files
         
         # If not found, return the package name
         return [package_name]
     
     def _extract_package_from_file(self, file_path: str) -> typing.Optional[str]:
-        """Extract the package declaration from a Java file."""
+        """
+        Extract the package declaration from a Java file, from the Java AST cache shared with the program parser, or
+        from the file contents if it could not be parsed.
+        """
+        for index in list(self._indexes.values()):
+            indexed, package = index.package_of(file_path)
+            if indexed:
+                return package
+
+        from python_di.reflect_scanner.antlr_adapter.java_ast_cache import java_ast_cache
+        summary = java_ast_cache.retrieve(file_path)
+        if summary is not None:
+            return summary.package
+
         try:
             with open(file_path, 'r') as f:
                 content = f.read()
@@ -178,19 +203,23 @@ class JavaImportResolver(LanguageImportResolver):
         return None
     
     def _find_java_file_in_package(self, package_name: str, class_name: str) -> typing.Optional[str]:
-        """Find a Java file in a package directory."""
-        # This is a stub implementation
-        # In a real implementation, we would search project directories and classpath
+        """Find a Java file in a package of the indexed project roots."""
+        for index in list(self._indexes.values()):
+            java_file = index.find_class(package_name, class_name)
+            if java_file is not None:
+                return java_file
         return None
     
     def _get_project_root(self, file_path: str) -> str:
         """
-        Get the project root directory.
-        This is a simplified implementation that assumes the source file is in a Java project.
+        Get the project root directory, the directory the package directories of the source file start from, read
+        from the package line of the file.
         """
-        # In a real implementation, we would look for markers like pom.xml, build.gradle, etc.
-        # For now, just return the parent directory of the source file
-        return os.path.dirname(file_path)
+        for index in list(self._indexes.values()):
+            indexed, package = index.package_of(file_path)
+            if indexed:
+                return project_root(file_path, package)
+        return project_root(file_path, read_package(file_path))
 
 
 # Register the resolver with the factory
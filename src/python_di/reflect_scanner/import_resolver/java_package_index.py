@@ -0,0 +1,162 @@
+import concurrent.futures
+import os
+import re
+import threading
+import typing
+
+from python_util.logger.logger import LoggerFacade
+
+PACKAGE_LINE = re.compile(r'^\s*package\s+([\w.]+)\s*;')
+DECLARATION_LINE = re.compile(r'^\s*(import|@|public|protected|private|abstract|final|class|interface|enum|record)\b')
+
+
+def read_package(file_path: str) -> typing.Optional[str]:
+    """
+    Read the package of a Java file, stopping at the package line or at the first import or declaration.
+    """
+    try:
+        with open(file_path, 'r', errors='replace') as java_file:
+            in_comment = False
+            for line in java_file:
+                if in_comment:
+                    if '*/' not in line:
+                        continue
+                    line = line.split('*/', 1)[1]
+                    in_comment = False
+                if line.lstrip().startswith('/*'):
+                    in_comment = '*/' not in line
+                    continue
+                match = PACKAGE_LINE.match(line)
+                if match is not None:
+                    return match.group(1)
+                if DECLARATION_LINE.match(line) is not None:
+                    return None
+    except OSError as e:
+        LoggerFacade.error(f"Error reading package from {file_path}: {e}")
+    return None
+
+
+def project_root(file_path: str, package: typing.Optional[str]) -> str:
+    """
+    :return: the directory the package directories of the file start from, or the directory of the file if it is not
+    laid out by its package.
+    """
+    directory = os.path.dirname(os.path.abspath(file_path))
+    if package is None:
+        return directory
+    package_path = package.replace('.', os.sep)
+    if directory.endswith(os.sep + package_path):
+        return directory[:-len(package_path) - 1]
+    return directory
+
+
+class JavaPackageIndex:
+    """
+    The Java files under a project root by package and class name. The directories are walked once in parallel,
+    reading only the package line of each file, and refresh re-scans only the directories and files that changed
+    since they were indexed.
+    """
+
+    def __init__(self, root: str, max_workers: typing.Optional[int] = None):
+        self.root = os.path.abspath(root)
+        self.max_workers = max_workers
+        self._packages: dict[str, dict[str, str]] = {}
+        self._files: dict[str, typing.Tuple[int, typing.Optional[str]]] = {}
+        self._dirs: dict[str, int] = {}
+        self._lock = threading.RLock()
+        self._walk([self.root])
+
+    def find_class(self, package: str, class_name: str) -> typing.Optional[str]:
+        return self._packages.get(package, {}).get(class_name)
+
+    def package_files(self, package: str) -> list[str]:
+        return sorted(self._packages.get(package, {}).values())
+
+    def has_package(self, package: str) -> bool:
+        return package in self._packages.keys()
+
+    def package_dir(self, package: str) -> str:
+        return os.path.join(self.root, package.replace('.', os.sep))
+
+    def package_of(self, file_path: str) -> typing.Tuple[bool, typing.Optional[str]]:
+        """
+        :return: whether the file is indexed, and its package.
+        """
+        indexed = self._files.get(os.path.abspath(file_path))
+        return (True, indexed[1]) if indexed is not None else (False, None)
+
+    def refresh(self):
+        """
+        Re-scan the directories that had files added or removed, and re-read the package of the files modified, since
+        they were indexed.
+        """
+        with self._lock:
+            changed_dirs = [d for d, mtime in self._dirs.items() if _mtime(d) != mtime]
+            for d in changed_dirs:
+                self._remove_dir(d)
+            self._walk(changed_dirs)
+            for file_path, (mtime, _) in list(self._files.items()):
+                next_mtime = _mtime(file_path)
+                if next_mtime is None:
+                    self._remove_file(file_path)
+                elif next_mtime != mtime:
+                    self._remove_file(file_path)
+                    self._add_file(file_path, next_mtime, read_package(file_path))
+
+    def _walk(self, directories: list[str]):
+        with self._lock, concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = [executor.submit(_scan_dir, d) for d in directories]
+            while len(pending) != 0:
+                directory, mtime, subdirs, files = pending.pop().result()
+                if mtime is None:
+                    continue
+                self._dirs[directory] = mtime
+                pending.extend([executor.submit(_scan_dir, d) for d in subdirs if d not in self._dirs.keys()])
+                for file_path, file_mtime, package in files:
+                    if file_path not in self._files.keys():
+                        self._add_file(file_path, file_mtime, package)
+
+    def _add_file(self, file_path: str, mtime: int, package: typing.Optional[str]):
+        self._files[file_path] = (mtime, package)
+        if package is not None:
+            class_name = os.path.splitext(os.path.basename(file_path))[0]
+            self._packages.setdefault(package, {})[class_name] = file_path
+
+    def _remove_file(self, file_path: str):
+        _, package = self._files.pop(file_path)
+        if package is not None:
+            classes = self._packages.get(package, {})
+            class_name = os.path.splitext(os.path.basename(file_path))[0]
+            if classes.get(class_name) == file_path:
+                del classes[class_name]
+            if len(classes) == 0:
+                self._packages.pop(package, None)
+
+    def _remove_dir(self, directory: str):
+        del self._dirs[directory]
+        for file_path in [f for f in self._files.keys() if os.path.dirname(f) == directory]:
+            self._remove_file(file_path)
+
+
+def _mtime(path: str) -> typing.Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _scan_dir(directory: str):
+    subdirs = []
+    files = []
+    try:
+        mtime = os.stat(directory).st_mtime_ns
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False) and not entry.name.startswith('.'):
+                    subdirs.append(entry.path)
+                elif entry.name.endswith('.java') and entry.is_file():
+                    files.append((entry.path, entry.stat().st_mtime_ns, read_package(entry.path)))
+    except OSError as e:
+        LoggerFacade.debug(f"Could not index {directory}: {e}")
+        return directory, None, [], []
+    return directory, mtime, subdirs, files
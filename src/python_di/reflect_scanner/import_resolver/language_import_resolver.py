@@ -82,6 +82,12 @@ class LanguageImportResolver(abc.ABC):
         """
         pass
 
+    def refresh(self):
+        """
+        Update any state the resolver keeps about the files, for the files added, removed or modified since.
+        """
+        pass
+
 
 class ImportResolverFactory:
     """Factory for creating language-specific import resolvers."""
@@ -102,4 +108,10 @@ class ImportResolverFactory:
         
         # Log if no suitable resolver is found
         LoggerFacade.warn(f"No import resolver found for {file_path}")
-        return None
\ No newline at end of file
+        return None
+
+    @classmethod
+    def refresh(cls):
+        """Refresh the registered resolvers, before the imports of a parse are resolved."""
+        for resolver in cls._resolvers:
+            resolver.refresh()
\ No newline at end of file
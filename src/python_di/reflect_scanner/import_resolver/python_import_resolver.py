@@ -4,6 +4,7 @@ import typing
 from python_di.reflect_scanner.import_resolver.language_import_resolver import (
     LanguageImportResolver, LanguageDetector, Language, ImportResolverFactory
 )
+from python_di.reflection.import_resolution_cache import import_resolution_cache, module_dirs
 from python_di.reflection.resolve_src import ImportType
 from python_di.reflect_scanner.module_graph_models import Import, ImportFrom, ProgramNode, NodeType
 from python_util.logger.logger import LoggerFacade
@@ -34,24 +35,51 @@ class PythonImportResolver(LanguageImportResolver):
             A single file path or list of file paths that correspond to the import
         """
         try:
-            if import_type == ImportType.AbsoluteImport:
-                return self._resolve_absolute_import(node, source_file)
-            elif import_type == ImportType.ExplicitRelativeImport:
-                return self._resolve_relative_import(node, source_file)
-            elif import_type == ImportType.AliasImport:
-                return self._resolve_alias_import(node, source_file)
-            elif import_type == ImportType.SelectiveImport:
-                return self._resolve_selective_import(node, source_file)
-            elif import_type == ImportType.MultipleImport:
-                return self._resolve_multiple_import(node, source_file)
-            elif import_type == ImportType.WildcardImport:
-                return self._resolve_wildcard_import(node, source_file)
-            else:
-                LoggerFacade.warn(f"Unsupported import type {import_type} in {source_file}")
-                return []
+            return import_resolution_cache.resolve(
+                ('python', import_type, tuple(node.name), getattr(node, 'module', None),
+                 getattr(node, 'level', 0), os.path.dirname(source_file)),
+                lambda: self._do_resolve_module_import(import_type, node, source_file),
+                lambda resolved: self._dependent_dirs(node, source_file, resolved))
         except Exception as e:
             LoggerFacade.error(f"Error resolving import in {source_file}: {e}")
             return []
+
+    def _do_resolve_module_import(self, import_type: ImportType,
+                                  node: Import | ImportFrom,
+                                  source_file: str) -> typing.Union[str, typing.List[str]]:
+        if import_type == ImportType.AbsoluteImport:
+            return self._resolve_absolute_import(node, source_file)
+        elif import_type == ImportType.ExplicitRelativeImport:
+            return self._resolve_relative_import(node, source_file)
+        elif import_type == ImportType.AliasImport:
+            return self._resolve_alias_import(node, source_file)
+        elif import_type == ImportType.SelectiveImport:
+            return self._resolve_selective_import(node, source_file)
+        elif import_type == ImportType.MultipleImport:
+            return self._resolve_multiple_import(node, source_file)
+        elif import_type == ImportType.WildcardImport:
+            return self._resolve_wildcard_import(node, source_file)
+        else:
+            LoggerFacade.warn(f"Unsupported import type {import_type} in {source_file}")
+            return []
+
+    @staticmethod
+    def _dependent_dirs(node: Import | ImportFrom, source_file: str,
+                        resolved: typing.Union[str, typing.List[str]]) -> typing.List[str]:
+        """
+        The directories in which the candidate module files of the import would be found.
+        """
+        base_dir = os.path.dirname(source_file)
+        for _ in range(getattr(node, 'level', 0)):
+            base_dir = os.path.dirname(base_dir)
+        if isinstance(node, ImportFrom):
+            dirs = module_dirs(base_dir, node.module)
+        else:
+            dirs = [d for name in node.name for d in module_dirs(base_dir, name)]
+        for r in [resolved] if isinstance(resolved, str) else resolved if resolved is not None else []:
+            if os.path.isabs(r):
+                dirs.append(os.path.dirname(r))
+        return dirs
     
     def resolve_type_reference(self, type_reference: str, 
                                source_file: str, 
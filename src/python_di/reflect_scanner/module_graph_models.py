@@ -1,6 +1,7 @@
 import abc
 import dataclasses
 import enum
+import sys
 import typing
 from enum import Enum, auto
 
@@ -44,12 +45,43 @@ class NodeType(Enum):
     DECORATOR = enum.auto()
 
 
+def intern_id(value):
+    """
+    Paths and ids are repeated across the nodes of a graph, so they are interned to be stored once.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+_interned_slots = ('id_value', 'source_file')
+
+
 class Node(abc.ABC):
+    """
+    Nodes cache their hash in the _hash slot. String hashes are randomized per process, so the cached hash is not
+    pickled, and is computed again by the process that loads the node.
+    """
+    __slots__ = ()
+
     @property
     @abc.abstractmethod
     def node_type(self) -> NodeType:
         pass
 
+    def __getstate__(self):
+        state = dict(getattr(self, '__dict__', {}))
+        for cls in type(self).__mro__:
+            slots = getattr(cls, '__slots__', ())
+            for name in [slots] if isinstance(slots, str) else slots:
+                if name not in ('_hash', '__dict__', '__weakref__') and hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state: dict):
+        for name, value in state.items():
+            object.__setattr__(self, name, intern_id(value) if name in _interned_slots else value)
+        if hasattr(type(self), '_hash'):
+            object.__setattr__(self, '_hash', None)
+
 
 class GraphType(enum.Enum):
     File = enum.auto()
@@ -58,45 +90,56 @@ class GraphType(enum.Enum):
 
 @dataclasses.dataclass(eq=True)
 class ProgramNode(Node):
+    __slots__ = ('line_no', 'id_value', 'source_file', '_node_type', '_hash')
+
     def __init__(self,
                  node_type: NodeType,
                  source_file: str,
                  id_value: str,
                  line_no: int = -1):
         self.line_no = line_no
-        self.id_value = id_value
-        self.source_file = source_file
+        self.id_value = intern_id(id_value)
+        self.source_file = intern_id(source_file)
         self._node_type = node_type
+        self._hash = None
 
     @property
     def node_type(self) -> NodeType:
         return self._node_type
 
     def __hash__(self):
-        return hash((self._node_type, self.id_value, self.source_file))
+        if self._hash is None:
+            self._hash = hash((self._node_type, self.id_value, self.source_file))
+        return self._hash
 
     def __str__(self):
         return str(self.node_type)
 
 
 class TypeConnectionProgramNode(ProgramNode):
+    __slots__ = ('introspected_def',)
+
     def __init__(self, source_file: str, id_value: str, introspected_def: IntrospectedDef, line_no: int = 0):
         super().__init__(NodeType.TYPE_CONNECTION, source_file, id_value, line_no)
         self.introspected_def = introspected_def
 
 
 class FileNode(Node):
+    __slots__ = ('id_value', '_node_type', '_hash')
 
     def __init__(self, node_type: NodeType, id_value: str):
-        self.id_value = id_value
+        self.id_value = intern_id(id_value)
         self._node_type = node_type
+        self._hash = None
 
     @property
     def node_type(self) -> NodeType:
         return self._node_type
 
     def __hash__(self):
-        return hash((self.node_type, self.id_value))
+        if self._hash is None:
+            self._hash = hash((self.node_type, self.id_value))
+        return self._hash
 
     def __eq__(self, other):
         if not hasattr(other, 'node_type') or not hasattr(other, 'id_value'):
@@ -109,24 +152,33 @@ class FileNode(Node):
 
 @dataclasses.dataclass(eq=True)
 class ClassFunctionProgramNode(ProgramNode):
+    __slots__ = ('class_id',)
+
     def __init__(self, class_id: str, source_file: str,
                  id_value: str = '__init__', line_no: int = 0):
         super().__init__(NodeType.FUNCTION, source_file, id_value)
-        self.class_id = class_id
+        self.class_id = intern_id(class_id)
 
     def __hash__(self):
-        return hash((self.node_type, self.id_value, self.source_file, self.class_id))
+        if self._hash is None:
+            self._hash = hash((self.node_type, self.id_value, self.source_file, self.class_id))
+        return self._hash
 
 
 @dataclasses.dataclass(eq=True)
 class DecoratorProgramNode(ProgramNode):
+    __slots__ = ('decorated_id', 'decorated_ty')
+
     def __init__(self, decorator_id: str, decorated_id: str, source_file: str, decorated_ty: NodeType):
         super().__init__(NodeType.DECORATOR, source_file, decorator_id)
-        self.decorated_id = decorated_id
+        self.decorated_id = intern_id(decorated_id)
         self.decorated_ty = decorated_ty
 
     def __hash__(self):
-        return hash((self.node_type, self.id_value, self.source_file, self.decorated_id, self.decorated_ty))
+        if self._hash is None:
+            self._hash = hash((self.node_type, self.id_value, self.source_file, self.decorated_id,
+                               self.decorated_ty))
+        return self._hash
 
 
 class StatementType(SerializableEnum):
@@ -183,6 +235,8 @@ class StatementType(SerializableEnum):
 
 
 class Statement:
+    __slots__ = ('statement_str', 'lin_no', 'statements', 'statement_type', 'statement_id', 'ids')
+
     def __init__(self,
                  statement_type: StatementType,
                  statement_id: str,
@@ -203,54 +257,112 @@ class Statement:
         self.lin_no = lin_no
         self.statements = statements
         self.statement_type = statement_type
-        self.statement_id = statement_id
-        self.ids = ids
+        self.statement_id = intern_id(statement_id)
+        self.ids = [intern_id(i) for i in ids] if ids is not None else None
+
+
+StatementSpan = typing.Tuple[int, int, int, int]
+
+
+def _load_statements(source_file: typing.Optional[str], span: typing.Optional[StatementSpan],
+                     id_value: str, source_mtime: typing.Optional[int] = None) -> list[Statement]:
+    if source_file is None or span is None:
+        return []
+    from python_di.reflect_scanner.statements_parser import statement_span_cache
+    return statement_span_cache.retrieve(source_file, span, id_value, source_mtime)
 
 
 class StatementNode(FileNode):
-    def __init__(self, id_value, statements: list[Statement]):
+    """
+    The statements of a function. They are held as the span of the statements in the source file, and parsed when
+    retrieved, unless they were parsed when the node was created.
+    """
+    __slots__ = ('_statements', 'source_file', 'span', 'source_mtime')
+
+    def __init__(self, id_value, statements: typing.Optional[list[Statement]] = None,
+                 source_file: typing.Optional[str] = None, span: typing.Optional[StatementSpan] = None,
+                 source_mtime: typing.Optional[int] = None):
+        """
+        :param id_value:
+        :param statements: the parsed statements, or None to parse them from the span when they are retrieved.
+        :param source_file:
+        :param span: the lineno, col_offset, end_lineno and end_col_offset of the statements in the source file.
+        :param source_mtime: the modification time of the source file when the span was taken, in nanoseconds.
+        """
         super().__init__(NodeType.STATEMENT, id_value)
-        self.statements = statements
+        self._statements = statements
+        self.source_file = intern_id(source_file)
+        self.span = span
+        self.source_mtime = source_mtime
+
+    @property
+    def statements(self) -> list[Statement]:
+        if self._statements is not None:
+            return self._statements
+        return _load_statements(self.source_file, self.span, self.id_value, self.source_mtime)
 
 
 class ProgramStatementNode(ProgramNode):
-    def __init__(self, source_code: str, id_value, statements: list[Statement], source_file: str):
+    __slots__ = ('_statements', 'span', 'source_mtime')
+
+    def __init__(self, source_code: str, id_value, statements: typing.Optional[list[Statement]], source_file: str,
+                 span: typing.Optional[StatementSpan] = None, source_mtime: typing.Optional[int] = None):
         super().__init__(NodeType.STATEMENT, source_file, id_value, source_code)
-        self.statements = statements
+        self._statements = statements
+        self.span = span
+        self.source_mtime = source_mtime
+
+    @property
+    def statements(self) -> list[Statement]:
+        if self._statements is not None:
+            return self._statements
+        return _load_statements(self.source_file, self.span, self.id_value, self.source_mtime)
 
 
 class IntrospectedPathNode(FileNode):
+    __slots__ = ('introspected',)
+
     def __init__(self, id_value: str, introspected: IntrospectedDef):
         super().__init__(NodeType.PATH, id_value)
         self.introspected = introspected
 
 
 class ClassFunctionFileNode(FileNode):
+    __slots__ = ('class_id',)
+
     def __init__(self, class_id: str, id_value: str = '__init__'):
         super().__init__(NodeType.FUNCTION, id_value)
-        self.class_id = class_id
+        self.class_id = intern_id(class_id)
 
 
 class DecoratorFileNode(FileNode):
+    __slots__ = ('decorated_id', 'decorated_ty')
+
     def __init__(self, decorated_id: str, id_value: str, decorated_ty: NodeType):
         super().__init__(NodeType.DECORATOR, id_value)
-        self.decorated_id = decorated_id
+        self.decorated_id = intern_id(decorated_id)
         self.decorated_ty = decorated_ty
 
 
 class ArgFileNode(FileNode):
+    __slots__ = ('introspected',)
+
     def __init__(self, id_value: str, introspected: typing.List[IntrospectedDef]):
         super().__init__(NodeType.ARG, id_value)
         self.introspected = introspected
 
     def __hash__(self):
-        return hash((self.node_type, self.id_value, tuple(self.introspected)))
+        if self._hash is None:
+            self._hash = hash((self.node_type, self.id_value, tuple(self.introspected)))
+        return self._hash
 
     def __str__(self):
         return f'Node type: {self.node_type}\nId value: {self.id_value}'
 
 
 class GraphItem:
+    __slots__ = ('element_type', 'node_type', 'value')
+
     def __init__(self, element_type: GraphElement,
                  node_type: NodeType, value):
         self.element_type = element_type
@@ -259,6 +371,8 @@ class GraphItem:
 
 
 class Import(FileNode):
+    __slots__ = ('import_str', 'as_name', 'name', 'language')
+
     def __init__(self,
                  name: list[str] = None,
                  as_name: list[str] = None):
@@ -271,13 +385,17 @@ class Import(FileNode):
         self.language = Language.UNKNOWN  # Will be set by ImportParser
 
     def __hash__(self):
-        return hash((self.import_str, tuple(self.name), tuple(self.as_name)))
+        if self._hash is None:
+            self._hash = hash((self.import_str, tuple(self.name), tuple(self.as_name)))
+        return self._hash
 
     def __str__(self):
         return f'{super().__str__()}\nAs name: {self.as_name}\nName: {self.name}\nImport str: {self.import_str}'
 
 
 class ImportFrom(FileNode):
+    __slots__ = ('import_str', 'level', 'module', 'as_name', 'name', 'language')
+
     def __init__(self, name: list[str] = None, as_name: list[str] = None,
                  module: str | None = None, level: int = 0):
         self.import_str = f"from {module} import {', '.join(name)}"
@@ -285,10 +403,12 @@ class ImportFrom(FileNode):
             self.import_str += f" as {', '.join(as_name)}"
         super().__init__(NodeType.IMPORT_FROM, self.import_str)
         self.level = level
-        self.module = module
+        self.module = intern_id(module)
         self.as_name = as_name
         self.name = name
         self.language = Language.UNKNOWN  # Will be set by ImportParser
 
     def __hash__(self):
-        return hash((self.import_str, tuple(self.name), tuple(self.as_name), self.module, self.level))
+        if self._hash is None:
+            self._hash = hash((self.import_str, tuple(self.name), tuple(self.as_name), self.module, self.level))
+        return self._hash
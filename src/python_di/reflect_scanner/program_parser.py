@@ -1,17 +1,27 @@
 import abc
 import os
+import sys
 import typing
+import weakref
 
 import injector
 import networkx as nx
 
 from python_di.reflect_scanner.scanner_properties import ScannerProperties
-from python_util.io_utils.file_dirs import iterate_files_in_directories, get_base_path_of_current_file
+from python_util.io_utils.file_dirs import get_base_path_of_current_file
 from python_util.logger.logger import LoggerFacade
 from python_di.reflect_scanner.module_graph_models import FileNode, Import, ImportFrom, ProgramNode, NodeType
 from python_di.reflect_scanner.file_parser import ASTNodeParser, FileParser
+from python_di.reflect_scanner.external_graph_cache import ExternalDependencyPolicy, external_graph_cache
+from python_di.reflect_scanner.graph_store import create_graph, GRAPH_BACKEND_ENV, NETWORKX_BACKEND
+from python_di.reflect_scanner.antlr_adapter.java_ast_cache import java_ast_cache
+from python_di.reflect_scanner.source_code_extracter import clear_source_line_indexes
+from python_di.reflect_scanner.statements_parser import statement_span_cache
+from python_di.reflect_scanner.scan_profile import ScanProfile
+from python_di.reflect_scanner.source_discovery import SourceDiscoveryFilter, discover_files
 from python_di.reflect_scanner.program_parser_connector import ProgramParserConnectorArgs, ProgramParserConnector, \
     get_module
+from python_di.reflection.import_resolution_cache import import_resolution_cache, import_cache_path
 from python_di.reflection.resolve_src import ImportResolver, ImportType
 from python_di.reflect_scanner.import_resolver.language_import_resolver import ImportResolverFactory, LanguageDetector
 
@@ -49,25 +59,46 @@ class SourceFileProvider(abc.ABC):
         """
         pass
 
+    def reset(self):
+        """
+        Provide again the files already provided, after the program parser releases its parse state.
+        """
+        pass
+
 
 class ListBasedSourceFileProvider(SourceFileProvider):
 
-    def __init__(self, sources: list[str]):
+    def __init__(self, sources: list[str], discovery_filter: typing.Optional[SourceDiscoveryFilter] = None):
         self.source = sources
         self.walked = set([])
+        self.discovery_filter = discovery_filter if discovery_filter is not None else SourceDiscoveryFilter()
+        self._source_filters: dict[str, SourceDiscoveryFilter] = {}
 
     def base_source(self) -> list[str]:
         return self.source
 
+    def add_sources(self, sources: typing.Iterable[str],
+                    discovery_filter: typing.Optional[SourceDiscoveryFilter] = None):
+        """
+        Add sources to be walked, so that the next do_parse parses only the files not yet walked.
+        :param discovery_filter: the filter for these sources, defaulting to the filter of the provider.
+        """
+        for s in sources:
+            if s not in self.source:
+                self.source.append(s)
+                if discovery_filter is not None:
+                    self._source_filters[s] = discovery_filter
+
+    def reset(self):
+        self.walked = set([])
+
     def file_parser(self) -> typing.Iterator[str]:
         for directory_name in self.source:
-            for subdir, dirs, files in os.walk(directory_name):
-                for file in files:
-                    if file is not None and file.endswith('.py'):
-                        next_value = os.path.join(subdir, file)
-                        if next_value not in self.walked:
-                            yield next_value
-                            self.walked.add(next_value)
+            for next_value in discover_files([directory_name],
+                                             self._source_filters.get(directory_name, self.discovery_filter)):
+                if next_value.endswith('.py') and next_value not in self.walked:
+                    yield next_value
+                    self.walked.add(next_value)
 
 
 class PropertyBasedSourceFileProvider(SourceFileProvider):
@@ -87,38 +118,93 @@ class PropertyBasedSourceFileProvider(SourceFileProvider):
 
     def file_parser(self) -> typing.Iterator[str]:
         yield from filter(self.filter_fn.do_include,
-                          iterate_files_in_directories(get_base_path_of_current_file(self.scanner_properties.src_file,
-                                                                                     self.scanner_properties.num_up)))
+                          discover_files(self.base_source(),
+                                         SourceDiscoveryFilter.from_properties(self.scanner_properties)))
 
     def base_source(self) -> list[str]:
         return [get_base_path_of_current_file(self.scanner_properties.src_file,
                                               self.scanner_properties.num_up)]
 
 
+_program_parsers = weakref.WeakSet()
+
+
 class ProgramParser:
+    """
+    Parses the file graphs of the sources and connects them in the program graph. After a context is built the parse
+    state is released, and it is parsed again from the sources when the program graph is next retrieved.
+    """
 
     @injector.inject
     def __init__(self,
                  ast_providers: typing.List[ASTNodeParser],
                  src_file_provider: SourceFileProvider,
                  module_inclusion_criteria: typing.List[InclusionCriteria],
-                 program_graph_connectors: typing.List[ProgramParserConnector]):
+                 program_graph_connectors: typing.List[ProgramParserConnector],
+                 scanner_properties: ScannerProperties):
+        self.scanner_properties = scanner_properties
+        self.external_policy = ExternalDependencyPolicy.from_properties(scanner_properties)
         self.program_graph_connectors = program_graph_connectors
         self.module_inclusion_criteria = module_inclusion_criteria
         self.ast_providers = ast_providers
         self.src_file_provider = src_file_provider
         self.file_graphs: dict[str, FileParser] = {}
         self.external_file_graphs: dict[str, FileParser] = {}
-        self.program_graph = nx.DiGraph()
+        self._external_depths: dict[str, int] = {}
+        self._pending_external: list[str] = []
         self.macro_expander = []
-
+        self.scan_profile = ScanProfile.FULL
+        self.released = False
+        self._set_program_graph(create_graph())
+        _program_parsers.add(self)
+
+    @property
+    def program_graph(self):
+        if self.released:
+            LoggerFacade.info("Parsing program graph again after its parse state was released.")
+            self.do_parse()
+        return self._program_graph
+
+    def _set_program_graph(self, program_graph):
+        self._program_graph = program_graph
         for program_graph_connector in iter(sorted(self.program_graph_connectors,
                                                    key=lambda x: x.order() if x.order() is not None else 0)):
-            program_graph_connector.program_graph = self.program_graph
+            program_graph_connector.program_graph = program_graph
+
+    def release(self):
+        """
+        Drop the file graphs and the program graph. They are parsed again from the sources by the next do_parse, or
+        when the program graph is retrieved.
+        """
+        self.file_graphs = {}
+        self.external_file_graphs = {}
+        self._external_depths = {}
+        self._pending_external = []
+        self._set_program_graph(None)
+        self.src_file_provider.reset()
+        self.released = True
 
     def set_source_file_provider(self, src_file_provider: SourceFileProvider):
         self.src_file_provider = src_file_provider
 
+    def set_scan_profile(self, scan_profile: ScanProfile):
+        """
+        :param scan_profile: determines which ASTNodeParsers and ProgramParserConnectors run, defaulting to full.
+        """
+        self.scan_profile = scan_profile
+
+    def set_external_policy(self, external_policy: ExternalDependencyPolicy):
+        self.external_policy = external_policy
+
+    def _create_file_parser(self, scan_profile: typing.Optional[ScanProfile] = None) -> FileParser:
+        scan_profile = scan_profile if scan_profile is not None else self.scan_profile
+        file_parser = FileParser([p for p in self.ast_providers if scan_profile.includes(p.scan_profile())])
+        file_parser.set_scan_profile(scan_profile)
+        return file_parser
+
+    def _external_scan_profile(self) -> ScanProfile:
+        return ScanProfile.COMPONENT_SCAN if self.external_policy.stubs_only else self.scan_profile
+
     def do_parse(self):
         """
         TODO: connect statements to delegate imports and then resolve delegate imports (see parse_statement_node in AggregateStatementParser)
@@ -128,11 +214,19 @@ class ProgramParser:
               2. Write, on the second pass, the connections between the files - can write each file graph to cache
               3. Create program graph - resolve delegate imports from statements/other (language dependent) and connect file graphs to program graph incrementally
               4. Incrementally write the SCIP/LSIF index to the file
+
+        Files already parsed are skipped, so that calling do_parse again after adding sources to the source file
+        provider only parses and connects the new files.
         :return:
         """
+        if self.released:
+            self.released = False
+            self._set_program_graph(create_graph())
         sources = []
         for file in self.src_file_provider.file_parser():
-            self.file_graphs[file] = FileParser(self.ast_providers)
+            if file in self.file_graphs.keys():
+                continue
+            self.file_graphs[file] = self._create_file_parser()
             self.file_graphs[file].parse(file)
             sources.append(file)
         #   could write intermediary sub-graph with entry to metadata file - link below
@@ -143,19 +237,67 @@ class ProgramParser:
         # Another pass through each of the file graphs, can be parallelized, to resolve and add undefined imports, which is
         # language dependent
 
-        for file, file_graph in self.file_graphs.items():
+        cache_path = import_cache_path(self.src_file_provider.base_source())
+        import_resolution_cache.refresh()
+        ImportResolverFactory.refresh()
+        if cache_path is not None:
+            import_resolution_cache.load(cache_path)
+
+        parsed_file_graphs = {file: self.file_graphs[file] for file in sources}
+        for file, file_graph in parsed_file_graphs.items():
             self.set_file_connections(file_graph.graph, self.program_graph, file)
 
+        # external dependencies are connected, so that their dependencies are parsed, up to the maximum depth
+        while len(self._pending_external) != 0:
+            file = self._pending_external.pop(0)
+            self.set_file_connections(self.external_file_graphs[file].graph, self.program_graph, file)
+
+        if cache_path is not None:
+            import_resolution_cache.write(cache_path)
+        LoggerFacade.debug(f"Import resolution cache had {import_resolution_cache.hits} hits and "
+                           f"{import_resolution_cache.misses} misses.")
+        LoggerFacade.debug(f"External graph cache had {external_graph_cache.hits} hits and "
+                           f"{external_graph_cache.misses} misses.")
+        # the ANTLR parser is only imported once a Java file is parsed.
+        if 'python_di.reflect_scanner.antlr_adapter.ast_to_antlr' in sys.modules.keys():
+            from python_di.reflect_scanner.antlr_adapter.ast_to_antlr import java_parse_metrics
+            LoggerFacade.debug(f"Java parses: {java_parse_metrics}.")
+
         connector_args = ProgramParserConnectorArgs(self.file_graphs, self.external_file_graphs,
-                                                    self.program_graph, self.src_file_provider.base_source())
+                                                    self.program_graph, self.src_file_provider.base_source(),
+                                                    parsed_file_graphs)
 
         for program_graph in self.program_graph_connectors:
-            program_graph.add_to_program_graph(connector_args)
+            if self.scan_profile.includes(program_graph.scan_profile()):
+                program_graph.add_to_program_graph(connector_args)
+
+    def write_program_graph(self, path: str):
+        """
+        Write the program graph to the graph file format, to be loaded with load_program_graph and queried by the
+        graph scanners without parsing the sources again.
+        """
+        from python_di.reflect_scanner.graph_file import write_program_graph
+        write_program_graph(self.program_graph, path)
 
-    def add_dependency_graphs(self, resolved: str):
-        if resolved not in self.file_graphs.keys() and os.path.exists(resolved) and os.path.isfile(resolved):
-            self.external_file_graphs[resolved] = FileParser(self.ast_providers)
-            self.external_file_graphs[resolved].parse(resolved)
+    def add_dependency_graphs(self, resolved: str, depth: int = 1):
+        """
+        Parse the file graph of an external dependency, imported through depth imports from the sources, if the
+        external dependency policy allows it. The graphs are cached across runs when the policy enables the cache.
+        """
+        if (resolved in self.file_graphs.keys() or resolved in self.external_file_graphs.keys()
+                or not self.external_policy.allows_depth(depth) or not os.path.isfile(resolved)):
+            return
+        scan_profile = self._external_scan_profile()
+        file_parser = self._create_file_parser(scan_profile)
+        if self.external_policy.cache:
+            variant = f'{scan_profile.value}:{os.environ.get(GRAPH_BACKEND_ENV, NETWORKX_BACKEND)}'
+            file_parser.graph = external_graph_cache.retrieve(resolved, variant, lambda: file_parser.parse(resolved))
+        else:
+            file_parser.parse(resolved)
+        self.external_file_graphs[resolved] = file_parser
+        self._external_depths[resolved] = depth
+        if self.external_policy.allows_depth(depth + 1):
+            self._pending_external.append(resolved)
 
     def set_file_connections(self, file_graph: nx.DiGraph,
                              program_graph: nx.DiGraph, source: str):
@@ -186,12 +328,13 @@ class ProgramParser:
                                 self.assert_resolved_type(resolved)
                         else:
                             return None
+                        parse_external = self.allows_external(node)
                         if isinstance(resolved, typing.Collection) and not isinstance(resolved, str):
                             for resolve in resolved:
                                 self.assert_resolved_type(resolve)
-                                self.add_to_dep(edges_to_add, program_graph, resolve, source)
+                                self.add_to_dep(edges_to_add, program_graph, resolve, source, parse_external)
                         else:
-                            self.add_to_dep(edges_to_add, program_graph, resolved, source)
+                            self.add_to_dep(edges_to_add, program_graph, resolved, source, parse_external)
                     except Exception as e:
                         LoggerFacade.error(f"Failed to resolve import file: {e}")
 
@@ -215,7 +358,17 @@ class ProgramParser:
     def any_do_include_criteria(self, name):
         return any([criteria.do_include(name) for criteria in self.module_inclusion_criteria])
 
-    def add_to_dep(self, edges_to_add, program_graph, resolved, source):
+    def allows_external(self, node: Import | ImportFrom) -> bool:
+        """
+        :return: whether the external dependency policy allows parsing the modules imported by the node.
+        """
+        if isinstance(node, ImportFrom):
+            if node.level > 0:
+                return True
+            return self.external_policy.allows_module(node.module)
+        return all([self.external_policy.allows_module(name) for name in node.name])
+
+    def add_to_dep(self, edges_to_add, program_graph, resolved, source, parse_external: bool = True):
         # For cross-language support, ensure resolved is a proper path
         if isinstance(resolved, str):
             resolved_path = resolved
@@ -228,7 +381,20 @@ class ProgramParser:
         program_graph.add_edge(program_src, resolved_node)
         edges_to_add.append((FileNode(NodeType.MODULE, program_src.source_file),
                              FileNode(NodeType.MODULE, resolved_node.source_file)))
-        self.add_dependency_graphs(resolved_node.source_file)
+        if parse_external:
+            self.add_dependency_graphs(resolved_node.source_file, self._external_depths.get(source, 0) + 1)
+
+
+def release_scan_state():
+    """
+    Release the parse state of the program parsers, and the in-memory caches filled while scanning, once the context
+    is built. The state is parsed again if it is needed by a later scan.
+    """
+    for program_parser in list(_program_parsers):
+        program_parser.release()
+    statement_span_cache.clear()
+    clear_source_line_indexes()
+    java_ast_cache.clear()
 
 
 def is_node_in_module(module_name, mod_to_import):
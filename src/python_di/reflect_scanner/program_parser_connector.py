@@ -1,5 +1,6 @@
 import abc
 import importlib
+import typing
 
 import networkx as nx
 
@@ -10,6 +11,7 @@ from python_di.reflect_scanner.file_parser import FileParser
 from python_di.reflect_scanner.module_graph_models import FileNode, Import, ImportFrom, ProgramNode, NodeType, \
     ClassFunctionFileNode, ArgFileNode, TypeConnectionProgramNode, ClassFunctionProgramNode, DecoratorProgramNode, \
     DecoratorFileNode
+from python_di.reflect_scanner.scan_profile import ScanProfile
 from python_di.reflect_scanner.type_introspector import IntrospectedDef
 
 
@@ -18,7 +20,13 @@ class ProgramParserConnectorArgs:
                  file_graphs: dict[str, FileParser],
                  external_file_graphs: dict[str, FileParser],
                  program_graph: nx.DiGraph,
-                 sources: list[str]):
+                 sources: list[str],
+                 connect_file_graphs: typing.Optional[dict[str, FileParser]] = None):
+        """
+        :param connect_file_graphs: the file graphs to add to the program graph, defaulting to all file graphs, such as
+        only those parsed since the previous do_parse.
+        """
+        self.connect_file_graphs = connect_file_graphs if connect_file_graphs is not None else file_graphs
         self.sources = sources
         self.program_graph = program_graph
         self.external_file_graphs = external_file_graphs
@@ -29,7 +37,7 @@ class ProgramParserConnector(Ordered, abc.ABC):
 
     def add_to_program_graph(self, connector_args: ProgramParserConnectorArgs):
         assert connector_args.program_graph is not None, "Must set program graph before adding to it."
-        for source, file_graph in connector_args.file_graphs.items():
+        for source, file_graph in connector_args.connect_file_graphs.items():
             for node in file_graph.graph.nodes:
                 assert isinstance(node, FileNode)
                 if not isinstance(node, Import | ImportFrom) and self.matches_node(node):
@@ -52,6 +60,11 @@ class ProgramParserConnector(Ordered, abc.ABC):
 
         return None
 
+    def scan_profile(self) -> ScanProfile:
+        """
+        :return: the least profile for which this connector runs.
+        """
+        return ScanProfile.COMPONENT_SCAN
 
     def add_node_to_program_graph(self, connector_args, node, source):
         within_file = ProgramNode(node.node_type, source, node.id_value)
@@ -175,6 +188,9 @@ class FunctionArgsParserConnector(ProgramParserConnector):
                                         class_program_node,
                                         connector_args, file_graph, source)
 
+    def scan_profile(self) -> ScanProfile:
+        return ScanProfile.SIGNATURES
+
     def create_add_recursive(self, tree, file_graph, source, class_program_node, parent, program_graph,
                              added_nodes: list[TypeConnectionProgramNode] = None):
         if added_nodes is None:
@@ -201,6 +217,9 @@ class FunctionArgsParserConnector(ProgramParserConnector):
 def add_fn_statements(class_function_program_node, connector_args, file_graph, node, source):
     out_edges = get_node_cxns_out(file_graph, node)
     fn_statements = get_functions_stmts(out_edges)
+    if len(fn_statements) == 0:
+        # statements are only parsed with the full scan profile.
+        return
     assert len(fn_statements) == 1
     fn_statements = fn_statements[0]
     fn_statement_program_node = ProgramNode(NodeType.STATEMENT, source, fn_statements.id_value)
@@ -272,6 +291,9 @@ class ClassFunctionParserConnector(ProgramParserConnector):
     def order(self) -> int:
         return 2
 
+    def scan_profile(self) -> ScanProfile:
+        return ScanProfile.SIGNATURES
+
     def add_node_to_program_graph(self, connector_args, node: ClassFunctionFileNode, source):
         within_file = ClassFunctionProgramNode(node.class_id, source, node.id_value)
         source_node = ProgramNode(NodeType.MODULE, source, self.get_module_name(source, connector_args.sources))
@@ -0,0 +1,48 @@
+import enum
+import os
+
+SCAN_PROFILE_ENV = 'PYTHON_DI_SCAN_PROFILE'
+
+
+class ScanProfile(enum.Enum):
+    """
+    How much of each source file the reflect scanner parses. Each profile includes the one before it:
+        component-scan: modules, classes, functions, decorators and the import edges between modules.
+        signatures: additionally the function arguments, introspected argument types and class functions.
+        full: additionally the statements of every function body.
+    """
+    COMPONENT_SCAN = 'component-scan'
+    SIGNATURES = 'signatures'
+    FULL = 'full'
+
+    def includes(self, other: 'ScanProfile') -> bool:
+        return _PROFILE_DEPTH[self] >= _PROFILE_DEPTH[other]
+
+    @classmethod
+    def from_name(cls, name: str) -> 'ScanProfile':
+        for profile in cls:
+            if profile.value == name:
+                return profile
+        raise ValueError(f"Unknown scan profile {name}. Must be one of {[p.value for p in cls]}.")
+
+
+_PROFILE_DEPTH = {
+    ScanProfile.COMPONENT_SCAN: 0,
+    ScanProfile.SIGNATURES: 1,
+    ScanProfile.FULL: 2
+}
+
+
+def component_scan_profile() -> ScanProfile:
+    """
+    :return: the profile used by the ComponentScanner, from the PYTHON_DI_SCAN_PROFILE environment variable, or
+    component-scan.
+    """
+    return ScanProfile.from_name(os.environ.get(SCAN_PROFILE_ENV, ScanProfile.COMPONENT_SCAN.value))
+
+
+def retrieve_scan_profile(parser) -> ScanProfile:
+    """
+    :param parser: the FileParser passed to the ASTNodeParser, if any.
+    """
+    return getattr(parser, 'scan_profile', ScanProfile.FULL)
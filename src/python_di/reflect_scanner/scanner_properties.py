@@ -2,6 +2,7 @@ import os
 
 from python_di.env.base_module_config_props import ConfigurationProperties
 from python_di.properties.configuration_properties_decorator import configuration_properties
+from python_di.reflect_scanner.source_discovery import DEFAULT_EXCLUDES
 
 
 @configuration_properties(
@@ -12,3 +13,13 @@ from python_di.properties.configuration_properties_decorator import configuratio
 class ScannerProperties(ConfigurationProperties):
     src_file: str
     num_up: int
+    external_max_depth: int = 1
+    external_allow: list[str] = []
+    external_deny: list[str] = []
+    external_stubs_only: bool = False
+    external_cache: bool = True
+    source_include: list[str] = ['*.py']
+    source_exclude: list[str] = DEFAULT_EXCLUDES
+    source_gitignore: bool = True
+    source_follow_symlinks: bool = False
+    source_parallel: bool = False
@@ -1,37 +1,175 @@
-import tokenize
-from io import BytesIO
+import bisect
+import collections
+import functools
+import mmap
+import os
+import threading
+import typing
 
 from python_di.reflect_scanner.module_graph_models import ProgramNode, NodeType
 
 
-def extract_source(node, source_code):
+class SourceLineIndex:
+    """
+    The byte offset of the start of each line of a source, so that the source of a node is sliced by its lineno and
+    col_offset, which the ast gives as UTF-8 byte offsets, without tokenizing the source. Files past mmap_threshold bytes
+    are mapped with mmap rather than read.
+    """
+
+    mmap_threshold = 1 << 16
+
+    def __init__(self, contents: typing.Union[bytes, mmap.mmap]):
+        self.contents = contents
+        self.line_offsets = [0]
+        position = contents.find(b'\n')
+        while position != -1:
+            self.line_offsets.append(position + 1)
+            position = contents.find(b'\n', position + 1)
+
+    @classmethod
+    def from_file(cls, source_file: str) -> 'SourceLineIndex':
+        with open(source_file, 'rb') as source:
+            if os.fstat(source.fileno()).st_size < cls.mmap_threshold:
+                return SourceLineIndex(source.read())
+            return SourceLineIndex(mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ))
+
+    @classmethod
+    def from_source(cls, source_code: str) -> 'SourceLineIndex':
+        return SourceLineIndex(source_code.encode('utf-8'))
+
+    def offset(self, lineno: int, col_offset: int) -> int:
+        """
+        :param lineno: the line, starting at 1.
+        :param col_offset: the byte offset in the line.
+        :return: the byte offset in the source.
+        """
+        if lineno > len(self.line_offsets):
+            return len(self.contents)
+        return self.line_offsets[lineno - 1] + col_offset
+
+    def line_end(self, lineno: int) -> int:
+        if lineno >= len(self.line_offsets):
+            return len(self.contents)
+        return self.line_offsets[lineno] - 1
+
+    def line_of(self, offset: int) -> int:
+        return bisect.bisect_right(self.line_offsets, offset)
+
+    def extract(self, lineno: int, col_offset: int, end_lineno: typing.Optional[int] = None,
+                end_col_offset: typing.Optional[int] = None) -> str:
+        """
+        :return: the source between the positions, or to the end of the starting line if there is no end position.
+        """
+        start = self.offset(lineno, col_offset)
+        if end_lineno is None or end_col_offset is None:
+            end = self.line_end(lineno)
+        else:
+            end = self.offset(end_lineno, end_col_offset)
+        return self.contents[start:end].decode('utf-8', errors='replace')
+
+    def lines(self) -> list[str]:
+        return self.contents[:].decode('utf-8', errors='replace').splitlines(keepends=True)
+
+    def close(self):
+        """
+        Unmap the file, if it was mapped. The index cannot be used after.
+        """
+        if isinstance(self.contents, mmap.mmap):
+            self.contents.close()
+
+
+class SourceLineIndexCache:
+    """
+    The line indexes of the files, each cached until the file is modified, with the least recently retrieved evicted
+    and closed past maxsize so that the mapped files do not hold a descriptor each.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self._indexes: collections.OrderedDict[str, typing.Tuple[int, SourceLineIndex]] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def retrieve(self, source_file: str) -> SourceLineIndex:
+        mtime = os.stat(source_file).st_mtime_ns
+        with self._lock:
+            cached = self._indexes.get(source_file)
+            if cached is not None and cached[0] == mtime:
+                self._indexes.move_to_end(source_file)
+                return cached[1]
+        index = SourceLineIndex.from_file(source_file)
+        with self._lock:
+            replaced = self._indexes.pop(source_file, None)
+            self._indexes[source_file] = (mtime, index)
+            evicted = [replaced] if replaced is not None else []
+            while len(self._indexes) > self.maxsize:
+                evicted.append(self._indexes.popitem(last=False)[1])
+        for _, evicted_index in evicted:
+            evicted_index.close()
+        return index
+
+    def clear(self):
+        with self._lock:
+            evicted = list(self._indexes.values())
+            self._indexes.clear()
+        for _, evicted_index in evicted:
+            evicted_index.close()
+
+    def __len__(self):
+        return len(self._indexes)
+
+
+_file_indexes = SourceLineIndexCache()
+
+
+def source_line_index(source_file: str) -> SourceLineIndex:
+    """
+    :return: the line index of the file, cached until the file is modified.
+    """
+    return _file_indexes.retrieve(source_file)
+
+
+def clear_source_line_indexes():
+    _file_indexes.clear()
+
+
+@functools.lru_cache(maxsize=32)
+def _source_code_index(source_code: str) -> SourceLineIndex:
+    return SourceLineIndex.from_source(source_code)
+
+
+def _retrieve_index(node, source_code: typing.Optional[str]) -> SourceLineIndex:
+    if source_code is not None:
+        return _source_code_index(source_code)
+    if isinstance(node, ProgramNode):
+        return source_line_index(node.source_file)
+    raise ValueError(f"Source code was not provided for {node} and it has no source file.")
+
+
+def extract_source(node, source_code: typing.Optional[str] = None):
     """
     Extract the source code for a specific AST node.
 
     :param node: The AST node.
-    :param source_code: The source code from which the node was parsed.
+    :param source_code: The source code from which the node was parsed, or None to read the source file of the node.
     :return: Source code associated with the node.
     """
     if isinstance(node, ProgramNode):
         if node.node_type == NodeType.MODULE:
-            with open(node.source_file, 'r') as source_code:
-                return source_code.readlines()
+            return source_line_index(node.source_file).lines()
         elif node.node_type == NodeType.IMPORT or node.node_type == NodeType.IMPORT_FROM:
             return node.id_value
 
-    # Tokenize the source code and build a mapping between start/end positions and the tokens.
-    tokens = list(tokenize.tokenize(BytesIO(source_code.encode('utf-8')).readline))
-    token_map = {(token.start, token.end): token.string for token in tokens}
-
-    # Find the start and end position for the node.
-    start_pos = (node.lineno, node.col_offset)
-    if hasattr(node, 'end_lineno') and hasattr(node, 'end_col_offset'):
-        # Use the end position of the node (available in Python 3.8+).
-        end_pos = (node.end_lineno, node.end_col_offset)
-    else:
-        # If the end position isn't available, use the start position of the next node.
-        end_pos = tokens[min(i + 1 for i, tok in enumerate(tokens) if tok.start == start_pos)].start
-
-    # Extract and concatenate tokens between the start and end position.
-    code_parts = [token_map[pos] for pos in sorted(token_map.keys()) if start_pos <= pos < end_pos]
-    return ''.join(code_parts)
+    return _retrieve_index(node, source_code).extract(node.lineno, node.col_offset,
+                                                      getattr(node, 'end_lineno', None),
+                                                      getattr(node, 'end_col_offset', None))
+
+
+def extract_sources(nodes: typing.Iterable, source_code: typing.Optional[str] = None) -> list:
+    """
+    Extract the source code of many nodes, building the line index of each source once.
+
+    :param nodes: The AST nodes.
+    :param source_code: The source code from which all the nodes were parsed, or None to read the source file of each.
+    :return: Source code associated with each node, in order.
+    """
+    return [extract_source(n, source_code) for n in nodes]
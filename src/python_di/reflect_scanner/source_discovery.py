@@ -0,0 +1,210 @@
+import concurrent.futures
+import fnmatch
+import os
+import threading
+import typing
+
+from python_util.logger.logger import LoggerFacade
+
+DEFAULT_EXCLUDES = ['.git', '.hg', '.svn', '__pycache__', '.venv', 'venv', '.tox', '.nox', '.mypy_cache',
+                    '.pytest_cache', '.python_di_cache', 'node_modules', '*.egg-info']
+
+
+class SourceDiscoveryFilter:
+    """
+    Which files are discovered under the source roots.
+        include: globs of the files discovered.
+        exclude: globs of the files and directories not discovered, or walked.
+        gitignore: skip the files and directories ignored by the .gitignore files in the roots walked.
+        follow_symlinks: walk symlinked directories, each directory at most once.
+        parallel: walk the directories with a thread pool, for very large trees.
+    The globs are matched against the name and against the path relative to the root.
+    """
+
+    def __init__(self, include: typing.Optional[list[str]] = None, exclude: typing.Optional[list[str]] = None,
+                 gitignore: bool = True, follow_symlinks: bool = False, parallel: bool = False,
+                 max_workers: typing.Optional[int] = None):
+        self.include = include if include is not None else ['*.py']
+        self.exclude = exclude if exclude is not None else list(DEFAULT_EXCLUDES)
+        self.gitignore = gitignore
+        self.follow_symlinks = follow_symlinks
+        self.parallel = parallel
+        self.max_workers = max_workers
+
+    @classmethod
+    def from_properties(cls, scanner_properties) -> 'SourceDiscoveryFilter':
+        return SourceDiscoveryFilter(scanner_properties.source_include, scanner_properties.source_exclude,
+                                     scanner_properties.source_gitignore, scanner_properties.source_follow_symlinks,
+                                     scanner_properties.source_parallel)
+
+    def extend(self, include: typing.Optional[list[str]] = None,
+               exclude: typing.Optional[list[str]] = None) -> 'SourceDiscoveryFilter':
+        """
+        :return: a filter with the include globs replaced, if any, and the exclude globs added.
+        """
+        return SourceDiscoveryFilter(include if include is not None else self.include,
+                                     [*self.exclude, *(exclude if exclude is not None else [])],
+                                     self.gitignore, self.follow_symlinks, self.parallel, self.max_workers)
+
+    def is_excluded(self, name: str, relative: str) -> bool:
+        return _matches(self.exclude, name, relative)
+
+    def is_included(self, name: str, relative: str) -> bool:
+        return _matches(self.include, name, relative)
+
+
+def _matches(patterns: list[str], name: str, relative: str) -> bool:
+    return any([fnmatch.fnmatch(name, p) or fnmatch.fnmatch(relative, p) for p in patterns])
+
+
+class GitIgnore:
+    """
+    The patterns of a .gitignore file, supporting comments, negation, directory only and anchored patterns. Wildcards
+    are matched by fnmatch, so * also matches across directories.
+    """
+
+    def __init__(self, directory: str, patterns: list[typing.Tuple[str, bool, bool, bool]]):
+        self.directory = directory
+        self.patterns = patterns
+
+    @classmethod
+    def load(cls, directory: str) -> typing.Optional['GitIgnore']:
+        path = os.path.join(directory, '.gitignore')
+        if not os.path.isfile(path):
+            return None
+        patterns = []
+        try:
+            with open(path, 'r', errors='replace') as gitignore:
+                for line in gitignore.read().splitlines():
+                    line = line.rstrip()
+                    if len(line) == 0 or line.startswith('#'):
+                        continue
+                    negate = line.startswith('!')
+                    if negate:
+                        line = line[1:]
+                    dir_only = line.endswith('/')
+                    line = line.rstrip('/')
+                    anchored = '/' in line
+                    line = line.lstrip('/')
+                    if line.startswith('**/'):
+                        line = line[3:]
+                        anchored = '/' in line
+                    if len(line) != 0:
+                        patterns.append((line, negate, dir_only, anchored))
+        except OSError as e:
+            LoggerFacade.debug(f"Could not read {path}: {e}")
+            return None
+        return GitIgnore(directory, patterns)
+
+    def is_ignored(self, path: str, is_dir: bool) -> typing.Optional[bool]:
+        """
+        :return: whether the last pattern matching the path ignores it, or None if no pattern matches it.
+        """
+        relative = os.path.relpath(path, self.directory).replace(os.sep, '/')
+        name = os.path.basename(path)
+        ignored = None
+        for pattern, negate, dir_only, anchored in self.patterns:
+            if dir_only and not is_dir:
+                continue
+            if fnmatch.fnmatch(relative if anchored else name, pattern):
+                ignored = not negate
+        return ignored
+
+
+def _is_ignored(ignores: typing.Tuple[GitIgnore, ...], path: str, is_dir: bool) -> bool:
+    ignored = False
+    for gitignore in ignores:
+        matched = gitignore.is_ignored(path, is_dir)
+        if matched is not None:
+            ignored = matched
+    return ignored
+
+
+class _Walk:
+
+    def __init__(self, root: str, discovery_filter: SourceDiscoveryFilter):
+        self.root = root
+        self.discovery_filter = discovery_filter
+        self._visited: set[typing.Tuple[int, int]] = set([])
+        self._lock = threading.Lock()
+
+    def visit(self, directory: str) -> bool:
+        """
+        :return: whether the directory was not yet walked, by device and inode, so that symlink loops end.
+        """
+        try:
+            stat = os.stat(directory)
+        except OSError:
+            return False
+        with self._lock:
+            key = (stat.st_dev, stat.st_ino)
+            if key in self._visited:
+                return False
+            self._visited.add(key)
+            return True
+
+    def scan(self, directory: str, ignores: typing.Tuple[GitIgnore, ...]) \
+            -> typing.Tuple[list[str], list[typing.Tuple[str, typing.Tuple[GitIgnore, ...]]]]:
+        files = []
+        subdirs = []
+        if self.discovery_filter.gitignore:
+            gitignore = GitIgnore.load(directory)
+            if gitignore is not None:
+                ignores = (*ignores, gitignore)
+        try:
+            with os.scandir(directory) as entries:
+                entries = sorted(entries, key=lambda e: e.name)
+        except OSError as e:
+            LoggerFacade.debug(f"Could not walk {directory}: {e}")
+            return files, subdirs
+
+        for entry in entries:
+            relative = os.path.relpath(entry.path, self.root).replace(os.sep, '/')
+            try:
+                is_dir = entry.is_dir(follow_symlinks=self.discovery_filter.follow_symlinks)
+                if not is_dir and not entry.is_file():
+                    continue
+            except OSError:
+                continue
+            if self.discovery_filter.is_excluded(entry.name, relative) or _is_ignored(ignores, entry.path, is_dir):
+                continue
+            if is_dir:
+                if not self.discovery_filter.follow_symlinks or self.visit(entry.path):
+                    subdirs.append((entry.path, ignores))
+            elif self.discovery_filter.is_included(entry.name, relative):
+                files.append(entry.path)
+        return files, subdirs
+
+
+def discover_files(roots: typing.Iterable[str], discovery_filter: SourceDiscoveryFilter) -> typing.Iterator[str]:
+    """
+    Walk the roots with os.scandir, yielding the files not excluded. Symlinked directories are walked only when the
+    filter follows symlinks, and each directory is walked at most once.
+    """
+    for root in roots:
+        if os.path.isfile(root):
+            name = os.path.basename(root)
+            if discovery_filter.is_included(name, name):
+                yield root
+            continue
+        walk = _Walk(root, discovery_filter)
+        if not walk.visit(root):
+            continue
+        if discovery_filter.parallel:
+            yield from _walk_parallel(walk)
+        else:
+            pending = [(root, ())]
+            while len(pending) != 0:
+                directory, ignores = pending.pop()
+                files, subdirs = walk.scan(directory, ignores)
+                yield from files
+                pending.extend(reversed(subdirs))
+
+
+def _walk_parallel(walk: _Walk) -> typing.Iterator[str]:
+    with concurrent.futures.ThreadPoolExecutor(max_workers=walk.discovery_filter.max_workers) as executor:
+        pending = [executor.submit(walk.scan, walk.root, ())]
+        while len(pending) != 0:
+            files, subdirs = pending.pop(0).result()
+            yield from files
+            pending.extend([executor.submit(walk.scan, d, ignores) for d, ignores in subdirs])
@@ -1,10 +1,15 @@
 import abc
 import ast
+import collections
+import os
+import threading
 import typing
 import injector
 import networkx as nx
 
-from python_di.reflect_scanner.module_graph_models import StatementNode, Statement, StatementType
+from python_di.reflect_scanner.module_graph_models import StatementNode, Statement, StatementType, StatementSpan
+from python_di.reflect_scanner.source_code_extracter import source_line_index
+from python_di.reflect_scanner.type_dispatch import TypeDispatchTable
 
 
 class StatementParser(abc.ABC):
@@ -57,6 +62,22 @@ class AggregateStatementParser(StatementParser):
         self.statement_parsers = statement_parsers
         for p in self.statement_parsers:
             p.set_aggregate(self)
+        self.dispatch: TypeDispatchTable[StatementParser] = TypeDispatchTable(
+            self.statement_parsers, lambda parser, stmt: parser.matches(stmt))
+        statement_span_cache.parser = self
+
+    def span_statement_node(self, stmts: typing.List[ast.stmt], id_value: str,
+                            source_file: typing.Optional[str]) -> StatementNode:
+        """
+        :return: the statement node holding only the span of the statements in the source file, to be parsed when
+        the statements are retrieved, or the parsed statement node if there is no Python file to parse them from.
+        """
+        if source_file is None or not source_file.endswith('.py') or len(stmts) == 0 \
+                or getattr(stmts[-1], 'end_lineno', None) is None:
+            return self.parse_statement_node(stmts, id_value)
+        return StatementNode(id_value, None, source_file,
+                             (stmts[0].lineno, stmts[0].col_offset, stmts[-1].end_lineno, stmts[-1].end_col_offset),
+                             os.stat(source_file).st_mtime_ns)
 
     def parse_statement_node(self, stmt: typing.Union[ast.stmt, typing.List[ast.stmt]],
                              id_value: str,
@@ -84,27 +105,26 @@ class AggregateStatementParser(StatementParser):
         :return:
         """
         if not isinstance(stmt, list):
-            for parser in self.statement_parsers:
-                if parser.matches(stmt):
-                    parsed: Statement = parser.parse_statement(stmt, id_value)
-                    return StatementNode(id_value, [parsed])
+            parser = self.dispatch.first(stmt)
+            if parser is not None:
+                parsed: Statement = parser.parse_statement(stmt, id_value)
+                return StatementNode(id_value, [parsed])
 
             return StatementNode(id_value, [])
         else:
             statements = []
             for stmt_ in stmt:
-                for parser in self.statement_parsers:
-                    if parser.matches(stmt_):
-                        parsed: Statement = parser.parse_statement(stmt_, id_value)
-                        statements.append(parsed)
+                parser = self.dispatch.first(stmt_)
+                if parser is not None:
+                    statements.append(parser.parse_statement(stmt_, id_value))
 
             return StatementNode(id_value, statements)
 
 
     def parse_statement(self, stmt: ast.stmt, id_value: str) -> Statement:
-        for parser in self.statement_parsers:
-            if parser.matches(stmt):
-                return parser.parse_statement(stmt, id_value)
+        parser = self.dispatch.first(stmt)
+        if parser is not None:
+            return parser.parse_statement(stmt, id_value)
 
     def matches(self, stmt: ast.stmt):
         return True
@@ -570,3 +590,71 @@ class TupleParser(StatementParser):
     def parse_statement(self, node: ast.Tuple, id_value: str) -> Statement:
         stmts = self.parse_fields(node, id_value)
         return Statement(StatementType.Tuple, id_value, node.lineno, stmts, self.parsed_str(node))
+
+
+def parse_span(source_file: str, span: StatementSpan) -> list[ast.stmt]:
+    """
+    Parse the statements in the span of the source file, keeping their line numbers. Indented statements are parsed
+    inside an if block.
+    """
+    lineno, col_offset, end_lineno, end_col_offset = span
+    index = source_line_index(source_file)
+    contents = index.contents[index.offset(lineno, 0):index.offset(end_lineno, end_col_offset)]
+    contents = (b' ' * col_offset + contents[col_offset:]).decode('utf-8', errors='replace')
+    if col_offset == 0:
+        module = ast.parse(contents)
+        ast.increment_lineno(module, lineno - 1)
+        return module.body
+    module = ast.parse('if 1:\n' + contents)
+    ast.increment_lineno(module, lineno - 2)
+    return module.body[0].body
+
+
+class StatementSpanCache:
+    """
+    The statements parsed from the spans of the statement nodes, with the least recently retrieved evicted past
+    maxsize. The statements are keyed by the modification time of the source file the span was taken from, and a span
+    of a file modified since is not parsed.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.parser: typing.Optional[AggregateStatementParser] = None
+        self._statements: collections.OrderedDict = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def retrieve(self, source_file: str, span: StatementSpan, id_value: str,
+                 source_mtime: typing.Optional[int] = None) -> list[Statement]:
+        """
+        :param source_mtime: the modification time of the source file, in nanoseconds, when the span was taken.
+        """
+        if source_mtime is not None and os.stat(source_file).st_mtime_ns != source_mtime:
+            raise ValueError(f"Statements of {id_value} could not be parsed as {source_file} was modified after they "
+                             f"were scanned. The file must be parsed again.")
+        key = (source_file, source_mtime, span, id_value)
+        with self._lock:
+            statements = self._statements.get(key)
+            if statements is not None:
+                self._statements.move_to_end(key)
+                self.hits += 1
+                return statements
+            self.misses += 1
+
+        if self.parser is None:
+            raise ValueError(f"Statements of {id_value} in {source_file} could not be parsed as there is no statement "
+                             f"parser.")
+        statements = self.parser.parse_statement_node(parse_span(source_file, span), id_value).statements
+        with self._lock:
+            self._statements[key] = statements
+            while len(self._statements) > self.maxsize:
+                self._statements.popitem(last=False)
+        return statements
+
+    def clear(self):
+        with self._lock:
+            self._statements.clear()
+
+
+statement_span_cache = StatementSpanCache()
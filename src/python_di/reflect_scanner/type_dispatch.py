@@ -0,0 +1,49 @@
+import ast
+import threading
+import typing
+import warnings
+
+H = typing.TypeVar("H")
+
+
+def ast_node_types() -> list[type]:
+    return [v for v in vars(ast).values() if isinstance(v, type) and issubclass(v, ast.AST)]
+
+
+class TypeDispatchTable(typing.Generic[H]):
+    """
+    Maps a node class to the handlers, in order, whose matches accept nodes of that class, so that dispatching a node
+    is one dict lookup. The table is filled for the ast node classes when it is created, and any other class is added
+    the first time it is seen. Handlers are matched by the class of the node, so their matches must depend only on
+    the type of the node, as the isinstance checks of the statement parsers and type introspecters do.
+    """
+
+    def __init__(self, handlers: list[H],
+                 matches: typing.Callable[[H, typing.Any], bool],
+                 node_types: typing.Optional[typing.Iterable[type]] = None):
+        self.handlers = handlers
+        self._matches = matches
+        self._table: dict[type, list[H]] = {}
+        self._lock = threading.Lock()
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            for ty in node_types if node_types is not None else ast_node_types():
+                try:
+                    self._add(ty, ty.__new__(ty))
+                except Exception:
+                    continue
+
+    def retrieve(self, node) -> list[H]:
+        try:
+            return self._table[type(node)]
+        except KeyError:
+            return self._add(type(node), node)
+
+    def first(self, node) -> typing.Optional[H]:
+        handlers = self.retrieve(node)
+        return handlers[0] if len(handlers) != 0 else None
+
+    def _add(self, ty: type, node) -> list[H]:
+        handlers = [h for h in self.handlers if self._matches(h, node)]
+        with self._lock:
+            return self._table.setdefault(ty, handlers)
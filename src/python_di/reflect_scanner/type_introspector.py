@@ -4,6 +4,7 @@ import typing
 
 import injector
 
+from python_di.reflect_scanner.type_dispatch import TypeDispatchTable
 from python_util.logger.logger import LoggerFacade
 from python_util.ordered.ordering import Ordered
 
@@ -116,22 +117,23 @@ class AggregateTypeIntrospecter(TypeIntrospector):
         self.set_agg(self)
         for introspecter in self.introspecters:
             introspecter.set_agg(self)
+        self.dispatch: TypeDispatchTable[TypeIntrospector] = TypeDispatchTable(
+            self.introspecters, lambda introspecter, base: introspecter.matches(base))
 
     def matches(self, base):
-        return any([i.matches(base) for i in self.introspecters])
+        return len(self.dispatch.retrieve(base)) != 0
 
     def introspect_type(self, base) -> list[IntrospectedDef]:
         introspected = []
-        for i in self.introspecters:
-            if i.matches(base):
-                inner = i.introspect_type_inner(base)
-                introspected.extend(inner[1])
+        for i in self.dispatch.retrieve(base):
+            inner = i.introspect_type_inner(base)
+            introspected.extend(inner[1])
         return introspected
 
     def introspect_type_inner(self, base) -> (object, list[IntrospectedDef]):
-        for i in self.introspecters:
-            if i.matches(base):
-                return i.introspect_type_inner(base)
+        introspecter = self.dispatch.first(base)
+        if introspecter is not None:
+            return introspecter.introspect_type_inner(base)
 
 
 class AttributeAstIntrospecter(TypeIntrospector):
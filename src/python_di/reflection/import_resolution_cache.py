@@ -0,0 +1,159 @@
+import json
+import os
+import threading
+import typing
+
+from python_util.logger.logger import LoggerFacade
+
+IMPORT_CACHE_VERSION = 1
+IMPORT_CACHE_DIR_NAME = '.python_di_cache'
+IMPORT_CACHE_FILE_NAME = 'import_resolution.json'
+IMPORT_CACHE_PATH_ENV = 'PYTHON_DI_IMPORT_CACHE'
+
+MISSING_DIR = -1
+
+ResolvedT = typing.Union[str, list[str], None]
+
+
+class CachedImportError(ImportError):
+    pass
+
+
+class ImportResolutionCache:
+    """
+    Memoizes import resolution, keyed by the resolver, the module name and the package or directory it was imported
+    from. Each entry records the modification times of the directories its resolution depends on, and is discarded
+    when any of them changed, as adding or removing a module changes the modification time of its directory. The
+    directories are stat-ed at most once per scan.
+    """
+
+    def __init__(self):
+        self._entries: dict[str, dict] = {}
+        self._dir_mtimes: dict[str, int] = {}
+        self._lock = threading.RLock()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def resolve(self,
+                key: typing.Tuple,
+                resolve: typing.Callable[[], ResolvedT],
+                dependent_dirs: typing.Callable[[ResolvedT], typing.Iterable[str]]) -> ResolvedT:
+        """
+        :param key: identifies the resolution, such as the resolver, module name and current directory.
+        :param resolve: performs the resolution on a miss.
+        :param dependent_dirs: the directories whose contents determine the resolved value.
+        :return: the resolved value.
+        """
+        entry_key = '\x00'.join([str(k) for k in key])
+        with self._lock:
+            entry = self._entries.get(entry_key)
+            if entry is not None and self._is_valid(entry):
+                self.hits += 1
+                if 'error' in entry.keys():
+                    raise CachedImportError(entry['error'])
+                return entry['resolved']
+            self.misses += 1
+
+        try:
+            resolved = resolve()
+            entry = {'resolved': resolved}
+        except ImportError as e:
+            resolved = None
+            entry = {'error': str(e)}
+            error = e
+        else:
+            error = None
+
+        entry['dirs'] = {d: self._mtime(d) for d in {os.path.abspath(d) for d in dependent_dirs(resolved) if d}}
+        with self._lock:
+            self._entries[entry_key] = entry
+            self._dirty = True
+        if error is not None:
+            raise error
+        return resolved
+
+    def refresh(self):
+        """
+        Re-stat the directories on the next lookup, called at the start of each scan.
+        """
+        with self._lock:
+            self._dir_mtimes.clear()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._dir_mtimes.clear()
+            self._dirty = True
+
+    def load(self, path: str):
+        if not os.path.exists(path):
+            return
+        try:
+            with open(path, 'r') as cache_file:
+                loaded = json.load(cache_file)
+            if loaded.get('version') != IMPORT_CACHE_VERSION:
+                return
+            with self._lock:
+                for k, v in loaded['entries'].items():
+                    self._entries.setdefault(k, v)
+        except Exception as e:
+            LoggerFacade.error(f"Failed to read import resolution cache {path}: {e}.")
+
+    def write(self, path: str):
+        """
+        Persist the entries that depend on at least one directory, as the others could never be invalidated. Failed
+        resolutions are not persisted, as a module installed later need not be added to any of their directories. The
+        file is overwritten in place, so after it is first created writing it does not change the modification time
+        of its directory.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = {k: v for k, v in self._entries.items() if len(v['dirs']) != 0 and 'error' not in v.keys()}
+            self._dirty = False
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as cache_file:
+                json.dump({'version': IMPORT_CACHE_VERSION, 'entries': entries}, cache_file)
+        except Exception as e:
+            LoggerFacade.error(f"Failed to write import resolution cache {path}: {e}.")
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _is_valid(self, entry: dict) -> bool:
+        return all([self._mtime(d) == m for d, m in entry['dirs'].items()])
+
+    def _mtime(self, directory: str) -> int:
+        mtime = self._dir_mtimes.get(directory)
+        if mtime is None:
+            try:
+                mtime = os.stat(directory).st_mtime_ns
+            except OSError:
+                mtime = MISSING_DIR
+            self._dir_mtimes[directory] = mtime
+        return mtime
+
+
+import_resolution_cache = ImportResolutionCache()
+
+
+def import_cache_path(base_sources: typing.Optional[list[str]]) -> typing.Optional[str]:
+    if IMPORT_CACHE_PATH_ENV in os.environ.keys():
+        return os.environ[IMPORT_CACHE_PATH_ENV]
+    if base_sources is None or len(base_sources) == 0:
+        return None
+    base = base_sources[0]
+    base_dir = base if os.path.isdir(base) else os.path.dirname(base)
+    return os.path.join(base_dir, IMPORT_CACHE_DIR_NAME, IMPORT_CACHE_FILE_NAME)
+
+
+def module_dirs(base_dir: str, module_name: typing.Optional[str]) -> list[str]:
+    """
+    :return: the directories in which module_name.py or module_name/__init__.py would be added under base_dir.
+    """
+    if module_name is None:
+        return [base_dir]
+    module_path = os.path.join(base_dir, module_name.replace('.', os.path.sep))
+    return [os.path.dirname(module_path), module_path]
@@ -0,0 +1,91 @@
+import os
+import typing
+
+_ROOT = '\x00root'
+
+
+def _normalize(path: str) -> str:
+    return os.path.normpath(os.path.abspath(path if len(path) != 0 else os.getcwd()))
+
+
+def _components(path: str) -> list[str]:
+    return [p for p in path.split(os.sep) if len(p) != 0]
+
+
+class ModuleNameIndex:
+    """
+    Maps source files to module names. The roots are kept in a trie of their path components, so the roots containing
+    a file are found in one walk down the path of the file. The root chosen is the one at which the package layout
+    of the file starts, the parent of the outermost directory with an __init__.py, or otherwise the closest root above
+    it, so that the module name is the one it would be imported by.
+    """
+
+    def __init__(self, roots: typing.Iterable[str]):
+        self._trie: dict = {}
+        self._is_package: dict[str, bool] = {}
+        self._module_names: dict[str, typing.Optional[str]] = {}
+        for root in roots:
+            self.add_root(root)
+
+    def add_root(self, root: str):
+        node = self._trie
+        normalized = _normalize(root)
+        for c in _components(normalized):
+            node = node.setdefault(c, {})
+        node[_ROOT] = normalized
+
+    def roots_of(self, source_file: str) -> list[str]:
+        """
+        :return: the roots containing the source file, outermost first.
+        """
+        found = []
+        node = self._trie
+        if _ROOT in node.keys():
+            found.append(node[_ROOT])
+        for c in _components(_normalize(source_file))[:-1]:
+            node = node.get(c)
+            if node is None:
+                break
+            if _ROOT in node.keys():
+                found.append(node[_ROOT])
+        return found
+
+    def module_name(self, source_file: str) -> typing.Optional[str]:
+        """
+        :return: the module name of the source file, or None if no root contains it.
+        """
+        if source_file not in self._module_names.keys():
+            self._module_names[source_file] = self._find_module_name(_normalize(source_file))
+        return self._module_names[source_file]
+
+    def _find_module_name(self, source_file: str) -> typing.Optional[str]:
+        roots = self.roots_of(source_file)
+        if len(roots) == 0:
+            return None
+        package_root = self._package_root(source_file)
+        above = [r for r in roots if len(r) <= len(package_root)]
+        root = above[-1] if len(above) != 0 else roots[-1]
+        return _to_module_name(os.path.relpath(source_file, root))
+
+    def _package_root(self, source_file: str) -> str:
+        directory = os.path.dirname(source_file)
+        while self._has_init(directory):
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                break
+            directory = parent
+        return directory
+
+    def _has_init(self, directory: str) -> bool:
+        if directory not in self._is_package.keys():
+            self._is_package[directory] = os.path.isfile(os.path.join(directory, '__init__.py'))
+        return self._is_package[directory]
+
+
+def _to_module_name(relativized: str) -> str:
+    parts = _components(relativized)
+    if parts[-1].endswith('.py'):
+        parts[-1] = parts[-1][:-3]
+    if len(parts) > 1 and parts[-1] == '__init__':
+        parts = parts[:-1]
+    return '.'.join(parts)
@@ -40,6 +40,12 @@ def resolve_import_name(class_name, source_code):
 
 
 def get_module_path(module_name):
+    from python_di.reflection.import_resolution_cache import import_resolution_cache
+    return import_resolution_cache.resolve(('find_spec', module_name), lambda: _find_module_path(module_name),
+                                           lambda resolved: [os.path.dirname(resolved)] if resolved else [])
+
+
+def _find_module_path(module_name):
     # Find the module based on the name and get its spec
     spec = importlib.util.find_spec(module_name)
     if spec is None:
@@ -179,6 +185,14 @@ class ImportResolver:
 
     @classmethod
     def _get_module_path(cls, module_name, current_dir, package_name = None):
+        from python_di.reflection.import_resolution_cache import import_resolution_cache
+        return import_resolution_cache.resolve(
+            ('import_module', module_name, package_name, current_dir),
+            lambda: cls._do_get_module_path(module_name, current_dir, package_name),
+            lambda resolved: [current_dir, os.path.dirname(resolved)] if resolved else [])
+
+    @classmethod
+    def _do_get_module_path(cls, module_name, current_dir, package_name = None):
         if package_name is not None:
             module_import = importlib.import_module(package_name, module_name)
         else:
@@ -0,0 +1,75 @@
+import json
+import os.path
+import shutil
+import tempfile
+import unittest
+
+import injector
+
+from python_di.inject.context_builder.component_manifest import ComponentManifest, ManifestEntry, \
+    retrieve_source_files, load_fresh_manifest, MANIFEST_FILE_NAME
+from python_di.inject.context_builder.component_scanner import ComponentScanner
+from python_di.inject.context_builder.injection_context import InjectionContextInjectorContextArgs
+
+
+class ComponentManifestTest(unittest.TestCase):
+
+    def test_manifest_freshness(self):
+        with tempfile.TemporaryDirectory() as source:
+            component_file = os.path.join(source, 'component.py')
+            with open(component_file, 'w') as f:
+                f.write('class Component:\n    pass\n')
+            manifest = ComponentManifest([source], [ManifestEntry('component', component_file, 'Component',
+                                                                  'component')],
+                                         retrieve_source_files([source]))
+            manifest.write(os.path.join(source, MANIFEST_FILE_NAME))
+
+            loaded = load_fresh_manifest(source)
+            assert loaded is not None
+            assert loaded.covers([source])
+            assert not loaded.covers([os.path.dirname(source)])
+            assert len(loaded.retrieve_entries([source], 'component')) == 1
+            assert len(loaded.retrieve_entries([source], 'configuration')) == 0
+
+            with open(os.path.join(source, MANIFEST_FILE_NAME), 'r') as f:
+                written = json.load(f)
+            assert written['sources'] == ['.']
+            assert list(written['files'].keys()) == ['component.py']
+            assert written['entries'][0]['source_file'] == 'component.py'
+
+            os.makedirs(os.path.join(source, '.venv'))
+            with open(os.path.join(source, '.venv', 'excluded.py'), 'w') as f:
+                f.write('\n')
+            assert load_fresh_manifest(source) is not None
+
+            with tempfile.TemporaryDirectory() as moved_parent:
+                moved = os.path.join(moved_parent, 'moved')
+                shutil.copytree(source, moved)
+                relocated = load_fresh_manifest(moved)
+                assert relocated is not None
+                assert relocated.entries[0].source_file == os.path.join(moved, 'component.py')
+                assert relocated.covers([moved])
+
+            with open(os.path.join(source, 'other.py'), 'w') as f:
+                f.write('\n')
+            assert load_fresh_manifest(source) is None
+
+    def test_retrieve_decorated_from_manifest(self):
+        from python_di.inject.context_builder.injection_context import InjectionContext
+        inject_ctx = InjectionContext()
+        ctx = inject_ctx.initialize_env()
+        component_scanner: ComponentScanner = ctx.get_interface(ComponentScanner, scope=injector.singleton)
+
+        starting = os.path.dirname(os.path.dirname(__file__))
+        args = InjectionContextInjectorContextArgs(inject_ctx.ctx, {starting}, os.path.dirname(starting))
+        scanned = component_scanner._retrieve_decorated(args, "configuration")
+        manifest = component_scanner.build_manifest(args)
+        assert manifest.covers({starting})
+
+        component_scanner._manifests[args.starting] = manifest
+        from_manifest = component_scanner._retrieve_decorated(args, "configuration")
+        assert set(from_manifest) == set(scanned)
+
+
+if __name__ == '__main__':
+    unittest.main()
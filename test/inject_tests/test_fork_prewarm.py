@@ -0,0 +1,94 @@
+import os
+import threading
+import unittest
+
+from python_di.configs.fork import after_fork
+from python_di.inject.context_builder import fork_prewarm
+from python_di.inject.context_builder.fork_prewarm import register_per_process, retrieve_after_fork_hooks, \
+    reset_after_fork, prewarm
+from python_di.inject.context_builder.injection_context import InjectionContext
+from python_di.inject.profile_composite_injector.scopes.prototype_scope import prototype_scope_lock
+from test_contexts.prewarm_component_scan.prewarm_component_scan_referenced_package.prewarm_component_referenced \
+    import PrewarmProfileBean, PrewarmSingletonComponent
+
+
+class PerProcessBean:
+    def __init__(self):
+        self.pid = os.getpid()
+
+    @after_fork
+    def recreate(self):
+        self.pid = os.getpid()
+
+
+class ForkPrewarmTest(unittest.TestCase):
+
+    def test_after_fork_hooks(self):
+        assert len(retrieve_after_fork_hooks(PerProcessBean)) == 1
+        self.assertRaises(ValueError, lambda: register_per_process(object()))
+
+        bean = PerProcessBean()
+        register_per_process(bean)
+        register_per_process(bean)
+        assert len([b for b in fork_prewarm._per_process_beans if b is bean]) == 1
+
+        bean.pid = -1
+        reset_after_fork()
+        assert bean.pid == os.getpid()
+
+    @unittest.skipUnless(hasattr(os, 'fork'), "Requires fork.")
+    def test_locks_released_in_child(self):
+        bean = PerProcessBean()
+        register_per_process(bean)
+        fork_prewarm._register_at_fork()
+
+        held = threading.Event()
+        release = threading.Event()
+
+        def hold_lock():
+            with prototype_scope_lock:
+                held.set()
+                release.wait()
+
+        holder = threading.Thread(target=hold_lock)
+        holder.start()
+        held.wait()
+        try:
+            pid = os.fork()
+            if pid == 0:
+                acquired = prototype_scope_lock.acquire(timeout=1)
+                os._exit(0 if acquired and bean.pid == os.getpid() else 1)
+            _, status = os.waitpid(pid, 0)
+            assert os.waitstatus_to_exitcode(status) == 0
+        finally:
+            release.set()
+            holder.join()
+
+    def test_prewarm_context(self):
+        PrewarmProfileBean.created = 0
+        PrewarmSingletonComponent.created = 0
+        inject_ctx = InjectionContext()
+        inject_ctx.initialize_env()
+        to_scan = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'test_contexts',
+                               'prewarm_component_scan')
+        inject_ctx.build_context({to_scan}, os.path.dirname(os.path.dirname(__file__)))
+
+        instances = prewarm(inject_ctx, freeze=False)
+        assert PrewarmProfileBean.created == 1
+        assert PrewarmSingletonComponent.created == 1
+        profile_bean = [i for i in instances if isinstance(i, PrewarmProfileBean)]
+        singleton = [i for i in instances if isinstance(i, PrewarmSingletonComponent)]
+        assert len(profile_bean) == 1 and len(singleton) == 1
+        assert any([b is profile_bean[0] for b in fork_prewarm._per_process_beans])
+
+        profile_bean[0].pid = -1
+        reset_after_fork()
+        assert profile_bean[0].pid == os.getpid()
+        assert inject_ctx.ctx.get_interface(PrewarmProfileBean) is profile_bean[0]
+        assert inject_ctx.ctx.get_interface(PrewarmSingletonComponent) is singleton[0]
+        assert PrewarmProfileBean.created == 1
+        assert PrewarmSingletonComponent.created == 1
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+IMPORT_BUDGET_MS_ENV = 'PYTHON_DI_IMPORT_BUDGET_MS'
+
+RUNTIME_MODULE = 'python_di.inject.context_builder.injection_context'
+
+DEFERRED_MODULES = ['python_di.reflect_scanner', 'python_di.reflect_scanner.antlr_adapter', 'networkx', 'antlr4',
+                    'yaml', 'dotenv']
+
+_measure_import = f"""
+import json, sys, time
+start = time.perf_counter()
+import {RUNTIME_MODULE}
+elapsed = (time.perf_counter() - start) * 1000
+print(json.dumps({{'elapsed_ms': elapsed, 'loaded': [m for m in {DEFERRED_MODULES!r} if m in sys.modules]}}))
+"""
+
+
+class ImportBudgetTest(unittest.TestCase):
+    """
+    The DI runtime should not import the scanner or the environment file loaders until they are used, and the scanner
+    context is not bound until the first scan. The import time is only checked against a budget when
+    PYTHON_DI_IMPORT_BUDGET_MS is set, as wall clock time depends on the machine.
+    """
+
+    def test_import_budget(self):
+        out = subprocess.run([sys.executable, '-c', _measure_import], capture_output=True, text=True,
+                             env=os.environ.copy(), cwd=os.path.dirname(os.path.dirname(__file__)))
+        assert out.returncode == 0, out.stderr
+        measured = json.loads(out.stdout.strip().splitlines()[-1])
+        assert len(measured['loaded']) == 0, f"Importing the runtime loaded {measured['loaded']}."
+        budget_ms = os.environ.get(IMPORT_BUDGET_MS_ENV)
+        if budget_ms is not None:
+            assert measured['elapsed_ms'] < float(budget_ms), \
+                f"Importing the runtime took {measured['elapsed_ms']} ms, budget was {budget_ms} ms."
+
+    def test_scanner_bound_on_first_scan(self):
+        from python_di.inject.context_builder.injection_context import InjectionContext
+        from python_di.reflect_scanner.program_parser import ProgramParser
+        inject_ctx = InjectionContext()
+        ctx = inject_ctx.initialize_env()
+        assert not ctx.contains_binding(ProgramParser)
+        to_scan = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'test_contexts', 'lazy_component_scan')
+        inject_ctx.build_context({to_scan}, os.path.dirname(os.path.dirname(__file__)))
+        assert ctx.contains_binding(ProgramParser)
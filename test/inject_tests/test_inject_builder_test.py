@@ -145,6 +145,26 @@ class InjectorBuilder(unittest.TestCase):
         assert prototype_created.other_value is not None
         assert prototype_created.to_pass == 'hello'
 
+    def test_prototype_create_many(self):
+        inject_ctx = InjectionContext()
+        env = inject_ctx.initialize_env()
+
+        assert env is not None
+
+        to_scan = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'test_contexts',
+                               'test_profiles_component_scan')
+        inject_ctx.build_context({to_scan}, os.path.dirname(os.path.dirname(__file__)))
+        created = inject_ctx.ctx.create_many(TestPrototypeBean, [{'to_pass': str(i)} for i in range(5)])
+        assert len(created) == 5
+        assert [c.to_pass for c in created] == [str(i) for i in range(5)]
+        assert len({id(c) for c in created}) == 5
+        assert all([c.other_value is created[0].other_value for c in created])
+
+        streamed = inject_ctx.ctx.create_many(TestPrototypeBean, ({'to_pass': 'hello'} for _ in range(3)),
+                                              stream=True)
+        assert isinstance(streamed, typing.Iterator)
+        assert all([s.to_pass == 'hello' for s in streamed])
+
 
     def test_inject_config(self):
         inject_ctx = InjectionContext()
@@ -0,0 +1,77 @@
+import os.path
+import threading
+import typing
+import unittest
+
+from python_di.inject.context_builder.injection_context import InjectionContext
+from python_di.inject.lazy_proxy import LazyProxy, Lazy, is_lazy_type, retrieve_lazy_type, is_initialized
+from test_contexts.lazy_component_scan.lazy_component_scan_referenced_package.lazy_component_referenced import \
+    ExpensiveLazyBean, LazyDependentComponent
+
+
+class ExpensiveBean:
+    created = 0
+
+    def __init__(self):
+        ExpensiveBean.created += 1
+        self.value = 'expensive'
+
+    def retrieve(self):
+        return self.value
+
+
+class LazyProxyTest(unittest.TestCase):
+
+    def test_lazy_proxy(self):
+        ExpensiveBean.created = 0
+        proxy = LazyProxy(ExpensiveBean)
+        assert not is_initialized(proxy)
+        assert ExpensiveBean.created == 0
+        assert proxy.retrieve() == 'expensive'
+        assert is_initialized(proxy)
+        assert isinstance(proxy, ExpensiveBean)
+        proxy.value = 'changed'
+        assert proxy.value == 'changed'
+        assert ExpensiveBean.created == 1
+
+    def test_nested_lazy_proxy(self):
+        ExpensiveBean.created = 0
+        proxy = LazyProxy(lambda: LazyProxy(ExpensiveBean))
+        assert ExpensiveBean.created == 0
+        assert isinstance(proxy, ExpensiveBean)
+        assert proxy.retrieve() == 'expensive'
+        assert ExpensiveBean.created == 1
+
+    def test_lazy_proxy_threads(self):
+        ExpensiveBean.created = 0
+        proxy = LazyProxy(ExpensiveBean)
+        threads = [threading.Thread(target=lambda: proxy.retrieve()) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert ExpensiveBean.created == 1
+
+    def test_lazy_type(self):
+        assert is_lazy_type(Lazy[ExpensiveBean])
+        assert not is_lazy_type(ExpensiveBean)
+        assert not is_lazy_type(typing.List[ExpensiveBean])
+        assert retrieve_lazy_type(Lazy[ExpensiveBean]) == ExpensiveBean
+
+    def test_lazy_component_dependency(self):
+        ExpensiveLazyBean.created = 0
+        inject_ctx = InjectionContext()
+        env = inject_ctx.initialize_env()
+
+        assert env is not None
+
+        to_scan = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'test_contexts',
+                               'lazy_component_scan')
+        inject_ctx.build_context({to_scan}, os.path.dirname(os.path.dirname(__file__)))
+        dependent: LazyDependentComponent = inject_ctx.ctx.get_interface(LazyDependentComponent)
+        assert dependent is not None
+        assert not is_initialized(dependent.expensive)
+        assert ExpensiveLazyBean.created == 0
+        assert dependent.expensive.value == 'expensive'
+        assert isinstance(dependent.expensive, ExpensiveLazyBean)
+        assert ExpensiveLazyBean.created == 1
@@ -0,0 +1,91 @@
+import os.path
+import unittest
+
+from python_di.configs.prototype import pre_reuse
+from python_di.inject.context_builder.injection_context import InjectionContext
+from python_di.inject.profile_composite_injector.scopes.pooled_scope import BeanPool, pooled_scope_decorator
+from test_contexts.test_profiles_component_scan.component_scan_referenced_package.prototype_bean_ref import \
+    TestPrototypeBean
+
+
+class PooledBuffer:
+    def __init__(self):
+        self.values = []
+
+    @pre_reuse
+    def reset(self):
+        self.values.clear()
+
+
+class NamedBuffer(PooledBuffer):
+    def __init__(self, name: str = 'default'):
+        super().__init__()
+        self.name = name
+        self.resets = 0
+
+    @pre_reuse
+    def reset(self):
+        self.resets += 1
+
+
+class PooledScopeTest(unittest.TestCase):
+
+    def test_pool_reuse(self):
+        pool = BeanPool(max_size=1)
+        first = pool.acquire(PooledBuffer)
+        first.values.append(1)
+        pool.release(first)
+        assert len(first.values) == 0
+
+        with pool.borrow(PooledBuffer) as borrowed:
+            assert borrowed is first
+            with pool.borrow(PooledBuffer) as exhausted:
+                assert exhausted is not first
+
+        assert len(pool) == 1
+        assert pool.stats.hits == 1
+        assert pool.stats.misses == 2
+        assert pool.stats.discarded == 1
+        assert pool.stats.max_occupancy == 1
+        assert pool.stats.max_in_use == 2
+        assert pool.stats.hit_rate == 1 / 3
+
+    def test_pool_keyed_by_kwargs(self):
+        pool = BeanPool(max_size=2)
+        first = pool.acquire(NamedBuffer, name='first')
+        first.values.append(1)
+        pool.release(first)
+        assert first.resets == 1
+        assert len(first.values) == 1
+
+        with pool.borrow(NamedBuffer, name='second') as second:
+            assert second is not first
+            assert second.name == 'second'
+        with pool.borrow(NamedBuffer, name='first') as reused:
+            assert reused is first
+
+    def test_pool_rejects_unknown_release(self):
+        pool = BeanPool(max_size=2)
+        bean = pool.acquire(PooledBuffer)
+        pool.release(bean)
+        self.assertRaises(ValueError, lambda: pool.release(bean))
+        self.assertRaises(ValueError, lambda: pool.release(PooledBuffer()))
+        assert len(pool) == 1
+        assert pool.in_use == 0
+
+    def test_pooled_prototype_bean(self):
+        inject_ctx = InjectionContext()
+        env = inject_ctx.initialize_env()
+
+        assert env is not None
+
+        to_scan = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'test_contexts',
+                               'test_profiles_component_scan')
+        inject_ctx.build_context({to_scan}, os.path.dirname(os.path.dirname(__file__)))
+        pooled = pooled_scope_decorator(max_size=2)
+        with inject_ctx.ctx.borrow(TestPrototypeBean, pooled, to_pass='hello') as created:
+            assert created.to_pass == 'hello'
+            assert created.other_value is not None
+        with inject_ctx.ctx.borrow(TestPrototypeBean, pooled, to_pass='hello') as reused:
+            assert reused is created
+        assert pooled.stats(TestPrototypeBean).hits == 1
@@ -0,0 +1,63 @@
+import os.path
+import unittest
+
+import injector
+
+from python_di.inject.context_builder.component_scanner import ComponentScanner
+
+
+class ProgramGraphSessionTest(unittest.TestCase):
+
+    def test_parsed_once_and_extended(self):
+        from python_di.inject.context_builder.injection_context import InjectionContext
+        inject_ctx = InjectionContext()
+        ctx = inject_ctx.initialize_env()
+        component_scanner: ComponentScanner = ctx.get_interface(ComponentScanner, scope=injector.singleton)
+
+        test_dir = os.path.dirname(os.path.dirname(__file__))
+        inject_tests = os.path.join(test_dir, 'inject_tests')
+        component_scanner.begin_scan_session()
+        session = component_scanner._retrieve_session(inject_ctx.ctx)
+
+        configurations = session.retrieve_decorated('configuration', [inject_tests])
+        num_parsed = len(session.parser.file_graphs)
+        assert session.retrieve_decorated('component', [inject_tests]) is not None
+        assert len(session.parser.file_graphs) == num_parsed
+
+        all_configurations = session.retrieve_decorated('configuration', [test_dir])
+        assert len(session.parser.file_graphs) > num_parsed
+        assert len(all_configurations) >= len(configurations)
+        assert len(session.retrieve_decorated('configuration', [inject_tests])) == len(configurations)
+
+        component_scanner.end_scan_session()
+        assert component_scanner._retrieve_session(inject_ctx.ctx) is not session
+
+    def test_release_scan_state(self):
+        from python_di.inject.context_builder.injection_context import InjectionContext
+        inject_ctx = InjectionContext()
+        ctx = inject_ctx.initialize_env()
+        component_scanner: ComponentScanner = ctx.get_interface(ComponentScanner, scope=injector.singleton)
+
+        inject_tests = os.path.dirname(__file__)
+        component_scanner.begin_scan_session()
+        session = component_scanner._retrieve_session(inject_ctx.ctx)
+        configurations = session.retrieve_decorated('configuration', [inject_tests])
+        num_nodes = len(session.parser.program_graph.nodes)
+        component_scanner.end_scan_session()
+
+        component_scanner.release_scan_state()
+        assert session.parser.released
+        assert len(session.parser.file_graphs) == 0
+
+        assert len(session.parser.program_graph.nodes) == num_nodes
+        assert not session.parser.released
+        assert len(session.parser.file_graphs) != 0
+
+        component_scanner.begin_scan_session()
+        next_session = component_scanner._retrieve_session(inject_ctx.ctx)
+        assert len(next_session.retrieve_decorated('configuration', [inject_tests])) == len(configurations)
+        component_scanner.end_scan_session()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import asyncio
+import os.path
+import uuid
+from unittest import TestCase
+
+import injector
+from injector import Binder
+
+from python_di.inject.context_builder.injection_context import InjectionContext
+from python_di.inject.profile_composite_injector.composite_injector import request_scope, task_scope
+from python_di.inject.profile_composite_injector.scopes.request_scope import request_context, \
+    ScopeNotActiveException
+
+
+class RequestBean:
+    def __init__(self):
+        self.test = str(uuid.uuid4())
+
+
+class TaskBean:
+    def __init__(self):
+        self.test = str(uuid.uuid4())
+
+
+class RequestMod(injector.Module):
+
+    def configure(self, binder: Binder) -> None:
+        binder.bind(RequestBean, RequestBean, scope=request_scope)
+        binder.bind(TaskBean, TaskBean, scope=task_scope)
+
+
+class ContextRequestBean:
+    def __init__(self):
+        self.test = str(uuid.uuid4())
+
+
+class ContextUnscopedBean:
+    def __init__(self):
+        self.test = str(uuid.uuid4())
+
+
+class RequestScopeTest(TestCase):
+
+    def test_request_scope(self):
+        inj = injector.Injector([RequestMod()])
+        with request_context():
+            first = inj.get(RequestBean)
+            assert first is inj.get(RequestBean)
+        with request_context():
+            assert first is not inj.get(RequestBean)
+        self.assertRaises(ScopeNotActiveException, lambda: inj.get(RequestBean))
+
+    def test_task_scope(self):
+        inj = injector.Injector([RequestMod()])
+
+        async def retrieve_twice():
+            first = inj.get(TaskBean)
+            await asyncio.sleep(0)
+            assert first is inj.get(TaskBean)
+            return first
+
+        async def run_tasks():
+            return await asyncio.gather(retrieve_twice(), retrieve_twice())
+
+        one, two = asyncio.run(run_tasks())
+        assert one is not two
+        self.assertRaises(ScopeNotActiveException, lambda: inj.get(TaskBean))
+
+    def test_request_scope_through_context(self):
+        inject_ctx = InjectionContext()
+        env = inject_ctx.initialize_env()
+
+        assert env is not None
+
+        to_scan = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'test_contexts',
+                               'test_profiles_component_scan')
+        inject_ctx.build_context({to_scan}, os.path.dirname(os.path.dirname(__file__)))
+        inject_ctx.ctx.register_component(ContextRequestBean, [ContextRequestBean], request_scope)
+        with request_context():
+            first = inject_ctx.ctx.get_interface(ContextRequestBean)
+            assert first is inject_ctx.ctx.get_interface(ContextRequestBean)
+        with request_context():
+            second = inject_ctx.ctx.get_interface(ContextRequestBean)
+        assert first is not None and second is not None
+        assert first is not second
+
+    def test_unscoped_through_context(self):
+        inject_ctx = InjectionContext()
+        inject_ctx.initialize_env()
+
+        to_scan = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'test_contexts',
+                               'test_profiles_component_scan')
+        inject_ctx.build_context({to_scan}, os.path.dirname(os.path.dirname(__file__)))
+        inject_ctx.ctx.register_component(ContextUnscopedBean, [ContextUnscopedBean], None)
+        unscoped = inject_ctx.ctx.get_interface(ContextUnscopedBean)
+        assert unscoped is not None
+        assert unscoped is inject_ctx.ctx.get_interface(ContextUnscopedBean)
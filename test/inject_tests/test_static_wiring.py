@@ -0,0 +1,84 @@
+import os.path
+import tempfile
+import typing
+import unittest
+
+import injector
+
+from python_di.inject.context_builder.injection_context import InjectionContext
+from python_di.inject.context_builder.static_wiring import load_wiring_module, is_fresh
+from python_di.inject.profile_composite_injector.composite_injector import profile_scope
+from test_contexts.test_profiles_component_scan.component_scan_referenced_package.component_referenced import \
+    ProfileComponentReferencedFromPackage
+from test_contexts.test_profiles_component_scan.component_scan_referenced_package.configuration_referenced import \
+    OtherProfileComponentFromConfiguration, OtherComponentFromConfigurationNoDeps, \
+    OtherDifferentProfileComponentFromConfigurationNoDeps
+from test_contexts.test_profiles_component_scan.component_scan_referenced_package.multibindable_component_ref import \
+    MultibindableInterface
+
+
+def resolve_beans(ctx) -> dict:
+    resolved = {
+        'no_deps': ctx.get_interface(OtherComponentFromConfigurationNoDeps, scope=injector.singleton).test_value,
+        'multibind': sorted([type(m).__name__ for m in ctx.get_interface(typing.List[MultibindableInterface])])
+    }
+    for profile in ['test', 'validation']:
+        resolved[f'component_{profile}'] = ctx.get_interface(ProfileComponentReferencedFromPackage, profile=profile,
+                                                             scope=profile_scope).name
+        resolved[f'configuration_{profile}'] = ctx.get_interface(OtherProfileComponentFromConfiguration,
+                                                                 profile=profile,
+                                                                 scope=profile_scope).component_ref.name
+        resolved[f'different_{profile}'] = ctx.get_interface(OtherDifferentProfileComponentFromConfigurationNoDeps,
+                                                             profile=profile, scope=profile_scope).test_value
+    return resolved
+
+
+class StaticWiringTest(unittest.TestCase):
+
+    def test_generate_wiring(self):
+        inject_ctx = InjectionContext()
+        inject_ctx.initialize_env()
+        to_scan = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'test_contexts',
+                               'test_profiles_component_scan')
+        inject_ctx.build_context({to_scan}, os.path.dirname(os.path.dirname(__file__)))
+
+        with tempfile.TemporaryDirectory() as codegen:
+            path = inject_ctx.generate_wiring(os.path.join(codegen, 'python_di_wiring.py'))
+            with open(path, 'r') as wiring_file:
+                generated = wiring_file.read()
+
+            assert 'def wire(ctx):' in generated
+            assert 'def lifecycle(ctx):' in generated
+            assert 'bean_provider(' in generated
+            assert 'multibind_provider(' in generated
+            assert '_do_multibind_curry' not in generated
+
+            wiring = load_wiring_module(path)
+            assert is_fresh(wiring)
+            assert to_scan in wiring.SOURCES
+            assert not inject_ctx.boot_from_wiring(os.path.join(codegen, 'missing.py'))
+
+    def test_boot_from_wiring(self):
+        scanned_ctx = InjectionContext()
+        scanned_ctx.initialize_env()
+        to_scan = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'test_contexts',
+                               'test_profiles_component_scan')
+        scanned_ctx.build_context({to_scan}, os.path.dirname(os.path.dirname(__file__)))
+        scanned = resolve_beans(scanned_ctx.ctx)
+
+        with tempfile.TemporaryDirectory() as codegen:
+            path = scanned_ctx.generate_wiring(os.path.join(codegen, 'python_di_wiring.py'))
+            booted_ctx = InjectionContext()
+            booted_ctx.initialize_env()
+            assert booted_ctx.boot_from_wiring(path)
+            assert booted_ctx.ctx is not scanned_ctx.ctx
+            assert booted_ctx.factories is None
+            booted = resolve_beans(booted_ctx.ctx)
+
+        assert booted == scanned
+        assert scanned['component_test'] == 'test'
+        assert scanned['component_validation'] == 'validation'
+
+
+if __name__ == '__main__':
+    unittest.main()
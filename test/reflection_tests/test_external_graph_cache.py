@@ -0,0 +1,81 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from python_di.reflect_scanner.external_graph_cache import ExternalDependencyPolicy, ExternalGraphCache
+
+_retrieve_graph = """
+import json, sys
+from python_di.reflect_scanner.external_graph_cache import ExternalGraphCache
+from python_di.reflect_scanner.module_graph_models import ProgramNode, NodeType
+cache_dir, external_file = sys.argv[1], sys.argv[2]
+node = ProgramNode(NodeType.CLASS, external_file, 'External')
+cache = ExternalGraphCache(cache_dir)
+graph = cache.retrieve(external_file, 'full', lambda: {node: 'External'})
+loaded = list(graph.keys())[0]
+print(json.dumps({'hits': cache.hits, 'found': graph.get(node), 'same_hash': hash(loaded) == hash(node)}))
+"""
+
+
+class ExternalGraphCacheTest(unittest.TestCase):
+
+    def test_policy(self):
+        policy = ExternalDependencyPolicy(max_depth=2, allow=['torch', 'numpy'], deny=['torch.nn'])
+        assert policy.allows_depth(2)
+        assert not policy.allows_depth(3)
+        assert policy.allows_module('torch')
+        assert policy.allows_module('torch.optim')
+        assert not policy.allows_module('torch.nn.functional')
+        assert not policy.allows_module('torchvision')
+        assert ExternalDependencyPolicy().allows_module('torchvision')
+
+    def test_cache_across_runs(self):
+        with tempfile.TemporaryDirectory() as source, tempfile.TemporaryDirectory() as cache_dir:
+            external_file = os.path.join(source, 'external.py')
+            with open(external_file, 'w') as f:
+                f.write('class External:\n    pass\n')
+
+            parsed = []
+
+            def parse():
+                parsed.append(external_file)
+                return {'graph': external_file}
+
+            assert ExternalGraphCache(cache_dir).retrieve(external_file, 'full', parse) == {'graph': external_file}
+            cache = ExternalGraphCache(cache_dir)
+            assert cache.retrieve(external_file, 'full', parse) == {'graph': external_file}
+            assert len(parsed) == 1
+            assert cache.hits == 1
+
+            cache.retrieve(external_file, 'component-scan', parse)
+            assert len(parsed) == 2
+
+    def test_cache_across_processes(self):
+        with tempfile.TemporaryDirectory() as source, tempfile.TemporaryDirectory() as cache_dir:
+            external_file = os.path.join(source, 'external.py')
+            with open(external_file, 'w') as f:
+                f.write('class External:\n    pass\n')
+
+            written = self._retrieve_in_process(cache_dir, external_file, '1')
+            assert written['hits'] == 0
+            loaded = self._retrieve_in_process(cache_dir, external_file, '2')
+            assert loaded['hits'] == 1
+            assert loaded['same_hash']
+            assert loaded['found'] == 'External'
+
+    @staticmethod
+    def _retrieve_in_process(cache_dir: str, external_file: str, hash_seed: str) -> dict:
+        env = os.environ.copy()
+        env['PYTHONHASHSEED'] = hash_seed
+        out = subprocess.run([sys.executable, '-c', _retrieve_graph, cache_dir, external_file],
+                             capture_output=True, text=True, env=env,
+                             cwd=os.path.dirname(os.path.dirname(__file__)))
+        assert out.returncode == 0, out.stderr
+        return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import os
+import tempfile
+import unittest
+
+from python_di.reflect_scanner.graph_file import ProgramGraphWriter, load_program_graph, write_program_graph
+from python_di.reflect_scanner.graph_scanner import retrieve_decorated_by_ids, retrieve_module
+from python_di.reflect_scanner.graph_store import create_graph, COMPACT_BACKEND
+from python_di.reflect_scanner.module_graph_models import ProgramNode, NodeType, DecoratorProgramNode, GraphType, \
+    ClassFunctionProgramNode
+
+
+class GraphFileTest(unittest.TestCase):
+
+    def test_write_and_load(self):
+        graph = create_graph(COMPACT_BACKEND)
+        module = ProgramNode(NodeType.MODULE, 'module.py', 'module.py')
+        class_node = ProgramNode(NodeType.CLASS, 'module.py', 'Component')
+        fn_node = ClassFunctionProgramNode('Component', 'module.py', 'configure')
+        decorator = DecoratorProgramNode('component', 'Component', 'module.py', NodeType.CLASS)
+        graph.add_edge(class_node, module)
+        graph.add_edge(class_node, decorator)
+        graph.add_edge(class_node, fn_node)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'program.graph')
+            write_program_graph(graph, path)
+            loaded = load_program_graph(path)
+            assert loaded.number_of_nodes() == 4
+            assert loaded.number_of_edges() == 3
+            assert class_node in loaded
+            assert loaded.has_edge(class_node, decorator)
+            assert not loaded.has_edge(decorator, class_node)
+            assert [n.id_value for n in loaded.predecessors(module)] == ['Component']
+
+            classes = loaded.nodes_of_type(NodeType.CLASS)
+            assert [c.id_value for c in classes] == ['Component']
+            assert retrieve_module(loaded, classes[0], GraphType.Program).source_file == 'module.py'
+            decorated = retrieve_decorated_by_ids(loaded, ['component', 'configuration'], GraphType.Program)
+            assert [c.id_value for c in decorated['component']] == ['Component']
+            assert decorated['configuration'] == []
+            fns = [n for n in loaded.nodes if isinstance(n, ClassFunctionProgramNode)]
+            assert [(f.class_id, f.id_value) for f in fns] == [('Component', 'configure')]
+            loaded.close()
+
+            with ProgramGraphWriter(path) as writer:
+                writer.add_graph(graph)
+                writer.add_edge(module, ProgramNode(NodeType.MODULE, 'other.py', 'other.py'))
+                writer.add_graph(graph)
+            extended = load_program_graph(path)
+            assert extended.number_of_nodes() == 5
+            assert extended.number_of_edges() == 4
+            extended.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+import random
+import unittest
+
+from python_di.reflect_scanner.graph_reachability import ReachabilityIndex, graph_reachability, \
+    invalidate_graph_reachability
+from python_di.reflect_scanner.graph_scanner import retrieve_transitive_subclasses, retrieve_importing_modules
+from python_di.reflect_scanner.graph_store import create_graph, COMPACT_BACKEND, NETWORKX_BACKEND
+from python_di.reflect_scanner.module_graph_models import ProgramNode, NodeType, GraphType
+
+
+def reachable(edges, u):
+    found = set([])
+    pending = [v for x, v in edges if x == u]
+    while len(pending) != 0:
+        v = pending.pop()
+        if v not in found:
+            found.add(v)
+            pending.extend([w for x, w in edges if x == v])
+    return found
+
+
+class GraphReachabilityTest(unittest.TestCase):
+
+    def test_reachability_index(self):
+        rand = random.Random(7)
+        edges = set([(rand.randrange(100), rand.randrange(100)) for _ in range(150)])
+        built = ReachabilityIndex()
+        built.set_edges(edges)
+        incremental = ReachabilityIndex()
+        incremental.set_edges(set(list(edges)[:10]))
+        for u, v in edges:
+            incremental.add_edge(u, v)
+        expected = {u: reachable(edges, u) for u in range(100)}
+        for u in range(100):
+            assert set(built.reachable(u)) == expected[u]
+            assert set(incremental.reachable(u)) == expected[u]
+            assert set(built.reaching(u)) == set([x for x in range(100) if u in expected[x]])
+
+        removed = set(list(edges)[10:])
+        built.set_edges(removed)
+        assert all([set(built.reachable(u)) == reachable(removed, u) for u in range(100)])
+
+    def test_subclasses_and_importing_modules(self):
+        graph = create_graph(COMPACT_BACKEND)
+        base = ProgramNode(NodeType.CLASS, 'base.py', 'Base')
+        child = ProgramNode(NodeType.CLASS, 'child.py', 'Child')
+        grandchild = ProgramNode(NodeType.CLASS, 'grandchild.py', 'GrandChild')
+        base_module = ProgramNode(NodeType.MODULE, 'base.py', 'base.py')
+        child_module = ProgramNode(NodeType.MODULE, 'child.py', 'child.py')
+        grandchild_module = ProgramNode(NodeType.MODULE, 'grandchild.py', 'grandchild.py')
+        for c, m in [(base, base_module), (child, child_module), (grandchild, grandchild_module)]:
+            graph.add_edge(c, m)
+        graph.add_edge(child_module, base_module)
+        graph.add_edge(grandchild_module, child_module)
+
+        child_base = ProgramNode(NodeType.BASE_CLASS, 'child.py', 'Base')
+        imported = ProgramNode(NodeType.IMPORTED_DEPENDENCY, 'child.py', 'base')
+        graph.add_edge(child, child_base)
+        graph.add_edge(child_base, imported)
+        graph.add_edge(imported, base_module)
+        graph.add_edge(grandchild, ProgramNode(NodeType.BASE_CLASS, 'grandchild.py', 'Child'))
+
+        subclasses = retrieve_transitive_subclasses(graph, 'Base', GraphType.Program)
+        assert sorted([c.id_value for c in subclasses]) == ['Child', 'GrandChild']
+        assert graph_reachability(graph).is_subclass(grandchild, base)
+        assert not graph_reachability(graph).is_subclass(base, grandchild)
+        importing = retrieve_importing_modules(graph, ['base.py'], GraphType.Program)
+        assert sorted([m.source_file for m in importing]) == ['child.py', 'grandchild.py']
+
+        other_module = ProgramNode(NodeType.MODULE, 'other.py', 'other.py')
+        graph.add_edge(other_module, grandchild_module)
+        importing = retrieve_importing_modules(graph, ['base.py'], GraphType.Program)
+        assert sorted([m.source_file for m in importing]) == ['child.py', 'grandchild.py', 'other.py']
+
+    def test_swapped_edge(self):
+        graph = create_graph(NETWORKX_BACKEND)
+        base = ProgramNode(NodeType.CLASS, 'module.py', 'Base')
+        other = ProgramNode(NodeType.CLASS, 'module.py', 'Other')
+        child = ProgramNode(NodeType.CLASS, 'module.py', 'Child')
+        base_of_child = ProgramNode(NodeType.BASE_CLASS, 'module.py', 'Base')
+        other_of_child = ProgramNode(NodeType.BASE_CLASS, 'module.py', 'Other')
+        for c in [base, other, child]:
+            graph.add_node(c)
+        graph.add_edge(child, base_of_child)
+        assert graph_reachability(graph).is_subclass(child, 'Base')
+
+        num_nodes, num_edges = graph.number_of_nodes(), graph.number_of_edges()
+        graph.remove_edge(child, base_of_child)
+        graph.remove_node(base_of_child)
+        graph.add_edge(child, other_of_child)
+        assert (graph.number_of_nodes(), graph.number_of_edges()) == (num_nodes, num_edges)
+        invalidate_graph_reachability(graph)
+        assert not graph_reachability(graph).is_subclass(child, 'Base')
+        assert graph_reachability(graph).is_subclass(child, 'Other')
+        assert [c.id_value for c in graph_reachability(graph).subclasses('Other')] == ['Child']
+
+        graph.remove_node(child)
+        assert len(graph_reachability(graph).subclasses('Other')) == 0
+
+    def test_unchanged_graph_not_read(self):
+        graph = create_graph(NETWORKX_BACKEND)
+        base = ProgramNode(NodeType.CLASS, 'module.py', 'Base')
+        child = ProgramNode(NodeType.CLASS, 'module.py', 'Child')
+        graph.add_edge(child, ProgramNode(NodeType.BASE_CLASS, 'module.py', 'Base'))
+        graph.add_node(base)
+        reachability = graph_reachability(graph)
+        classes = reachability._classes
+        assert graph_reachability(graph)._classes is classes
+        graph.add_node(ProgramNode(NodeType.CLASS, 'module.py', 'Other'))
+        assert graph_reachability(graph)._classes is not classes
+        assert len(graph_reachability(graph).subclasses('Base')) == 1
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+
+from python_di.reflect_scanner.graph_scanner import retrieve_classes_decorated_by, retrieve_decorated_by_ids
+from python_di.reflect_scanner.graph_store import CompactDiGraph, create_graph, COMPACT_BACKEND
+from python_di.reflect_scanner.module_graph_models import FileNode, NodeType, DecoratorFileNode, GraphType
+
+
+class GraphStoreTest(unittest.TestCase):
+
+    def test_compact_graph(self):
+        graph = create_graph(COMPACT_BACKEND)
+        assert isinstance(graph, CompactDiGraph)
+
+        module = FileNode(NodeType.MODULE, 'module.py')
+        class_node = FileNode(NodeType.CLASS, 'Component')
+        decorator = DecoratorFileNode('Component', 'component', NodeType.CLASS)
+        graph.add_node(module)
+        graph.add_edge(module, class_node)
+        graph.add_edge(class_node, decorator)
+        graph.add_edge(class_node, decorator)
+
+        assert graph.number_of_nodes() == 3
+        assert graph.number_of_edges() == 2
+        assert FileNode(NodeType.CLASS, 'Component') in graph.nodes
+        assert graph.out_edges(class_node) == [(class_node, decorator)]
+        assert graph.in_edges(class_node) == [(module, class_node)]
+        assert graph.out_edges(FileNode(NodeType.CLASS, 'Missing')) == []
+        assert graph.nodes_of_type(NodeType.CLASS) == [class_node]
+
+        assert retrieve_classes_decorated_by(graph, 'component', GraphType.File) == [class_node]
+
+        exported = graph.to_networkx()
+        assert exported.number_of_edges() == 2
+        assert exported.has_edge(class_node, decorator)
+
+    def test_retrieve_decorated_by_ids(self):
+        graph = create_graph(COMPACT_BACKEND)
+        module = FileNode(NodeType.MODULE, 'module.py')
+        class_node = FileNode(NodeType.CLASS, 'Component')
+        fn_node = FileNode(NodeType.FUNCTION, 'configure')
+        graph.add_edge(module, class_node)
+        graph.add_edge(module, fn_node)
+        graph.add_edge(class_node, DecoratorFileNode('Component', 'component', NodeType.CLASS))
+        graph.add_edge(fn_node, DecoratorFileNode('configure', 'configuration', NodeType.FUNCTION))
+
+        decorated = retrieve_decorated_by_ids(graph, ['component', 'configuration', 'injectable'], GraphType.File)
+        assert decorated == {'component': [class_node], 'configuration': [fn_node], 'injectable': []}
+
+    def test_unknown_backend(self):
+        self.assertRaises(ValueError, lambda: create_graph('other'))
+
+
+if __name__ == '__main__':
+    unittest.main()
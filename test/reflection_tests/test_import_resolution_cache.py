@@ -0,0 +1,63 @@
+import os
+import tempfile
+import time
+import unittest
+
+from python_di.reflection.import_resolution_cache import ImportResolutionCache, CachedImportError, module_dirs
+
+
+class ImportResolutionCacheTest(unittest.TestCase):
+
+    def test_resolution_invalidated_by_directory(self):
+        with tempfile.TemporaryDirectory() as source:
+            calls = []
+
+            def resolve():
+                calls.append(1)
+                module_path = os.path.join(source, 'module.py')
+                return module_path if os.path.exists(module_path) else 'module'
+
+            cache = ImportResolutionCache()
+            key = ('python', 'module', source)
+            assert cache.resolve(key, resolve, lambda r: module_dirs(source, 'module')) == 'module'
+            assert cache.resolve(key, resolve, lambda r: module_dirs(source, 'module')) == 'module'
+            assert len(calls) == 1
+            assert cache.hits == 1
+
+            time.sleep(0.01)
+            with open(os.path.join(source, 'module.py'), 'w') as f:
+                f.write('\n')
+            cache.refresh()
+            assert cache.resolve(key, resolve, lambda r: module_dirs(source, 'module')) \
+                   == os.path.join(source, 'module.py')
+            assert len(calls) == 2
+
+            with tempfile.TemporaryDirectory() as cache_dir:
+                cache_path = os.path.join(cache_dir, 'cache.json')
+                cache.write(cache_path)
+                loaded = ImportResolutionCache()
+                loaded.load(cache_path)
+                assert loaded.resolve(key, resolve, lambda r: []) == os.path.join(source, 'module.py')
+                assert len(calls) == 2
+
+    def test_import_error_cached(self):
+        with tempfile.TemporaryDirectory() as source:
+            def resolve():
+                raise ModuleNotFoundError('missing')
+
+            cache = ImportResolutionCache()
+            self.assertRaises(ModuleNotFoundError, lambda: cache.resolve(('missing',), resolve, lambda r: [source]))
+            self.assertRaises(CachedImportError, lambda: cache.resolve(('missing',), resolve, lambda r: [source]))
+
+            with tempfile.TemporaryDirectory() as cache_dir:
+                cache_path = os.path.join(cache_dir, 'cache.json')
+                cache.write(cache_path)
+                loaded = ImportResolutionCache()
+                loaded.load(cache_path)
+                assert len(loaded) == 0
+                self.assertRaises(ModuleNotFoundError, lambda: loaded.resolve(('missing',), resolve,
+                                                                              lambda r: [source]))
+
+
+if __name__ == '__main__':
+    unittest.main()
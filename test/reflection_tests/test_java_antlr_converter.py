@@ -0,0 +1,67 @@
+import ast
+import os
+import tempfile
+import unittest
+
+from python_di.reflect_scanner.antlr_adapter.ast_to_antlr import JavaAntlrToAstConverter, AntlrParseMetrics
+from python_di.reflect_scanner.antlr_adapter.java_ast_cache import JavaAstCache
+
+JAVA_SOURCE = """
+package com.example;
+
+import java.util.List;
+
+@Component
+public class Component extends Base implements Runnable {
+    @Override
+    public void run(List<String> values) {
+    }
+}
+"""
+
+
+class JavaAntlrConverterTest(unittest.TestCase):
+
+    def test_two_stage_parse(self):
+        with tempfile.TemporaryDirectory() as source:
+            java_file = os.path.join(source, 'Component.java')
+            with open(java_file, 'w') as f:
+                f.write(JAVA_SOURCE)
+
+            metrics = AntlrParseMetrics()
+            converter = JavaAntlrToAstConverter(metrics, cache=None)
+            for _ in range(2):
+                converted = converter.convert(java_file)
+                assert len(converted) == 1
+                assert isinstance(converted[0], ast.ClassDef)
+                assert converted[0].name == 'Component'
+                assert converted[0].body[0].name == 'run'
+                assert converted[0].decorator_list[0].func.id == 'Component'
+
+            assert metrics.sll_parses == 2
+            assert metrics.ll_parses == 0
+
+            with open(java_file, 'w') as f:
+                f.write('public class Broken {')
+            converter.convert(java_file)
+            assert metrics.sll_parses == 3
+            assert metrics.ll_parses == 1
+
+    def test_cached_parse(self):
+        with tempfile.TemporaryDirectory() as source, tempfile.TemporaryDirectory() as cache_dir:
+            java_file = os.path.join(source, 'Component.java')
+            with open(java_file, 'w') as f:
+                f.write(JAVA_SOURCE)
+
+            metrics = AntlrParseMetrics()
+            converted = JavaAntlrToAstConverter(metrics, JavaAstCache(cache_dir)).convert(java_file)
+            assert len(converted) == 1
+            assert [b.id for b in converted[0].bases] == ['Base', 'Runnable']
+            from_cache = JavaAntlrToAstConverter(metrics, JavaAstCache(cache_dir)).convert(java_file)
+            assert metrics.sll_parses == 1
+            assert len(from_cache) == 1
+            assert ast.dump(converted[0]) == ast.dump(from_cache[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import os
+import tempfile
+import unittest
+
+from python_di.reflect_scanner.antlr_adapter.java_ast_cache import JavaAstCache, JavaFileSummary
+
+
+class JavaAstCacheTest(unittest.TestCase):
+
+    def test_cache_by_content(self):
+        with tempfile.TemporaryDirectory() as source, tempfile.TemporaryDirectory() as cache_dir:
+            java_file = os.path.join(source, 'Component.java')
+            with open(java_file, 'w') as f:
+                f.write('package com.example;\n')
+
+            parsed = []
+
+            def parse(contents, file_path):
+                parsed.append(file_path)
+                return JavaFileSummary('com.example', [('java.util.List', 'List')],
+                                       [('Component', ['Base'], ['Component'],
+                                         [('run', ['values'], 'void', ['Override'])])])
+
+            cache = JavaAstCache(cache_dir)
+            summary = cache.retrieve(java_file, parse)
+            assert cache.retrieve(java_file, parse).package == 'com.example'
+            assert len(parsed) == 1
+
+            loaded = JavaAstCache(cache_dir).retrieve(java_file, parse)
+            assert len(parsed) == 1
+            assert loaded.to_serializable() == summary.to_serializable()
+            class_def = loaded.to_ast()[0]
+            assert class_def.name == 'Component'
+            assert class_def.decorator_list[0].func.id == 'Component'
+            assert class_def.body[0].args.args[0].arg == 'values'
+            assert loaded.import_nodes()[0].module == 'java.util.List'
+
+            with open(java_file, 'w') as f:
+                f.write('package com.other;\n')
+            cache.retrieve(java_file, parse)
+            assert len(parsed) == 2
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import os
+import tempfile
+import time
+import unittest
+
+from python_di.reflect_scanner.import_resolver.java_package_index import JavaPackageIndex, read_package, project_root
+from python_di.reflect_scanner.import_resolver.language_import_resolver import ImportResolverFactory
+from python_di.reflect_scanner.program_parser import ListBasedSourceFileProvider, ProgramParser
+from python_di.reflect_scanner.scanner_properties import ScannerProperties
+
+
+def write_java(path: str, package: str):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(f'/*\n * License\n */\npackage {package};\n\nimport java.util.List;\n\npublic class '
+                f'{os.path.splitext(os.path.basename(path))[0]} {{}}\n')
+
+
+class JavaPackageIndexTest(unittest.TestCase):
+
+    def test_index_and_refresh(self):
+        with tempfile.TemporaryDirectory() as root:
+            component = os.path.join(root, 'com', 'example', 'Component.java')
+            write_java(component, 'com.example')
+            write_java(os.path.join(root, 'com', 'example', 'sub', 'Other.java'), 'com.example.sub')
+            assert read_package(component) == 'com.example'
+            assert project_root(component, 'com.example') == root
+
+            index = JavaPackageIndex(root, max_workers=2)
+            assert index.find_class('com.example', 'Component') == component
+            assert index.package_files('com.example.sub') == [os.path.join(root, 'com', 'example', 'sub',
+                                                                           'Other.java')]
+            assert index.package_of(component) == (True, 'com.example')
+            assert not index.has_package('com.missing')
+
+            time.sleep(0.01)
+            added = os.path.join(root, 'com', 'example', 'Added.java')
+            write_java(added, 'com.example')
+            write_java(component, 'com.moved')
+            os.remove(os.path.join(root, 'com', 'example', 'sub', 'Other.java'))
+            index.refresh()
+            assert index.find_class('com.example', 'Added') == added
+            assert index.find_class('com.example', 'Component') is None
+            assert index.find_class('com.moved', 'Component') == component
+            assert not index.has_package('com.example.sub')
+
+    def test_parse_refreshes_resolver(self):
+        with tempfile.TemporaryDirectory() as root:
+            component = os.path.join(root, 'com', 'example', 'Component.java')
+            write_java(component, 'com.example')
+            index = ImportResolverFactory.get_resolver(component).package_index(component)
+            assert index.find_class('com.example', 'Component') == component
+
+            time.sleep(0.01)
+            added = os.path.join(root, 'com', 'example', 'Added.java')
+            write_java(added, 'com.example')
+            assert index.find_class('com.example', 'Added') is None
+            ProgramParser([], ListBasedSourceFileProvider([]), [], [],
+                          ScannerProperties(src_file=component, num_up=0)).do_parse()
+            assert index.find_class('com.example', 'Added') == added
+
+
+if __name__ == '__main__':
+    unittest.main()
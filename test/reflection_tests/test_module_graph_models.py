@@ -0,0 +1,29 @@
+import unittest
+
+from python_di.reflect_scanner.module_graph_models import ProgramNode, NodeType, ClassFunctionProgramNode, \
+    ImportFrom, Statement, StatementType, Language
+
+
+class ModuleGraphModelsTest(unittest.TestCase):
+
+    def test_nodes_slotted_and_interned(self):
+        source_file = ''.join(['/src/', 'module.py'])
+        node = ProgramNode(NodeType.CLASS, source_file, 'ClassId')
+        other = ClassFunctionProgramNode('ClassId', ''.join(['/src/', 'module.py']), 'fn')
+        assert not hasattr(node, '__dict__')
+        assert not hasattr(other, '__dict__')
+        assert node.source_file is other.source_file
+
+        assert hash(node) == hash(ProgramNode(NodeType.CLASS, source_file, 'ClassId'))
+        assert hash(node) == node._hash
+
+        import_from = ImportFrom(['name'], [], 'module', 0)
+        import_from.language = Language.PYTHON
+        self.assertRaises(AttributeError, lambda: setattr(import_from, 'other', None))
+
+        statement = Statement(StatementType.Name, 'name', 1, [], ids=['name'])
+        assert not hasattr(statement, '__dict__')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+import os
+import tempfile
+import unittest
+
+from python_di.reflection.module_name_index import ModuleNameIndex
+
+
+class ModuleNameIndexTest(unittest.TestCase):
+
+    def test_module_name_from_package_layout(self):
+        with tempfile.TemporaryDirectory() as root:
+            package = os.path.join(root, 'src', 'package', 'sub')
+            os.makedirs(package)
+            for init_dir in [os.path.join(root, 'src', 'package'), package]:
+                with open(os.path.join(init_dir, '__init__.py'), 'w') as f:
+                    f.write('\n')
+            module_file = os.path.join(package, 'module.py')
+            with open(module_file, 'w') as f:
+                f.write('\n')
+
+            index = ModuleNameIndex([root, package, os.path.join(root, 'src')])
+            assert index.roots_of(module_file) == [root, os.path.join(root, 'src'), package]
+            assert index.module_name(module_file) == 'package.sub.module'
+            assert index.module_name(os.path.join(package, '__init__.py')) == 'package.sub'
+
+            assert ModuleNameIndex([root]).module_name(module_file) == 'src.package.sub.module'
+            assert ModuleNameIndex([package]).module_name(module_file) == 'module'
+            assert ModuleNameIndex([os.path.join(root, 'other')]).module_name(module_file) is None
+
+
+if __name__ == '__main__':
+    unittest.main()
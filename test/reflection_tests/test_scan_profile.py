@@ -0,0 +1,50 @@
+import ast
+import unittest
+
+from python_di.reflect_scanner.file_parser import FileParser
+from python_di.reflect_scanner.function_parser import FunctionDefParser
+from python_di.reflect_scanner.module_graph_models import NodeType, FileNode
+from python_di.reflect_scanner.scan_profile import ScanProfile
+
+
+class RecordingParser:
+    def __init__(self):
+        self.parsed = []
+
+    def parse_args(self, fn_node, graph, node):
+        self.parsed.append(node.name)
+
+    def parse_stmts(self, fn_node, graph, node, source_file=None):
+        self.parsed.append(node.name)
+
+
+class ScanProfileTest(unittest.TestCase):
+
+    def test_includes(self):
+        assert ScanProfile.FULL.includes(ScanProfile.SIGNATURES)
+        assert ScanProfile.SIGNATURES.includes(ScanProfile.COMPONENT_SCAN)
+        assert not ScanProfile.COMPONENT_SCAN.includes(ScanProfile.SIGNATURES)
+        assert ScanProfile.from_name('component-scan') == ScanProfile.COMPONENT_SCAN
+        self.assertRaises(ValueError, lambda: ScanProfile.from_name('other'))
+
+    def test_function_parse_depth(self):
+        tree = ast.parse('@component()\ndef fn(a: int):\n    return a\n')
+        for profile, num_args, num_stmts in [(ScanProfile.COMPONENT_SCAN, 0, 0),
+                                             (ScanProfile.SIGNATURES, 1, 0),
+                                             (ScanProfile.FULL, 1, 1)]:
+            args_parser = RecordingParser()
+            stmts_parser = RecordingParser()
+            file_parser = FileParser([FunctionDefParser(args_parser, stmts_parser)])
+            file_parser.set_scan_profile(profile)
+            module = FileNode(NodeType.MODULE, 'module.py')
+            file_parser.graph.add_node(module)
+            for node in ast.iter_child_nodes(tree):
+                file_parser.visit_node(node, 'module.py', module)
+
+            assert FileNode(NodeType.FUNCTION, 'fn') in file_parser.graph.nodes
+            assert len(args_parser.parsed) == num_args
+            assert len(stmts_parser.parsed) == num_stmts
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import ast
+import os
+import tempfile
+import unittest
+
+from python_di.reflect_scanner.source_code_extracter import SourceLineIndex, SourceLineIndexCache, extract_source, \
+    extract_sources, source_line_index
+
+SOURCE = '''import os
+
+
+class Café:
+    """é"""
+
+    def fn(self, a: int) -> str:
+        return "é" + str(a)
+'''
+
+
+class SourceCodeExtracterTest(unittest.TestCase):
+
+    def test_extract_sources(self):
+        parsed = ast.parse(SOURCE)
+        class_def = parsed.body[1]
+        fn_def = class_def.body[1]
+        assert extract_source(fn_def.body[0].value, SOURCE) == '"é" + str(a)'
+        assert extract_source(fn_def.args.args[1], SOURCE) == 'a: int'
+        assert extract_sources([class_def, fn_def], SOURCE) == [ast.get_source_segment(SOURCE, class_def),
+                                                               ast.get_source_segment(SOURCE, fn_def)]
+
+    def test_file_index(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source_file = os.path.join(directory, 'source.py')
+            with open(source_file, 'w', encoding='utf-8') as f:
+                f.write(SOURCE)
+            index = source_line_index(source_file)
+            assert index is source_line_index(source_file)
+            assert index.extract(4, 0, 4, 12) == 'class Café:'
+            assert index.extract(1, 7) == 'os'
+            assert index.line_of(index.offset(8, 8)) == 8
+            assert ''.join(index.lines()) == SOURCE
+            assert SourceLineIndex.from_source('').extract(1, 0) == ''
+
+    def test_file_indexes_bounded(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source_files = []
+            for i in range(3):
+                source_file = os.path.join(directory, f'source_{i}.py')
+                with open(source_file, 'w', encoding='utf-8') as f:
+                    f.write(SOURCE * (SourceLineIndex.mmap_threshold // len(SOURCE) + 1))
+                source_files.append(source_file)
+            cache = SourceLineIndexCache(maxsize=2)
+            indexes = [cache.retrieve(source_file) for source_file in source_files]
+            assert len(cache) == 2
+            assert indexes[0].contents.closed
+            assert not indexes[2].contents.closed
+            assert indexes[2].extract(4, 0, 4, 12) == 'class Café:'
+            cache.clear()
+            assert indexes[2].contents.closed
+            assert isinstance(SourceLineIndex.from_file(__file__).contents, bytes)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import os
+import tempfile
+import unittest
+
+from python_di.reflect_scanner.source_discovery import SourceDiscoveryFilter, discover_files
+
+
+def touch(*path):
+    os.makedirs(os.path.dirname(os.path.join(*path)), exist_ok=True)
+    with open(os.path.join(*path), 'w') as f:
+        f.write('\n')
+
+
+class SourceDiscoveryTest(unittest.TestCase):
+
+    def test_discover_with_exclusions(self):
+        with tempfile.TemporaryDirectory() as root:
+            touch(root, 'package', 'module.py')
+            touch(root, 'package', 'notes.txt')
+            touch(root, 'package', 'generated', 'generated.py')
+            touch(root, 'package', 'fixtures', 'fixture.py')
+            touch(root, '.venv', 'lib', 'site.py')
+            touch(root, '__pycache__', 'cached.py')
+            with open(os.path.join(root, '.gitignore'), 'w') as f:
+                f.write('# generated sources\ngenerated/\n*.txt\n')
+            os.symlink(root, os.path.join(root, 'package', 'loop'))
+
+            expected = {os.path.join(root, 'package', 'module.py'),
+                        os.path.join(root, 'package', 'fixtures', 'fixture.py')}
+            assert set(discover_files([root], SourceDiscoveryFilter())) == expected
+            assert set(discover_files([root], SourceDiscoveryFilter(follow_symlinks=True))) == expected
+            assert set(discover_files([root], SourceDiscoveryFilter(parallel=True, max_workers=2))) == expected
+
+            excluded = SourceDiscoveryFilter().extend(exclude=['fixtures'])
+            assert set(discover_files([root], excluded)) == {os.path.join(root, 'package', 'module.py')}
+
+            no_gitignore = set(discover_files([root], SourceDiscoveryFilter(include=['*.py', '*.txt'],
+                                                                            gitignore=False)))
+            assert os.path.join(root, 'package', 'notes.txt') in no_gitignore
+            assert os.path.join(root, 'package', 'generated', 'generated.py') in no_gitignore
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,10 @@
 import ast
+import os
+import tempfile
 import unittest
 
 from python_di.reflect_scanner.ast_utils import parse_ast_into_file
-from python_di.reflect_scanner.statements_parser import AggregateStatementParser
+from python_di.reflect_scanner.statements_parser import AggregateStatementParser, statement_span_cache
 
 
 class StatementParserTest(unittest.TestCase):
@@ -17,3 +19,38 @@ class StatementParserTest(unittest.TestCase):
             if isinstance(child, ast.stmt):
                 assert agg.parse_statement_node(child, 'hello')
 
+    def test_span_statement_node(self):
+        from python_di.inject.context_builder.injection_context import InjectionContext
+        inject_ctx = InjectionContext()
+        ctx = inject_ctx.initialize_env()
+        agg = ctx.get_interface(AggregateStatementParser)
+        parsed = parse_ast_into_file(__file__)
+        test_class = [c for c in parsed.body if isinstance(c, ast.ClassDef)][0]
+        for fn in test_class.body:
+            eager = agg.parse_statement_node(fn.body, fn.name)
+            lazy = agg.span_statement_node(fn.body, fn.name, __file__)
+            assert lazy.span == (fn.body[0].lineno, fn.body[0].col_offset, fn.body[-1].end_lineno,
+                                 fn.body[-1].end_col_offset)
+            assert [(s.statement_type, s.lin_no) for s in lazy.statements] \
+                   == [(s.statement_type, s.lin_no) for s in eager.statements]
+            assert lazy.statements is lazy.statements
+        statement_span_cache.clear()
+
+    def test_span_of_modified_file(self):
+        from python_di.inject.context_builder.injection_context import InjectionContext
+        inject_ctx = InjectionContext()
+        ctx = inject_ctx.initialize_env()
+        agg = ctx.get_interface(AggregateStatementParser)
+        with tempfile.TemporaryDirectory() as directory:
+            source_file = os.path.join(directory, 'source.py')
+            with open(source_file, 'w') as f:
+                f.write('def fn(a):\n    b = a + 1\n    return b\n')
+            fn = parse_ast_into_file(source_file).body[0]
+            lazy = agg.span_statement_node(fn.body, fn.name, source_file)
+            assert len(lazy.statements) == 2
+
+            with open(source_file, 'w') as f:
+                f.write('import os\n\n\ndef fn(a):\n    return a\n')
+            os.utime(source_file, ns=(lazy.source_mtime + 1_000_000_000, lazy.source_mtime + 1_000_000_000))
+            self.assertRaises(ValueError, lambda: lazy.statements)
+        statement_span_cache.clear()
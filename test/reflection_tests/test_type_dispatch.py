@@ -0,0 +1,36 @@
+import ast
+import unittest
+
+from python_di.reflect_scanner.type_dispatch import TypeDispatchTable
+
+
+class TypeDispatchTest(unittest.TestCase):
+
+    def test_dispatch_by_node_type(self):
+        calls = []
+
+        def matches(handler, node):
+            calls.append(handler)
+            return isinstance(node, handler)
+
+        table = TypeDispatchTable([ast.stmt, ast.Assign, ast.expr], matches)
+        calls.clear()
+
+        assign = ast.parse('a = 1').body[0]
+        assert table.retrieve(assign) == [ast.stmt, ast.Assign]
+        assert table.first(assign) == ast.stmt
+        assert table.first(assign.value) == ast.expr
+        assert table.first(ast.parse('a').body[0].value.ctx) is None
+        assert len(calls) == 0
+
+        class Other:
+            pass
+
+        assert table.first(Other()) is None
+        assert len(calls) == 3
+        assert table.first(Other()) is None
+        assert len(calls) == 3
+
+
+if __name__ == '__main__':
+    unittest.main()
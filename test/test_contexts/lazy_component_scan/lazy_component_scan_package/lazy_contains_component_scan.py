@@ -0,0 +1,10 @@
+from python_di.configs.component_scan import component_scan
+from test_contexts.lazy_component_scan.lazy_component_scan_referenced_package.lazy_component_referenced import \
+    LazyDependentComponent
+
+
+@component_scan(
+    base_classes=[LazyDependentComponent],
+)
+class LazyContainsComponentScan:
+    pass
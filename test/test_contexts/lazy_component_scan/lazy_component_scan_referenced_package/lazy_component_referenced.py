@@ -0,0 +1,30 @@
+import injector
+
+from python_di.configs.bean import bean, lazy
+from python_di.configs.component import component
+from python_di.configs.di_configuration import configuration
+from python_di.inject.lazy_proxy import Lazy
+
+
+class ExpensiveLazyBean:
+    created = 0
+
+    def __init__(self):
+        ExpensiveLazyBean.created += 1
+        self.value = 'expensive'
+
+
+@configuration()
+class LazyBeanConfiguration:
+
+    @lazy
+    @bean()
+    def expensive_lazy_bean(self) -> ExpensiveLazyBean:
+        return ExpensiveLazyBean()
+
+
+@component()
+class LazyDependentComponent:
+    @injector.inject
+    def __init__(self, expensive: Lazy[ExpensiveLazyBean]):
+        self.expensive = expensive
@@ -0,0 +1,10 @@
+from python_di.configs.component_scan import component_scan
+from test_contexts.prewarm_component_scan.prewarm_component_scan_referenced_package.prewarm_component_referenced import \
+    PrewarmSingletonComponent
+
+
+@component_scan(
+    base_classes=[PrewarmSingletonComponent],
+)
+class PrewarmContainsComponentScan:
+    pass
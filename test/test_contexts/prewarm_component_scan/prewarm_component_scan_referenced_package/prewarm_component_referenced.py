@@ -0,0 +1,35 @@
+import os
+
+from python_di.configs.bean import bean
+from python_di.configs.component import component
+from python_di.configs.di_configuration import configuration
+from python_di.configs.fork import after_fork
+from python_di.inject.profile_composite_injector.composite_injector import profile_scope
+
+
+class PrewarmProfileBean:
+    created = 0
+
+    def __init__(self):
+        PrewarmProfileBean.created += 1
+        self.pid = os.getpid()
+
+    @after_fork
+    def recreate(self):
+        self.pid = os.getpid()
+
+
+@configuration()
+class PrewarmConfiguration:
+
+    @bean(scope=profile_scope)
+    def prewarm_profile_bean(self) -> PrewarmProfileBean:
+        return PrewarmProfileBean()
+
+
+@component()
+class PrewarmSingletonComponent:
+    created = 0
+
+    def __init__(self):
+        PrewarmSingletonComponent.created += 1